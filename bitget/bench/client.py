@@ -0,0 +1,248 @@
+"""Offline client benchmark: endpoint calls against an in-process mock of the Bitget API.
+
+Each scenario serves a fixed payload (ticker list, orderbook, candles, fills, positions, tax records)
+through an `httpx.MockTransport`, so results measure the client itself (request building, signing,
+rate limiting, parsing, validation), not the network. Payloads are generated deterministically to
+match the endpoints' schemas; pass `--payloads DIR` to serve recorded responses instead
+(`DIR/<scenario>.json`, the raw response body).
+
+Per scenario, with validation on and off: requests/second, CPU time per call, p50/p99 latency,
+and peak memory allocated during a call (a separate run, under `tracemalloc`). Candles are always
+parsed into rows, so their "raw" run measures `candles_columnar` (requires `numpy`).
+
+Usage: python bench/client.py [scenario ...] [--calls N] [--payloads DIR] [--json OUT] [--compare BASELINE]
+
+Save a run with `--json`, then `--compare` it against another commit.
+"""
+from typing import Any, Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import subprocess
+import time
+import tracemalloc
+
+import httpx
+import orjson
+
+from bitget import Bitget
+from bitget.core import RateLimiter, Bucket
+
+T0 = 1_700_000_000_000 # ms
+
+def envelope(data: Any) -> bytes:
+  return orjson.dumps({'code': '00000', 'msg': 'success', 'requestTime': T0, 'data': data})
+
+def num(rng: random.Random, lo: float, hi: float, digits: int = 4) -> str:
+  return f'{rng.uniform(lo, hi):.{digits}f}'
+
+def tickers(rng: random.Random, n: int = 800) -> list[dict]:
+  return [{
+    'symbol': f'C{i}USDT', 'high24h': num(rng, 1, 2), 'open': num(rng, 1, 2), 'lastPr': num(rng, 1, 2),
+    'low24h': num(rng, 1, 2), 'quoteVolume': num(rng, 1e5, 1e7, 2), 'baseVolume': num(rng, 1e5, 1e7, 2),
+    'usdtVolume': num(rng, 1e5, 1e7, 2), 'bidPr': num(rng, 1, 2), 'askPr': num(rng, 1, 2),
+    'bidSz': num(rng, 0, 100), 'askSz': num(rng, 0, 100), 'openUtc': num(rng, 1, 2),
+    'ts': str(T0 + i), 'changeUtc24h': num(rng, -0.1, 0.1), 'change24h': num(rng, -0.1, 0.1),
+  } for i in range(n)]
+
+def orderbook(rng: random.Random, depth: int = 150) -> dict:
+  return {
+    'asks': [[f'{30000 + i * 0.1:.1f}', num(rng, 0, 5)] for i in range(depth)],
+    'bids': [[f'{29999.9 - i * 0.1:.1f}', num(rng, 0, 5)] for i in range(depth)],
+    'ts': str(T0),
+  }
+
+def candles(rng: random.Random, n: int = 1000) -> list[list[str]]:
+  return [
+    [str(T0 + i * 60_000), num(rng, 1, 2), num(rng, 1, 2), num(rng, 1, 2), num(rng, 1, 2),
+     num(rng, 0, 1e4, 2), num(rng, 0, 1e4, 2), num(rng, 0, 1e4, 2)]
+    for i in range(n)
+  ]
+
+def fills(rng: random.Random, n: int = 100) -> list[dict]:
+  return [{
+    'userId': '1', 'symbol': 'BTCUSDT', 'orderId': str(10**15 + i), 'tradeId': str(2 * 10**15 + i),
+    'orderType': 'limit', 'side': rng.choice(['buy', 'sell']), 'priceAvg': num(rng, 29000, 31000, 2),
+    'size': num(rng, 0, 1), 'amount': num(rng, 0, 3e4, 2), 'cTime': str(T0 - i), 'uTime': str(T0 - i),
+    'tradeScope': rng.choice(['maker', 'taker']),
+    'feeDetail': {'deduction': 'no', 'feeCoin': 'USDT', 'totalDeductionFee': '', 'totalFee': num(rng, -1, 0)},
+  } for i in range(n)]
+
+def positions(rng: random.Random, n: int = 50) -> list[dict]:
+  return [{
+    'symbol': f'C{i}USDT', 'marginCoin': 'USDT', 'holdSide': rng.choice(['long', 'short']),
+    'openDelegateSize': '0', 'marginSize': num(rng, 10, 1000), 'available': num(rng, 0, 10),
+    'locked': '0', 'total': num(rng, 0, 10), 'leverage': '10', 'achievedProfits': num(rng, -10, 10),
+    'openPriceAvg': num(rng, 1, 2), 'marginMode': 'crossed', 'posMode': 'hedge_mode',
+    'unrealizedPL': num(rng, -10, 10), 'liquidationPrice': num(rng, 0, 1), 'keepMarginRate': '0.004',
+    'markPrice': num(rng, 1, 2), 'marginRatio': num(rng, 0, 0.1), 'breakEvenPrice': num(rng, 1, 2),
+    'totalFee': '', 'takeProfit': '', 'stopLoss': '', 'deductedFee': num(rng, 0, 1),
+    'cTime': str(T0 - i), 'assetMode': 'single', 'uTime': str(T0),
+  } for i in range(n)]
+
+def tax_records(rng: random.Random, n: int = 500) -> list[dict]:
+  return [{
+    'id': str(10**15 - i), 'coin': 'USDT', 'spotTaxType': 'Buy', 'amount': num(rng, -100, 100),
+    'fee': num(rng, -1, 0), 'balance': num(rng, 0, 1e4), 'ts': str(T0 - i), 'bizOrderId': str(10**15 + i),
+  } for i in range(n)]
+
+START = datetime.fromtimestamp(T0 / 1e3 - 86400)
+END = datetime.fromtimestamp(T0 / 1e3)
+
+@dataclass
+class Scenario:
+  path: str
+  payload: Callable[[random.Random], Any]
+  call: Callable[[Bitget, bool], Awaitable[Any]]
+
+SCENARIOS: dict[str, Scenario] = {
+  'tickers': Scenario(
+    '/api/v2/spot/market/tickers', tickers,
+    lambda c, v: c.spot.market.tickers(validate=v),
+  ),
+  'orderbook': Scenario(
+    '/api/v2/spot/market/orderbook', orderbook,
+    lambda c, v: c.spot.market.orderbook('BTCUSDT', limit=150, validate=v),
+  ),
+  'candles': Scenario( # rows are always parsed: the raw path is the columnar one
+    '/api/v2/spot/market/candles', candles,
+    lambda c, v: (
+      c.spot.market.candles('BTCUSDT', '1min', limit=1000) if v
+      else c.spot.market.candles_columnar('BTCUSDT', '1min', limit=1000)
+    ),
+  ),
+  'fills': Scenario(
+    '/api/v2/spot/trade/fills', fills,
+    lambda c, v: c.spot.trade.fills(symbol='BTCUSDT', limit=100, validate=v),
+  ),
+  'all_positions': Scenario(
+    '/api/v2/mix/position/all-position', positions,
+    lambda c, v: c.futures.position.all_positions('USDT-FUTURES', validate=v),
+  ),
+  'tax_records': Scenario(
+    '/api/v2/tax/spot-record', tax_records,
+    lambda c, v: c.common.tax.spot_transaction_records(start=START, end=END, limit=500, validate=v),
+  ),
+}
+
+class Unlimited(RateLimiter):
+  """Rate limits still go through their buckets (as in production), but never wait."""
+  def bucket(self, key: str, *, limit: int, period: float) -> Bucket:
+    return super().bucket(key, limit=1, period=0)
+
+def payloads(directory: Path | None) -> dict[str, bytes]:
+  """Response body per path: recorded (`directory/<scenario>.json`) if present, generated otherwise."""
+  bodies: dict[str, bytes] = {}
+  for name, scenario in SCENARIOS.items():
+    recorded = directory / f'{name}.json' if directory is not None else None
+    if recorded is not None and recorded.exists():
+      bodies[scenario.path] = recorded.read_bytes()
+    else:
+      bodies[scenario.path] = envelope(scenario.payload(random.Random(name)))
+  return bodies
+
+def mock(bodies: dict[str, bytes]) -> httpx.MockTransport:
+  def handler(request: httpx.Request) -> httpx.Response:
+    body = bodies.get(request.url.path)
+    if body is None:
+      return httpx.Response(404, content=b'{"code":"40404","msg":"Request URL NOT FOUND"}')
+    return httpx.Response(200, content=body, headers={'content-type': 'application/json'})
+  return httpx.MockTransport(handler)
+
+async def measure(client: Bitget, scenario: Scenario, validate: bool, calls: int) -> dict[str, float]:
+  for _ in range(max(10, calls // 10)): # warm up: validators, routers, connection
+    await scenario.call(client, validate)
+
+  latencies: list[float] = []
+  cpu = time.process_time()
+  wall = time.perf_counter()
+  for _ in range(calls):
+    t = time.perf_counter()
+    await scenario.call(client, validate)
+    latencies.append(time.perf_counter() - t)
+  wall = time.perf_counter() - wall
+  cpu = time.process_time() - cpu
+
+  samples = max(10, calls // 20)
+  tracemalloc.start()
+  peaks: list[int] = []
+  for _ in range(samples):
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    await scenario.call(client, validate)
+    peaks.append(tracemalloc.get_traced_memory()[1] - base)
+  tracemalloc.stop()
+
+  latencies.sort()
+  return {
+    'rps': calls / wall,
+    'cpu_us': cpu / calls * 1e6,
+    'p50_us': latencies[len(latencies) // 2] * 1e6,
+    'p99_us': latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1e6,
+    'peak_kib': statistics.median(peaks) / 1024,
+  }
+
+def commit() -> str | None:
+  try:
+    return subprocess.run(
+      ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+      cwd=Path(__file__).parent,
+    ).stdout.strip()
+  except (OSError, subprocess.CalledProcessError):
+    return None
+
+async def run(names: list[str], calls: int, bodies: dict[str, bytes]) -> dict[str, dict[str, dict[str, float]]]:
+  results: dict[str, dict[str, dict[str, float]]] = {}
+  client = Bitget.new('key', 'secret', 'passphrase', limiter=Unlimited(), transport=mock(bodies))
+  async with client:
+    for name in names:
+      scenario = SCENARIOS[name]
+      size = len(bodies[scenario.path])
+      for validate in (True, False):
+        mode = 'validate' if validate else 'raw'
+        r = results.setdefault(name, {})[mode] = await measure(client, scenario, validate, calls)
+        print(
+          f'{name:14} {mode:8} {size/1024:7.1f} KiB  {r["rps"]:8.0f} req/s  {r["cpu_us"]:8.1f} us cpu'
+          f'  p50 {r["p50_us"]:8.1f} us  p99 {r["p99_us"]:8.1f} us  peak {r["peak_kib"]:8.1f} KiB'
+        )
+  return results
+
+def compare(results: dict, baseline: dict):
+  print(f'\nvs {baseline.get("commit") or "baseline"} (CPU per call, p99)')
+  for name, modes in results.items():
+    for mode, r in modes.items():
+      if (b := baseline['results'].get(name, {}).get(mode)) is None:
+        continue
+      print(
+        f'{name:14} {mode:8} {b["cpu_us"]:8.1f} -> {r["cpu_us"]:8.1f} us ({r["cpu_us"] / b["cpu_us"] - 1:+7.1%})'
+        f'  {b["p99_us"]:8.1f} -> {r["p99_us"]:8.1f} us ({r["p99_us"] / b["p99_us"] - 1:+7.1%})'
+      )
+
+def main():
+  parser = argparse.ArgumentParser(description='Offline client benchmark: endpoint calls against an in-process mock of the Bitget API.')
+  parser.add_argument('scenarios', nargs='*', metavar='scenario', help=f'{", ".join(SCENARIOS)} (default: all)')
+  parser.add_argument('--calls', type=int, default=1000, help='timed calls per scenario and mode (default: 1000)')
+  parser.add_argument('--payloads', type=Path, help='directory of recorded responses, `<scenario>.json`')
+  parser.add_argument('--json', type=Path, help='write results to this file')
+  parser.add_argument('--compare', type=Path, help='results file (from `--json`) to compare against')
+  args = parser.parse_args()
+
+  names = args.scenarios or list(SCENARIOS)
+  if unknown := [name for name in names if name not in SCENARIOS]:
+    parser.error(f'unknown scenario(s): {", ".join(unknown)}')
+  results = asyncio.run(run(names, args.calls, payloads(args.payloads)))
+  if args.compare is not None:
+    compare(results, json.loads(args.compare.read_text()))
+  if args.json is not None:
+    args.json.write_text(json.dumps({
+      'commit': commit(), 'python': platform.python_version(), 'calls': args.calls, 'results': results,
+    }, indent=2))
+
+if __name__ == '__main__':
+  main()
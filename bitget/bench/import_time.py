@@ -0,0 +1,50 @@
+"""Cold-start benchmark: time to import `bitget` and build a client, in fresh interpreters.
+
+Compares a client that touches one endpoint (lazy routers, validators built on first use)
+against one that walks the whole router tree and compiles every validator (the former eager startup).
+
+Usage: python bench/import_time.py [runs]
+"""
+import statistics
+import subprocess
+import sys
+
+SETUP = "import time; t = time.perf_counter()\nfrom bitget import Bitget\nclient = Bitget.new('key', 'secret', 'passphrase')\n"
+
+SCENARIOS = {
+  'import + Bitget.new()': '',
+  '+ one endpoint (spot.market)': 'client.spot.market.tickers\n',
+  'whole tree + all validators (eager)': '''
+import gc
+from bitget.core import Router, validator
+def walk(router):
+  for cls in type(router).__mro__:
+    if issubclass(cls, Router):
+      for name in cls.__dict__.get('__annotations__', {}):
+        child = getattr(router, name)
+        if isinstance(child, Router):
+          walk(child)
+walk(client)
+for v in [o for o in gc.get_objects() if isinstance(o, validator)]:
+  v.adapter
+''',
+}
+
+REPORT = "print((time.perf_counter() - t) * 1e3, len(sys.modules))"
+
+def run(code: str) -> tuple[float, int]:
+  out = subprocess.run(
+    [sys.executable, '-c', 'import sys\n' + SETUP + code + REPORT],
+    capture_output=True, text=True, check=True,
+  ).stdout.split()
+  return float(out[0]), int(out[1])
+
+def main():
+  runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+  for name, code in SCENARIOS.items():
+    results = [run(code) for _ in range(runs)]
+    ms = statistics.median(r[0] for r in results)
+    print(f'{name:40} {ms:8.1f} ms  {results[0][1]:5} modules')
+
+if __name__ == '__main__':
+  main()
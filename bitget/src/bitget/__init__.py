@@ -1,15 +1,18 @@
+from typing_extensions import TYPE_CHECKING
 from bitget.core import AuthRouter
-from .common import Common
-from .copy import Copy
-from .earn import Earn
-from .futures import Futures
-from .margin import Margin
-from .spot import Spot
+
+if TYPE_CHECKING:
+  from .common import Common
+  from .copy import Copy
+  from .earn import Earn
+  from .futures import Futures
+  from .margin import Margin
+  from .spot import Spot
 
 class Bitget(AuthRouter):
-  common: Common
-  copy: Copy
-  earn: Earn
-  futures: Futures
-  margin: Margin
-  spot: Spot
\ No newline at end of file
+  common: 'Common'
+  copy: 'Copy'
+  earn: 'Earn'
+  futures: 'Futures'
+  margin: 'Margin'
+  spot: 'Spot'
\ No newline at end of file
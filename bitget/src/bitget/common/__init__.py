@@ -1,7 +1,10 @@
+from typing_extensions import TYPE_CHECKING
 from bitget.core import AuthRouter
-from .assets import Assets
-from .tax import Tax
+
+if TYPE_CHECKING:
+  from .assets import Assets
+  from .tax import Tax
 
 class Common(AuthRouter):
-  assets: Assets
-  tax: Tax
\ No newline at end of file
+  assets: 'Assets'
+  tax: 'Tax'
\ No newline at end of file
@@ -29,4 +29,4 @@ class Bot(AuthEndpoint):
     """
     params = {'accountType': account_type}
     r = await self.authed_request('GET', '/api/v2/account/bot-assets', params=params)
-    return self.output(r.text, validate_response, validate=validate)
\ No newline at end of file
+    return self.output(r.content, validate_response, validate=validate)
\ No newline at end of file
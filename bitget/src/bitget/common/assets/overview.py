@@ -22,4 +22,4 @@ class Overview(AuthEndpoint):
     > [Bitget API docs](https://www.bitget.com/api-doc/common/account/All-Account-Balance)
     """
     r = await self.authed_request('GET', '/api/v2/account/all-account-balance')
-    return self.output(r.text, validate_response, validate=validate)
\ No newline at end of file
+    return self.output(r.content, validate_response, validate=validate)
\ No newline at end of file
@@ -1,9 +1,14 @@
-from typing_extensions import AsyncIterable, Literal
+from typing_extensions import AsyncIterable, AsyncIterator, MutableSet, Literal
 from dataclasses import dataclass
 from decimal import Decimal
 from datetime import datetime, timedelta
 
-from bitget.core import AuthEndpoint, validator, TypedDict, timestamp as ts, rate_limit, Timestamp
+from bitget.core import (
+  AuthEndpoint, validator, TypedDict, timestamp as ts, rate_limit, Timestamp,
+  time_windows, page_window, sharded_pages, Window, WindowChunk
+)
+
+MAX_LIMIT = 500
 
 ProductType = Literal['USDT-FUTURES', 'USDC-FUTURES', 'COIN-FUTURES']
 
@@ -55,7 +60,7 @@ class FuturesTransactionRecords(AuthEndpoint):
       params['idLessThan'] = id_less_than
     path = '/api/v2/tax/future-record'
     r = await self.authed_request('GET', path, params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
 
   
   async def futures_transaction_records_paged(
@@ -73,16 +78,56 @@ class FuturesTransactionRecords(AuthEndpoint):
     - `margin_coin`: filter by margin coin, e.g. USDT.
     - `start`, `end`: time range of the data, unbounded.
     - `limit`: number of records to return per request (default: 500, max: 500).
-    - `interval`: time interval between requests (default: 30 days).
+    - `interval`: window size (default: 30 days, the maximum).
     - `validate`: Whether to validate the response against the expected schema (default: True).
 
     > [Bitget API docs](https://www.bitget.com/api-doc/common/tax/Get-Future-Account-Record)
     """
-    last_id: str | None = None
-    while start < end:
-      chunk = await self.futures_transaction_records(start, start+interval, product_type=product_type, margin_coin=margin_coin, limit=limit, validate=validate, id_less_than=last_id)
-      if chunk:
-        last_id = chunk[-1]['id']
+    limit = min(limit, MAX_LIMIT) # a larger one would end each window at its first page
+
+    async def fetch(start: datetime, end: datetime, id_less_than: str | None):
+      return await self.futures_transaction_records(start, end, product_type=product_type, margin_coin=margin_coin, limit=limit, validate=validate, id_less_than=id_less_than)
+
+    for w_start, w_end in time_windows(start, end, interval):
+      async for chunk in page_window(fetch, w_start, w_end, limit=limit):
         yield chunk
-      else:
-        start += interval
+
+  async def futures_transaction_records_sharded(
+    self, start: datetime, end: datetime,
+    *,
+    product_type: ProductType | None = None,
+    margin_coin: str | None = None,
+    limit: int = 500,
+    interval: timedelta = timedelta(days=30),
+    concurrency: int = 4,
+    ordered: bool = True,
+    checkpoint: MutableSet[Window] | None = None,
+    validate: bool | None = None
+  ) -> AsyncIterator[WindowChunk[FuturesTransaction]]:
+    """Futures transaction records over `[start, end)`, fetched as windows of `interval` concurrently (within the rate limit).
+
+    Yields each window's records page by page, as they arrive.
+    
+    - `product_type`: filter by product type, e.g. USDT-FUTURES.
+    - `margin_coin`: filter by margin coin, e.g. USDT.
+    - `start`, `end`: time range of the data, unbounded.
+    - `limit`: number of records to return per request (default: 500, max: 500).
+    - `interval`: window size (default: 30 days, the maximum).
+    - `concurrency`: maximum windows in flight (default: 4).
+    - `ordered`: yield windows in time order (default), or pages of all windows in flight as they arrive.
+    - `checkpoint`: set of finished windows, skipped if present. Pass the same (e.g. reloaded) set to resume an
+      interrupted export: the window being processed when interrupted is fetched again (at-least-once).
+    - `validate`: Whether to validate the response against the expected schema (default: True).
+
+    > [Bitget API docs](https://www.bitget.com/api-doc/common/tax/Get-Future-Account-Record)
+    """
+    limit = min(limit, MAX_LIMIT) # a larger one would end each window at its first page
+
+    async def fetch(start: datetime, end: datetime, id_less_than: str | None):
+      return await self.futures_transaction_records(start, end, product_type=product_type, margin_coin=margin_coin, limit=limit, validate=validate, id_less_than=id_less_than)
+
+    async for chunk in sharded_pages(
+      fetch, start, end, interval=interval, limit=limit,
+      concurrency=concurrency, ordered=ordered, checkpoint=checkpoint,
+    ):
+      yield chunk
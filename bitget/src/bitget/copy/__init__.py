@@ -1,7 +1,10 @@
+from typing_extensions import TYPE_CHECKING
 from bitget.core import AuthRouter
-from .futures import Futures
-from .spot import Spot
+
+if TYPE_CHECKING:
+  from .futures import Futures
+  from .spot import Spot
 
 class Copy(AuthRouter):
-  futures: Futures
-  spot: Spot
\ No newline at end of file
+  futures: 'Futures'
+  spot: 'Spot'
\ No newline at end of file
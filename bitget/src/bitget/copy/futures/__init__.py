@@ -1,5 +1,8 @@
+from typing_extensions import TYPE_CHECKING
 from bitget.core import AuthRouter
-from .follower import Follower
+
+if TYPE_CHECKING:
+  from .follower import Follower
 
 class Futures(AuthRouter):
-  follower: Follower
\ No newline at end of file
+  follower: 'Follower'
\ No newline at end of file
@@ -58,4 +58,4 @@ class MyTraders(AuthEndpoint):
     if page_size is not None:
       params['pageSize'] = page_size
     r = await self.authed_request('GET', '/api/v2/copy/mix-follower/query-traders', params=params)
-    return self.output(r.text, validate_response, validate=validate)
\ No newline at end of file
+    return self.output(r.content, validate_response, validate=validate)
\ No newline at end of file
@@ -2,8 +2,15 @@ from .types import OrderType, OrderStatus, TimeInForce
 from .util import timestamp, round2tick, trunc2tick
 from .exc import Error, NetworkError, UserError, ValidationError, AuthError, ApiError
 from .validation import ValidationMixin, validator, TypedDict, Timestamp
-from .http import HttpClient, HttpMixin, AuthHttpClient, AuthHttpMixin
-from .rate_limiting import rate_limit
+from .http import HttpClient, HttpMixin, AuthHttpClient, AuthHttpMixin, PoolConfig, PoolStats
+from .rate_limiting import rate_limit, RateLimiter, Bucket
+from .concurrency import map_ordered, merge_streams
+from .paging import time_windows, page_window, sharded_pages, Window, WindowChunk
+from .cache import TTLCache, cached
+from .clock import ClockSync, ClockStats
+from .metrics import Metrics, Histogram
+from .retry import RetryPolicy, resubmit, new_client_oid
+from .hedging import HedgePolicy
 from .mixin import Endpoint, AuthEndpoint, Router, AuthRouter, validator, Response, BITGET_REST_URL
 
 __all__ = [
@@ -11,8 +18,15 @@ __all__ = [
   'timestamp', 'round2tick', 'trunc2tick',
   'Error', 'NetworkError', 'UserError', 'ValidationError', 'AuthError', 'ApiError',
   'ValidationMixin', 'validator', 'TypedDict', 'Timestamp',
-  'HttpClient', 'HttpMixin', 'AuthHttpClient', 'AuthHttpMixin',
-  'rate_limit',
+  'HttpClient', 'HttpMixin', 'AuthHttpClient', 'AuthHttpMixin', 'PoolConfig', 'PoolStats',
+  'rate_limit', 'RateLimiter', 'Bucket',
+  'map_ordered', 'merge_streams',
+  'time_windows', 'page_window', 'sharded_pages', 'Window', 'WindowChunk',
+  'TTLCache', 'cached',
+  'ClockSync', 'ClockStats',
+  'Metrics', 'Histogram',
+  'RetryPolicy', 'resubmit', 'new_client_oid',
+  'HedgePolicy',
   'Endpoint', 'AuthEndpoint', 'Router', 'AuthRouter', 'validator', 'Response',
   'BITGET_REST_URL',
 ]
\ No newline at end of file
@@ -0,0 +1,64 @@
+from typing_extensions import Any, Mapping, Sequence, NotRequired, TypeVar, Hashable, Callable
+
+from .validation import TypedDict
+from .exc import Error
+
+T = TypeVar('T')
+
+MAX_BATCH_ORDERS = 50
+
+class BulkOrderResult(TypedDict):
+  orderId: str | None
+  clientOid: str | None
+  errorMsg: NotRequired[str]
+  """Only present if the order failed"""
+  errorCode: NotRequired[str]
+
+def chunked(items: Sequence[T], size: int = MAX_BATCH_ORDERS, *, by: Callable[[T], Hashable] | None = None) -> list[list[T]]:
+  """Split `items` into chunks of up to `size`, keeping order. With `by`, chunks only hold items of the same group (e.g. symbol)."""
+  groups: dict[Hashable, list[T]] = {}
+  for item in items:
+    groups.setdefault(None if by is None else by(item), []).append(item)
+  return [group[i:i+size] for group in groups.values() for i in range(0, len(group), size)]
+
+def merge_results(
+  orders: Sequence[Mapping[str, Any]], chunks: Sequence[Sequence[Mapping[str, Any]]],
+  responses: Sequence[Mapping[str, Any] | BaseException],
+) -> list[BulkOrderResult]:
+  """Merge batch responses (`successList`/`failureList`) into one result per order, in input order.
+
+  Orders are matched by `clientOid` (or `orderId`, if they have none). A chunk that failed as a whole
+  (any `bitget.core.Error`) reports all its orders as failed; other exceptions are re-raised.
+  """
+  by_client_oid: dict[str, BulkOrderResult] = {}
+  by_order_id: dict[str, BulkOrderResult] = {}
+
+  def add(result: BulkOrderResult):
+    if result['clientOid']:
+      by_client_oid[result['clientOid']] = result
+    if result['orderId']:
+      by_order_id[result['orderId']] = result
+
+  for chunk, r in zip(chunks, responses):
+    if isinstance(r, Error):
+      for o in chunk:
+        add({'orderId': o.get('orderId'), 'clientOid': o.get('clientOid'), 'errorMsg': str(r)})
+    elif isinstance(r, BaseException):
+      raise r
+    else:
+      for ok in r['successList']:
+        add({'orderId': ok.get('orderId') or None, 'clientOid': ok.get('clientOid') or None})
+      for err in r['failureList']:
+        failed: BulkOrderResult = {'orderId': err.get('orderId') or None, 'clientOid': err.get('clientOid') or None, 'errorMsg': err.get('errorMsg', '')}
+        if err.get('errorCode'):
+          failed['errorCode'] = err['errorCode']
+        add(failed)
+
+  def result(o: Mapping[str, Any]) -> BulkOrderResult:
+    if (cid := o.get('clientOid')) and (r := by_client_oid.get(cid)) is not None:
+      return r
+    if (oid := o.get('orderId')) and (r := by_order_id.get(oid)) is not None:
+      return r
+    return {'orderId': o.get('orderId'), 'clientOid': o.get('clientOid'), 'errorMsg': 'Missing from the response'}
+
+  return [result(o) for o in orders]
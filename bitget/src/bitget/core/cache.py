@@ -0,0 +1,80 @@
+from typing_extensions import Any, Awaitable, Callable, Hashable, Mapping, TypeVar, ParamSpec, Concatenate
+from dataclasses import dataclass, field
+from datetime import timedelta
+from functools import wraps
+import inspect
+import asyncio
+import time
+
+P = ParamSpec('P')
+R = TypeVar('R')
+S = TypeVar('S')
+T = TypeVar('T')
+
+@dataclass
+class TTLCache:
+  """In-memory response cache for slowly changing (reference) data, shared by a client's endpoints.
+
+  Entries expire after their TTL. Concurrent misses on the same key share a single request.
+  Cached values are shared: treat them as read-only.
+
+  - `ttl`: Overrides every endpoint's default TTL.
+  - `ttls`: TTL overrides per endpoint, e.g. `{'spot.public.symbols.symbols': timedelta(minutes=1)}`.
+  """
+  ttl: timedelta | None = None
+  ttls: Mapping[str, timedelta] = field(default_factory=dict)
+  entries: dict[Hashable, tuple[float, Any]] = field(default_factory=dict, init=False, repr=False)
+  inflight: dict[Hashable, asyncio.Future] = field(default_factory=dict, init=False, repr=False)
+
+  def ttl_for(self, name: str, default: timedelta) -> float:
+    return self.ttls.get(name, default if self.ttl is None else self.ttl).total_seconds()
+
+  async def get(self, key: Hashable, ttl: float, fetch: Callable[[], Awaitable[T]]) -> T:
+    """Cached value of `key`, or the result of `fetch()` (cached for `ttl` seconds if it succeeds)."""
+    if (entry := self.entries.get(key)) is not None and entry[0] > time.monotonic():
+      return entry[1]
+    if (task := self.inflight.get(key)) is None:
+      # a separate task, so that cancelling one caller doesn't fail the others
+      task = self.inflight[key] = asyncio.ensure_future(fetch())
+      task.add_done_callback(lambda t: self._done(key, ttl, t))
+    return await asyncio.shield(task)
+
+  def _done(self, key: Hashable, ttl: float, task: asyncio.Future):
+    if self.inflight.get(key) is not task: # invalidated while in flight
+      return
+    del self.inflight[key]
+    if not task.cancelled() and task.exception() is None:
+      self.entries[key] = (time.monotonic() + ttl, task.result())
+
+  def invalidate(self, name: str | None = None):
+    """Drop the entries of endpoint `name` (e.g. `'spot.public.symbols.symbols'`), or all of them."""
+    if name is None:
+      self.entries.clear()
+      self.inflight.clear()
+      return
+    for d in (self.entries, self.inflight):
+      for key in [k for k in d if k[0] == name]: # type: ignore
+        del d[key]
+
+def cached(ttl: timedelta):
+  """Cache an endpoint method's results in its client's `TTLCache` (if any; caching is opt-in).
+
+  Entries are keyed by the call's arguments; the endpoint name is its module path and method name,
+  e.g. `'spot.public.symbols.symbols'`.
+  """
+  def decorator(fn: Callable[Concatenate[S, P], Awaitable[R]]) -> Callable[Concatenate[S, P], Awaitable[R]]:
+    name = f'{fn.__module__.removeprefix("bitget.")}.{fn.__name__}'
+    signature = inspect.signature(fn)
+
+    @wraps(fn)
+    async def wrapper(self, *args: P.args, **kwargs: P.kwargs) -> R:
+      cache: TTLCache | None = self.http.cache # type: ignore
+      if cache is None:
+        return await fn(self, *args, **kwargs)
+      bound = signature.bind(self, *args, **kwargs)
+      bound.apply_defaults() # `f()` and `f(validate=None)` share an entry
+      key = (name, tuple(bound.arguments.items())[1:])
+      return await cache.get(key, cache.ttl_for(name, ttl), lambda: fn(self, *args, **kwargs))
+
+    return wrapper
+  return decorator
@@ -0,0 +1,88 @@
+from typing_extensions import Awaitable, Callable, TypedDict
+from dataclasses import dataclass, field
+from datetime import timedelta
+import asyncio
+import time
+
+from .exc import Error
+
+class ClockStats(TypedDict):
+  offset: float
+  """Server minus local time, in ms (smoothed)"""
+  rtt: float | None
+  """Round-trip time of the last sample, in ms"""
+  min_rtt: float | None
+  """Lowest round-trip time seen, in ms"""
+  samples: int
+  errors: int
+  """Failed syncs (the previous offset is kept)"""
+  age: float | None
+  """Seconds since the last successful sync"""
+
+@dataclass
+class ClockSync:
+  """Local-to-server clock offset, estimated from server time samples (NTP-style), for signing requests.
+
+  Each sync takes a few samples and keeps the one with the lowest round-trip time, assuming the server
+  read its clock half-way through. Offsets are smoothed across syncs.
+
+  ```python
+  clock = ClockSync()
+  client = Bitget.new(clock=clock)
+  await clock.sync(client.spot.public.server_time_ms)
+  asyncio.create_task(clock.run(client.spot.public.server_time_ms))  # keep it fresh
+  ```
+
+  - `smoothing`: Weight of each new sync (1 = no smoothing).
+  """
+  smoothing: float = 0.3
+  offset: float = field(default=0, init=False)
+  rtt: float | None = field(default=None, init=False)
+  min_rtt: float | None = field(default=None, init=False)
+  samples: int = field(default=0, init=False)
+  errors: int = field(default=0, init=False)
+  synced_at: float | None = field(default=None, init=False, repr=False)
+
+  def now(self) -> int:
+    """Server time estimate, in ms."""
+    return int(time.time() * 1e3 + self.offset)
+
+  def observe(self, sent: float, server: float, received: float):
+    """Apply one sample: local send and receive times, and the server's time (all in ms)."""
+    rtt = received - sent
+    offset = server - (sent + received) / 2
+    self.offset = offset if self.synced_at is None else self.offset + self.smoothing * (offset - self.offset)
+    self.rtt = rtt
+    self.min_rtt = rtt if self.min_rtt is None else min(self.min_rtt, rtt)
+    self.synced_at = time.monotonic()
+
+  async def sync(self, server_time: Callable[[], Awaitable[int]], *, samples: int = 4):
+    """Sample `server_time()` (server time in ms) `samples` times and apply the lowest-latency sample."""
+    best: tuple[float, float, float] | None = None
+    for _ in range(samples):
+      sent, start = time.time() * 1e3, time.monotonic()
+      server = await server_time()
+      received = sent + (time.monotonic() - start) * 1e3 # wall time anchors, the monotonic clock measures
+      self.samples += 1
+      if best is None or received - sent < best[2] - best[0]:
+        best = (sent, server, received)
+    if best is not None:
+      self.observe(*best)
+
+  async def run(
+    self, server_time: Callable[[], Awaitable[int]], *,
+    interval: timedelta = timedelta(minutes=1), samples: int = 4,
+  ):
+    """Sync every `interval`, forever. Failed syncs (API or network errors) are counted and skipped."""
+    while True:
+      try:
+        await self.sync(server_time, samples=samples)
+      except Error:
+        self.errors += 1
+      await asyncio.sleep(interval.total_seconds())
+
+  def stats(self) -> ClockStats:
+    return ClockStats(
+      offset=self.offset, rtt=self.rtt, min_rtt=self.min_rtt, samples=self.samples, errors=self.errors,
+      age=None if self.synced_at is None else time.monotonic() - self.synced_at,
+    )
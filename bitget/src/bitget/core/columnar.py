@@ -0,0 +1,71 @@
+"""Struct-of-arrays outputs, parsed straight from the raw (string) rows into NumPy arrays.
+
+Skips per-row `dict`/`Decimal` objects: all cells are parsed in one pass by NumPy, then sliced into columns.
+Prices and sizes become `float64` (not exact, unlike `Decimal`); timestamps stay `int64` milliseconds.
+The arrays are contiguous, so they convert to Arrow/pandas/polars without copying.
+"""
+from typing_extensions import TYPE_CHECKING, Any, Mapping, Sequence, TypedDict
+from itertools import chain
+
+from .exc import UserError
+
+if TYPE_CHECKING:
+  import numpy as np
+
+def _numpy():
+  try:
+    import numpy
+  except ImportError as e:
+    raise UserError('Columnar outputs require numpy: `pip install typed-bitget[numpy]`') from e
+  return numpy
+
+class CandleColumns(TypedDict):
+  ts: 'np.ndarray'
+  """Open time, ms (int64)"""
+  open: 'np.ndarray'
+  high: 'np.ndarray'
+  low: 'np.ndarray'
+  close: 'np.ndarray'
+  baseVolume: 'np.ndarray'
+  usdtVolume: 'np.ndarray'
+  quoteVolume: 'np.ndarray'
+
+class BookColumns(TypedDict):
+  ask_price: 'np.ndarray'
+  """Ascending (float64)"""
+  ask_size: 'np.ndarray'
+  bid_price: 'np.ndarray'
+  """Descending (float64)"""
+  bid_size: 'np.ndarray'
+  ts: int
+  """Matching engine time, ms"""
+
+def candle_columns(rows: Sequence[Sequence[str]]) -> CandleColumns:
+  """Convert raw candle rows (`[ts, open, high, low, close, baseVolume, usdtVolume, quoteVolume]`) to columns."""
+  np = _numpy()
+  # ms timestamps are exact in float64 (< 2**53)
+  table = np.array(list(chain.from_iterable(rows)), dtype=np.float64).reshape(-1, 8).T.copy()
+  prices = table[1:]
+  return {
+    'ts': table[0].astype(np.int64),
+    'open': prices[0],
+    'high': prices[1],
+    'low': prices[2],
+    'close': prices[3],
+    'baseVolume': prices[4],
+    'usdtVolume': prices[5],
+    'quoteVolume': prices[6],
+  }
+
+def book_columns(data: Mapping[str, Any]) -> BookColumns:
+  """Convert a raw depth snapshot (`asks`/`bids` as `[price, size]` strings) to columns."""
+  np = _numpy()
+  asks = np.array(list(chain.from_iterable(data['asks'])), dtype=np.float64).reshape(-1, 2).T.copy()
+  bids = np.array(list(chain.from_iterable(data['bids'])), dtype=np.float64).reshape(-1, 2).T.copy()
+  return {
+    'ask_price': asks[0],
+    'ask_size': asks[1],
+    'bid_price': bids[0],
+    'bid_size': bids[1],
+    'ts': int(data['ts']),
+  }
@@ -0,0 +1,51 @@
+from typing_extensions import Awaitable, Callable, Iterable, AsyncGenerator, AsyncIterator, AsyncIterable, Mapping, TypeVar
+from collections import deque
+import asyncio
+
+T = TypeVar('T')
+R = TypeVar('R')
+K = TypeVar('K')
+
+async def map_ordered(fn: Callable[[T], Awaitable[R]], items: Iterable[T], *, concurrency: int) -> AsyncIterator[R]:
+  """Run `fn` over `items`, with up to `concurrency` calls in flight, yielding results in input order.
+
+  Rate limits still apply per call: `concurrency` only bounds how far ahead of the consumer requests may run.
+  """
+  pending: deque[asyncio.Future[R]] = deque()
+  try:
+    for item in items:
+      pending.append(asyncio.ensure_future(fn(item)))
+      if len(pending) >= concurrency:
+        yield await pending.popleft()
+    while pending:
+      yield await pending.popleft()
+  finally:
+    for task in pending:
+      task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+async def merge_streams(streams: Mapping[K, AsyncIterable[T]]) -> AsyncGenerator[tuple[K, T], None]:
+  """Consume `streams` concurrently, yielding `(key, item)` as items arrive.
+
+  Each stream runs at most one item ahead of the consumer. Streams are closed when the merge is closed.
+  """
+  iterators = {key: aiter(stream) for key, stream in streams.items()}
+  pending: dict[asyncio.Future, K] = {asyncio.ensure_future(anext(it)): key for key, it in iterators.items()}
+  try:
+    while pending:
+      done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+      for task in done:
+        key = pending.pop(task)
+        try:
+          item = task.result()
+        except StopAsyncIteration:
+          continue
+        pending[asyncio.ensure_future(anext(iterators[key]))] = key
+        yield key, item
+  finally:
+    for task in pending:
+      task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    for it in iterators.values():
+      if (aclose := getattr(it, 'aclose', None)) is not None:
+        await aclose()
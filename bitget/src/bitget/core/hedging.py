@@ -0,0 +1,96 @@
+from typing_extensions import Awaitable, Callable
+from dataclasses import dataclass, field
+import asyncio
+import time
+import httpx
+
+from .rate_limiting import Bucket
+from .metrics import Metrics, Histogram
+
+MARKET_DATA_PATHS = frozenset({
+  '/api/v2/spot/market/tickers', '/api/v2/spot/market/orderbook', '/api/v2/spot/market/merge-depth',
+  '/api/v2/mix/market/ticker', '/api/v2/mix/market/merge-depth',
+})
+
+@dataclass
+class HedgePolicy:
+  """Hedged requests: if a response is slower than usual, send a duplicate and keep whichever answers first.
+  Opt-in: `Bitget.new(hedge=HedgePolicy())`.
+
+  The deadline is a latency quantile of the path, learned from its own requests. The duplicate goes out
+  on another pooled connection (the first one is busy) and the loser is cancelled. Only `GET`s of `paths`
+  are hedged, and hedges draw from a budget and a free rate-limit slot, so they never queue.
+
+  - `paths`: Endpoints to hedge (default: tickers and order books).
+  - `quantile`: Deadline, as a latency quantile (0.95 = hedge the slowest 5%).
+  - `delay`: Deadline until `min_samples` latencies are known, in seconds.
+  - `budget`: Hedges earned per request. Caps the extra load (0.05 = at most +5%).
+  - `reserve`: Hedges available at once (and to start with).
+  """
+  paths: frozenset[str] = MARKET_DATA_PATHS
+  quantile: float = 0.95
+  delay: float = 0.1
+  min_samples: int = 20
+  budget: float = 0.05
+  reserve: float = 2
+  latencies: dict[str, Histogram] = field(default_factory=dict, init=False, repr=False)
+  """Path -> latencies of the first request sent (cut short when a hedge won), in seconds"""
+  tokens: float = field(init=False, repr=False)
+
+  def __post_init__(self):
+    self.tokens = self.reserve
+
+  def deadline(self, path: str) -> float:
+    h = self.latencies.get(path)
+    if h is None or h.count < self.min_samples:
+      return self.delay
+    return h.quantile(self.quantile) or self.delay
+
+  def observe(self, path: str, seconds: float):
+    if (h := self.latencies.get(path)) is None:
+      h = self.latencies[path] = Histogram()
+    h.observe(seconds)
+
+  def deposit(self):
+    self.tokens = min(self.reserve, self.tokens + self.budget)
+
+  def withdraw(self) -> bool:
+    if self.tokens < 1:
+      return False
+    self.tokens -= 1
+    return True
+
+  async def send(
+    self, path: str, send: Callable[[], Awaitable[httpx.Response]], *,
+    bucket: Bucket | None = None, metrics: Metrics | None = None,
+  ) -> httpx.Response:
+    """`send()`, hedged by a second `send()` after the path's deadline."""
+    self.deposit()
+    start = time.perf_counter()
+    first = asyncio.ensure_future(send())
+    tasks = [first]
+    try:
+      done, _ = await asyncio.wait(tasks, timeout=self.deadline(path))
+      if done or not self.withdraw():
+        return await first
+      if bucket is not None and not bucket.try_acquire():
+        self.tokens += 1 # not spent
+        return await first
+      if metrics is not None:
+        metrics.inc('hedges', path)
+      tasks.append(asyncio.ensure_future(send()))
+      while True:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        winner = next((t for t in done if t.exception() is None), None)
+        if winner is not None or not pending: # the first response wins (or the last error)
+          break
+        tasks = list(pending)
+      if winner is None:
+        return done.pop().result()
+      if winner is not first and metrics is not None:
+        metrics.inc('hedge_wins', path)
+      return winner.result()
+    finally:
+      self.observe(path, time.perf_counter() - start)
+      for task in tasks:
+        task.cancel()
@@ -1,7 +1,7 @@
-from .client import HttpClient, HttpMixin
+from .client import HttpClient, HttpMixin, PoolConfig, PoolStats
 from .auth import AuthHttpClient, AuthHttpMixin
 
 __all__ = [
-  'HttpClient', 'HttpMixin',
+  'HttpClient', 'HttpMixin', 'PoolConfig', 'PoolStats',
   'AuthHttpClient', 'AuthHttpMixin',
 ]
\ No newline at end of file
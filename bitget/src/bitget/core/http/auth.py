@@ -3,14 +3,22 @@ from dataclasses import dataclass, field
 import hmac
 import base64
 import hashlib
-from urllib.parse import urlencode, quote, urlparse
+import time
 
 import httpx
 import orjson
 
-from .client import HttpClient, HttpMixin
+from .client import HttpClient, HttpMixin, PoolConfig
+from ..rate_limiting import RateLimiter
+from ..cache import TTLCache
+from ..clock import ClockSync
+from ..metrics import Metrics, current_path
+from ..retry import RetryPolicy
+from ..hedging import HedgePolicy
 from ..util import timestamp
 
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
 def sign(payload: bytes, *, secret: str) -> bytes:
   d = hmac.new(secret.encode(), payload, hashlib.sha256).digest()
   return base64.b64encode(d)
@@ -18,22 +26,47 @@ def sign(payload: bytes, *, secret: str) -> bytes:
 def payload(*, timestamp: int, method: str, path: str, query: str = '', body: bytes = b'') -> bytes:
   return f'{timestamp}{method}{path}{query}'.encode() + body
 
+@dataclass
+class Signer(httpx.Auth):
+  """Signs requests right before they're sent, so that each retry gets a fresh timestamp."""
+  requires_request_body = True
+  access_key: str
+  secret_key: str = field(repr=False)
+  passphrase: str = field(repr=False)
+  clock: ClockSync | None = None
+  """Server clock estimate, if synced (otherwise, the local clock is used)"""
+  metrics: Metrics | None = None
+  mac: hmac.HMAC = field(init=False, repr=False)
+  """Keyed once; copied per request"""
+  headers: tuple[tuple[str, str], ...] = field(init=False, repr=False)
+
+  def __post_init__(self):
+    self.mac = hmac.new(self.secret_key.encode(), digestmod=hashlib.sha256)
+    self.headers = (('Access-Key', self.access_key), ('Access-Passphrase', self.passphrase))
 
-def query_string(params: Mapping[str, Any]) -> str:
-  def fix(v):
-    # fix bools, which would show otherwise as "hello=True" instead of "hello=true"
-    if isinstance(v, bool):
-      return str(v).lower()
-    else:
-      return v
-  fixed_params = [(k, fix(v)) for k, v in params.items()]
-  return urlencode(fixed_params, quote_via=quote)
+  def auth_flow(self, request: httpx.Request):
+    start = time.perf_counter()
+    ts = timestamp.now() if self.clock is None else self.clock.now()
+    mac = self.mac.copy()
+    mac.update(payload(timestamp=ts, method=request.method, path=request.url.raw_path.decode(), body=request.content))
+    for key, value in self.headers: # much cheaper than `Headers.update`
+      request.headers[key] = value
+    request.headers['Access-Sign'] = base64.b64encode(mac.digest()).decode()
+    request.headers['Access-Timestamp'] = str(ts)
+    if self.metrics is not None:
+      self.metrics.observe('sign', request.url.path, time.perf_counter() - start)
+    yield request
 
 @dataclass
 class AuthHttpClient(HttpClient):
   access_key: str = field(kw_only=True)
   secret_key: str = field(kw_only=True, repr=False)
   passphrase: str = field(kw_only=True, repr=False)
+  clock: ClockSync | None = field(default=None, kw_only=True, repr=False)
+  signer: Signer = field(init=False, repr=False)
+
+  def __post_init__(self):
+    self.signer = Signer(self.access_key, self.secret_key, self.passphrase, self.clock, self.metrics)
 
   async def authed_request(
     self, method: str, url: str,
@@ -45,27 +78,18 @@ class AuthHttpClient(HttpClient):
     params: Mapping[str, Any] | None = None,
     headers: Mapping[str, str] | None = None,
     cookies: httpx._types.CookieTypes | None = None,
-    auth: httpx._types.AuthTypes | httpx._client.UseClientDefault | None = httpx.USE_CLIENT_DEFAULT,
     follow_redirects: bool | httpx._client.UseClientDefault = httpx.USE_CLIENT_DEFAULT,
     timeout: httpx._types.TimeoutTypes | httpx._client.UseClientDefault = httpx.USE_CLIENT_DEFAULT,
     extensions: httpx._types.RequestExtensions | None = None,
   ):
-    query = '?' + query_string(params) if params else ''
-    path = urlparse(url).path
-    ts = timestamp.now()
-    body = orjson.dumps(json) if json is not None else b''
-    prehash = payload(timestamp=ts, method=method, path=path, query=query, body=body)
-    signature = sign(prehash, secret=self.secret_key)
-    new_headers = {
-      'Access-Key': self.access_key,
-      'Access-Sign': signature,
-      'Access-Timestamp': str(ts),
-      'Access-Passphrase': self.passphrase,
-    }
-    new_headers.update(headers or {})
+    """Send a signed request. A `json` body is serialized once (with orjson): the signed bytes are the sent bytes."""
+    if json is not None and content is None and data is None and files is None:
+      content = orjson.dumps(json)
+      headers = JSON_HEADERS if headers is None else {**JSON_HEADERS, **headers}
+      json = None
     return await self.request(
-      method, url, headers=new_headers, params=params, json=json,
-      content=content, data=data, files=files, auth=auth,
+      method, url, headers=headers, params=params, json=json,
+      content=content, data=data, files=files, auth=self.signer,
       follow_redirects=follow_redirects, cookies=cookies,
       timeout=timeout, extensions=extensions,
     )
@@ -77,8 +101,18 @@ class AuthHttpMixin(HttpMixin):
   http: AuthHttpClient = field(kw_only=True) # type: ignore
 
   @classmethod
-  def new(cls, access_key: str, secret_key: str, passphrase: str, *, base_url: str):
-    client = AuthHttpClient(access_key=access_key, secret_key=secret_key, passphrase=passphrase)
+  def new(
+    cls, access_key: str, secret_key: str, passphrase: str, *, base_url: str,
+    pool: PoolConfig | None = None, limiter: RateLimiter | None = None, cache: TTLCache | None = None,
+    coalesce: bool = False, clock: ClockSync | None = None, metrics: Metrics | None = None,
+    retry: RetryPolicy | None = None, hedge: HedgePolicy | None = None,
+    transport: httpx.AsyncBaseTransport | None = None,
+  ):
+    client = AuthHttpClient(
+      access_key=access_key, secret_key=secret_key, passphrase=passphrase,
+      pool=pool or PoolConfig(), limiter=limiter or RateLimiter(), cache=cache, coalesce=coalesce, clock=clock, metrics=metrics,
+      retry=retry, hedge=hedge, transport=transport,
+    )
     return cls(base_url=base_url, http=client)
   
   async def __aenter__(self):
@@ -98,14 +132,15 @@ class AuthHttpMixin(HttpMixin):
     params: Mapping[str, Any] | None = None,
     headers: Mapping[str, str] | None = None,
     cookies: httpx._types.CookieTypes | None = None,
-    auth: httpx._types.AuthTypes | httpx._client.UseClientDefault | None = httpx.USE_CLIENT_DEFAULT,
     follow_redirects: bool | httpx._client.UseClientDefault = httpx.USE_CLIENT_DEFAULT,
     timeout: httpx._types.TimeoutTypes | httpx._client.UseClientDefault = httpx.USE_CLIENT_DEFAULT,
     extensions: httpx._types.RequestExtensions | None = None,
   ):
+    if self.http.metrics is not None:
+      current_path.set(path)
     return await self.http.authed_request(
       method, self.base_url + path, headers=headers, json=json,
-      content=content, data=data, files=files, auth=auth,
+      content=content, data=data, files=files,
       follow_redirects=follow_redirects, cookies=cookies,
       timeout=timeout, extensions=extensions, params=params,
     )
\ No newline at end of file
@@ -1,12 +1,114 @@
-from typing_extensions import Any, Mapping
+from typing_extensions import Any, Mapping, TypedDict
 from dataclasses import dataclass, field
+from functools import cached_property
+from urllib.parse import urlsplit
 import asyncio
+import time
 import httpx
+import orjson
 
 from ..exc import NetworkError
+from ..rate_limiting import RateLimiter, Bucket, current_bucket
+from ..cache import TTLCache
+from ..metrics import Metrics, current_path
+from ..retry import RetryPolicy, RETRY_STATUSES
+from ..hedging import HedgePolicy
+
+RATE_LIMIT_CODES = frozenset({'429', '40014'})
+REMAINING_QUOTA_HEADER = 'x-mbx-used-remain-limit'
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD'})
+
+@dataclass(frozen=True)
+class PoolConfig:
+  """Connection pool configuration of an `HttpClient`.
+
+  - `max_connections`: Maximum number of concurrent connections (`None` = unbounded).
+  - `max_keepalive_connections`: Maximum number of idle connections kept alive.
+  - `keepalive_expiry`: Seconds an idle connection is kept alive.
+  - `http2`: Enable HTTP/2 multiplexing (requires `pip install httpx[http2]`).
+  - `timeout`: Default timeout (seconds or `httpx.Timeout`, for separate connect/read timeouts).
+  - `timeouts`: Timeout overrides per endpoint group, keyed by path prefix, e.g. `{'/api/v2/mix/order': httpx.Timeout(2, connect=1)}`. The longest matching prefix wins.
+  """
+  max_connections: int | None = 100
+  max_keepalive_connections: int | None = 20
+  keepalive_expiry: float | None = 5.0
+  http2: bool = False
+  timeout: httpx._types.TimeoutTypes = 5.0
+  timeouts: Mapping[str, httpx._types.TimeoutTypes] = field(default_factory=dict)
+
+  @property
+  def limits(self) -> httpx.Limits:
+    return httpx.Limits(
+      max_connections=self.max_connections,
+      max_keepalive_connections=self.max_keepalive_connections,
+      keepalive_expiry=self.keepalive_expiry,
+    )
+
+  @cached_property
+  def _prefixes(self) -> list[tuple[str, httpx._types.TimeoutTypes]]:
+    return sorted(self.timeouts.items(), key=lambda kv: len(kv[0]), reverse=True)
+
+  def timeout_for(self, path: str) -> httpx._types.TimeoutTypes:
+    for prefix, timeout in self._prefixes:
+      if path.startswith(prefix):
+        return timeout
+    return self.timeout
+
+def is_rate_limited(r: httpx.Response) -> bool:
+  """Whether Bitget rejected the request for exceeding a rate limit (HTTP 429 or a rate-limit error code)."""
+  if r.status_code == 429:
+    return True
+  if r.status_code < 400:
+    return False
+  try:
+    return str(orjson.loads(r.content).get('code')) in RATE_LIMIT_CODES
+  except (orjson.JSONDecodeError, AttributeError):
+    return False
+
+def retry_after(r: httpx.Response) -> float | None:
+  """Backoff requested by the server via `Retry-After`, in seconds."""
+  try:
+    return float(r.headers['retry-after'])
+  except (KeyError, ValueError):
+    return None
+
+def observe(bucket: Bucket, r: httpx.Response):
+  """Feed a non-rate-limited response back into the endpoint's bucket."""
+  bucket.recover()
+  if (remaining := r.headers.get(REMAINING_QUOTA_HEADER)) is not None:
+    try:
+      bucket.observe_remaining(int(remaining))
+    except ValueError:
+      ...
+
+class PoolStats(TypedDict):
+  connections: int
+  """Open connections"""
+  in_use: int
+  """Connections currently serving a request"""
+  idle: int
+  """Idle (keep-alive) connections"""
+  http2: int
+  """Connections negotiated as HTTP/2"""
+  queued: int
+  """Requests waiting for a connection"""
 
 @dataclass
 class HttpClient:
+  pool: PoolConfig = field(default_factory=PoolConfig, kw_only=True)
+  limiter: RateLimiter = field(default_factory=RateLimiter, kw_only=True, repr=False)
+  rate_limit_retries: int = field(default=3, kw_only=True)
+  cache: TTLCache | None = field(default=None, kw_only=True, repr=False)
+  coalesce: bool = field(default=False, kw_only=True)
+  """Share one request between identical concurrent public GETs"""
+  metrics: Metrics | None = field(default=None, kw_only=True, repr=False)
+  retry: RetryPolicy | None = field(default=None, kw_only=True)
+  """Retry transient network errors (see `RetryPolicy`)"""
+  hedge: HedgePolicy | None = field(default=None, kw_only=True)
+  """Hedge slow market-data `GET`s (see `HedgePolicy`)"""
+  transport: httpx.AsyncBaseTransport | None = field(default=None, kw_only=True, repr=False)
+  """Custom `httpx` transport, e.g. an `httpx.MockTransport` for tests and benchmarks (the pool limits then don't apply)"""
+  inflight: dict[tuple, asyncio.Future[httpx.Response]] = field(default_factory=dict, init=False, repr=False)
   lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
   client_future: asyncio.Future[httpx.AsyncClient|None] = field(default_factory=asyncio.Future, init=False, repr=False)
 
@@ -17,7 +119,9 @@ class HttpClient:
         return client
 
     async with self.lock:
-      client = await httpx.AsyncClient().__aenter__()
+      client = await httpx.AsyncClient(
+        limits=self.pool.limits, http2=self.pool.http2, timeout=self.pool.timeout, transport=self.transport,
+      ).__aenter__()
       self.client_future.set_result(client)
       return client
 
@@ -31,6 +135,27 @@ class HttpClient:
         await client.__aexit__(exc_type, exc_value, traceback)
         self.client_future = asyncio.Future()
 
+  def pool_stats(self) -> PoolStats:
+    """Snapshot of the connection pool (all zeros before the first request)."""
+    stats = PoolStats(connections=0, in_use=0, idle=0, http2=0, queued=0)
+    if not self.client_future.done() or (client := self.client_future.result()) is None:
+      return stats
+    pool = getattr(client._transport, '_pool', None)
+    if pool is None:
+      return stats
+    for conn in pool.connections:
+      if conn.is_closed():
+        continue
+      stats['connections'] += 1
+      if conn.is_idle():
+        stats['idle'] += 1
+      else:
+        stats['in_use'] += 1
+      if 'HTTP/2' in conn.info():
+        stats['http2'] += 1
+    stats['queued'] = sum(r.is_queued() for r in getattr(pool, '_requests', []))
+    return stats
+
   async def request(
     self, method: str, url: str,
     *,
@@ -46,17 +171,80 @@ class HttpClient:
     timeout: httpx._types.TimeoutTypes | httpx._client.UseClientDefault = httpx.USE_CLIENT_DEFAULT,
     extensions: httpx._types.RequestExtensions | None = None,
   ):
-    try:
-      client = await self.client
-      return await client.request(
-        method, url, params=params, cookies=cookies, json=json,
-        content=content, data=data, files=files, auth=auth, follow_redirects=follow_redirects,
-        timeout=timeout, extensions=extensions,
-        headers=headers,
-      )
-    except httpx.HTTPError as e:
-      req = f'{method} {url}'
-      raise NetworkError(f'Error sending request to {req}', *e.args) from e
+    """Send a request, waiting for the current endpoint's rate limit.
+
+    Rate-limit responses throttle the endpoint's bucket. Idempotent requests are retried
+    (up to `rate_limit_retries` times) after the backoff window; others return the response as is.
+    With a `retry` policy, transient failures are retried too, and a 502/503/504 not retried raises `NetworkError`.
+    With a `hedge` policy, slow market-data `GET`s are hedged by a duplicate request.
+    """
+    metrics = self.metrics
+    policy = self.retry
+    hedge = self.hedge
+    path = urlsplit(url).path if self.pool.timeouts or metrics is not None or policy is not None or hedge is not None else ''
+    hedged = hedge if hedge is not None and method in IDEMPOTENT_METHODS and path in hedge.paths else None
+    if self.pool.timeouts and isinstance(timeout, httpx._client.UseClientDefault):
+      timeout = self.pool.timeout_for(path)
+    bucket = current_bucket()
+    retries = self.rate_limit_retries if method in IDEMPOTENT_METHODS else 0
+    attempt = 0
+    failures = 0
+    safe = policy.safe(method, path) if policy is not None else False
+    if policy is not None:
+      policy.deposit()
+    while True:
+      queued = time.perf_counter()
+      if bucket is not None:
+        await bucket.acquire()
+      sent = time.perf_counter()
+      try:
+        client = await self.client
+        send = lambda: client.request(
+          method, url, params=params, cookies=cookies, json=json,
+          content=content, data=data, files=files, auth=auth, follow_redirects=follow_redirects,
+          timeout=timeout, extensions=extensions,
+          headers=headers,
+        )
+        r = await (hedged.send(path, send, bucket=bucket, metrics=metrics) if hedged is not None else send())
+      except httpx.HTTPError as e:
+        if metrics is not None:
+          metrics.inc('errors', path, type=type(e).__name__)
+        if policy is not None and failures < policy.retries and policy.retryable(safe, error=e) and policy.withdraw():
+          failures += 1
+          if metrics is not None:
+            metrics.inc('retries', path, reason=type(e).__name__)
+          await asyncio.sleep(policy.backoff(failures))
+          continue
+        req = f'{method} {url}'
+        raise NetworkError(f'Error sending request to {req}', *e.args) from e
+
+      rate_limited = is_rate_limited(r)
+      if metrics is not None:
+        metrics.response(path, r, queue=sent - queued, network=time.perf_counter() - sent, rate_limited=rate_limited)
+      if (
+        policy is not None and failures < policy.retries
+        and policy.retryable(safe, status=r.status_code) and policy.withdraw()
+      ):
+        failures += 1
+        if metrics is not None:
+          metrics.inc('retries', path, reason=str(r.status_code))
+        await asyncio.sleep(policy.backoff(failures))
+        continue
+      if policy is not None and r.status_code in RETRY_STATUSES: # not retried: it may have reached the exchange
+        raise NetworkError(f'HTTP {r.status_code} from {method} {url}')
+      if not rate_limited:
+        if bucket is not None:
+          observe(bucket, r)
+        return r
+
+      delay = retry_after(r)
+      if bucket is not None:
+        bucket.throttle(delay)
+      if attempt >= retries:
+        return r
+      attempt += 1
+      if bucket is None:
+        await asyncio.sleep(delay if delay is not None else 2**attempt)
 
 @dataclass
 class HttpMixin:
@@ -66,7 +254,7 @@ class HttpMixin:
   async def __aenter__(self):
     await self.http.__aenter__()
     return self
-  
+
   async def __aexit__(self, exc_type, exc_value, traceback):
     await self.http.__aexit__(exc_type, exc_value, traceback)
 
@@ -85,8 +273,19 @@ class HttpMixin:
     timeout: httpx._types.TimeoutTypes | httpx._client.UseClientDefault = httpx.USE_CLIENT_DEFAULT,
     extensions: httpx._types.RequestExtensions | None = None,
   ):
-    return await self.http.request(
+    """Send a public request. With `http.coalesce`, identical concurrent GETs share a single request (and its rate limit)."""
+    if self.http.metrics is not None:
+      current_path.set(path)
+    send = lambda: self.http.request(
       method, self.base_url + path, params=params, headers=headers, cookies=cookies, json=json,
       content=content, data=data, files=files, auth=auth, follow_redirects=follow_redirects,
       timeout=timeout, extensions=extensions,
-    )
\ No newline at end of file
+    )
+    if not self.http.coalesce or method != 'GET' or headers or cookies or extensions:
+      return await send()
+    key = (self.base_url + path, tuple(sorted((params or {}).items())))
+    if (task := self.http.inflight.get(key)) is None:
+      # a separate task, so that cancelling one caller doesn't fail the others
+      task = self.http.inflight[key] = asyncio.ensure_future(send())
+      task.add_done_callback(lambda _: self.http.inflight.pop(key, None))
+    return await asyncio.shield(task)
\ No newline at end of file
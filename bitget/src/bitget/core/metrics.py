@@ -0,0 +1,123 @@
+from typing_extensions import Callable, Mapping, Literal
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from bisect import bisect_left
+import httpx
+
+Phase = Literal['queue', 'sign', 'network', 'parse', 'validate']
+"""
+- `queue`: waiting for the endpoint's rate limit
+- `sign`: signing (private requests)
+- `network`: sending and receiving, including connection setup and signing
+- `parse`: JSON decoding
+- `validate`: schema validation
+"""
+
+BOUNDS: tuple[float, ...] = tuple(1e-5 * 2**(i/2) for i in range(48))
+"""Histogram bucket upper bounds, in seconds: 10us to ~2 min, ~1.4x apart"""
+
+current_path: ContextVar[str | None] = ContextVar('current_path', default=None)
+"""Path of the request being handled, to label the parsing phases"""
+
+@dataclass
+class Histogram:
+  """Fixed log-scale buckets (see `BOUNDS`): constant memory, quantiles within a bucket (~1.4x)."""
+  counts: list[int] = field(default_factory=lambda: [0] * (len(BOUNDS) + 1))
+  sum: float = 0
+  count: int = 0
+
+  def observe(self, value: float):
+    self.counts[bisect_left(BOUNDS, value)] += 1
+    self.sum += value
+    self.count += 1
+
+  def quantile(self, q: float) -> float | None:
+    """Approximate `q`-quantile (the upper bound of its bucket)."""
+    if self.count == 0:
+      return None
+    rank = q * self.count
+    seen = 0
+    for i, n in enumerate(self.counts):
+      seen += n
+      if seen >= rank and n:
+        return BOUNDS[i] if i < len(BOUNDS) else float('inf')
+    return float('inf')
+
+Exporter = Callable[[str, str, float, Mapping[str, str]], None]
+"""`exporter(name, path, value, labels)`, called on every observation (e.g. to feed OpenTelemetry)"""
+
+@dataclass
+class Metrics:
+  """Per-endpoint timings (by phase) and counters, for a client. Opt-in: `Bitget.new(metrics=Metrics())`.
+
+  ```python
+  metrics = Metrics()
+  client = Bitget.new(metrics=metrics)
+  ...
+  metrics.histograms['network', '/api/v2/spot/market/tickers'].quantile(0.99)
+  print(metrics.prometheus())
+  ```
+
+  Counters: `requests` (by `status`), `errors` (network errors, by `type`), `api_errors` (by `code`),
+  `validation_errors`, `rate_limited`, `retries` (by `reason`), `hedges`, `hedge_wins`, `bytes_in`, `bytes_out`.
+
+  - `exporters`: Callbacks for every observation (see `Exporter`).
+  """
+  exporters: list[Exporter] = field(default_factory=list)
+  histograms: dict[tuple[str, str], Histogram] = field(default_factory=dict, init=False)
+  """(phase, path) -> durations, in seconds"""
+  counters: dict[tuple[str, str, tuple[tuple[str, str], ...]], float] = field(default_factory=dict, init=False)
+  """(name, path, labels) -> total"""
+
+  def observe(self, phase: Phase, path: str | None, seconds: float):
+    path = path or ''
+    if (h := self.histograms.get((phase, path))) is None:
+      h = self.histograms[phase, path] = Histogram()
+    h.observe(seconds)
+    for export in self.exporters:
+      export(phase, path, seconds, {})
+
+  def inc(self, name: str, path: str | None, value: float = 1, **labels: str):
+    path = path or ''
+    key = (name, path, tuple(labels.items()))
+    self.counters[key] = self.counters.get(key, 0) + value
+    for export in self.exporters:
+      export(name, path, value, labels)
+
+  def response(self, path: str, r: httpx.Response, *, queue: float, network: float, rate_limited: bool):
+    """Record a completed HTTP exchange."""
+    self.observe('queue', path, queue)
+    self.observe('network', path, network)
+    self.inc('requests', path, status=str(r.status_code))
+    if rate_limited:
+      self.inc('rate_limited', path)
+    self.inc('bytes_out', path, len(r.request.content))
+    self.inc('bytes_in', path, len(r.content))
+
+  def reset(self):
+    self.histograms.clear()
+    self.counters.clear()
+
+  def prometheus(self, prefix: str = 'bitget') -> str:
+    """Prometheus text exposition of all metrics."""
+    lines: list[str] = []
+    if self.histograms:
+      name = f'{prefix}_phase_seconds'
+      lines.append(f'# TYPE {name} histogram')
+      for (phase, path), h in sorted(self.histograms.items()):
+        labels = f'phase="{phase}",path="{path}"'
+        cumulative = 0
+        for bound, n in zip(BOUNDS, h.counts):
+          cumulative += n
+          lines.append(f'{name}_bucket{{{labels},le="{bound:.6g}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {h.count}')
+        lines.append(f'{name}_sum{{{labels}}} {h.sum:.9g}')
+        lines.append(f'{name}_count{{{labels}}} {h.count}')
+    families: dict[str, list[str]] = {}
+    for (counter, path, extra), value in sorted(self.counters.items()):
+      labels = ','.join([f'path="{path}"'] + [f'{k}="{v}"' for k, v in extra])
+      families.setdefault(f'{prefix}_{counter}_total', []).append(f'{{{labels}}} {value:g}')
+    for name, samples in families.items():
+      lines.append(f'# TYPE {name} counter')
+      lines.extend(name + sample for sample in samples)
+    return '\n'.join(lines) + '\n'
@@ -1,11 +1,20 @@
 from typing_extensions import TypeVar, Any
 import os
+import time
+import importlib
 from dataclasses import dataclass, field
-import json
+import httpx
+import orjson
 
-from .http import HttpMixin, AuthHttpMixin, HttpClient, AuthHttpClient
+from .http import HttpMixin, AuthHttpMixin, HttpClient, AuthHttpClient, PoolConfig
 from .validation import ValidationMixin, validator, TypedDict
-from .exc import ApiError
+from .exc import ApiError, ValidationError
+from .rate_limiting import RateLimiter
+from .cache import TTLCache
+from .clock import ClockSync
+from .metrics import Metrics, current_path
+from .retry import RetryPolicy
+from .hedging import HedgePolicy
 
 T = TypeVar('T')
 
@@ -18,19 +27,45 @@ class Response(TypedDict):
   data: Any
 
 def is_ok(r: Response):
-  return r['code'] == '00000' and r['msg'] == 'success'
-
-validate_response = validator(Response)
+  return r.get('code') == '00000' and r.get('msg') == 'success'
 
 @dataclass
 class BaseMixin(ValidationMixin):
   base_url: str = field(kw_only=True, default=BITGET_REST_URL)
 
   def output(self, data: str | bytes, validator: validator[T], validate: bool | None) -> T:
-    r: Response = validate_response(data) if self.validate(validate) else json.loads(data)
-    if not is_ok(r):
+    """Decode a response and unwrap its `data`, validated (once) if `validate`. Raises `ApiError` on error codes."""
+    metrics: Metrics | None = self.http.metrics # type: ignore
+    if metrics is None:
+      try:
+        r: Response = orjson.loads(data)
+      except orjson.JSONDecodeError as e:
+        raise ValidationError(f'Invalid JSON response: {data[:200]!r}') from e
+      if not isinstance(r, dict) or not is_ok(r):
+        raise ApiError(r)
+      return validator.python(r['data']) if self.validate(validate) else r['data']
+
+    path = current_path.get()
+    start = time.perf_counter()
+    try:
+      r = orjson.loads(data)
+    except orjson.JSONDecodeError as e:
+      metrics.inc('api_errors', path, code='invalid_json')
+      raise ValidationError(f'Invalid JSON response: {data[:200]!r}') from e
+    parsed = time.perf_counter()
+    metrics.observe('parse', path, parsed - start)
+    if not isinstance(r, dict) or not is_ok(r):
+      metrics.inc('api_errors', path, code=str(r.get('code')) if isinstance(r, dict) else 'invalid')
       raise ApiError(r)
-    return validator(r['data']) if self.validate(validate) else r['data']
+    if not self.validate(validate):
+      return r['data']
+    try:
+      out = validator.python(r['data'])
+    except ValidationError:
+      metrics.inc('validation_errors', path)
+      raise
+    metrics.observe('validate', path, time.perf_counter() - parsed)
+    return out
 
 @dataclass
 class Endpoint(BaseMixin, HttpMixin):
@@ -44,6 +79,10 @@ class AuthEndpoint(Endpoint, AuthHttpMixin):
   def new(
     cls, access_key: str | None = None, secret_key: str | None = None, passphrase: str | None = None, *,
     base_url: str = BITGET_REST_URL, validate: bool = True,
+    pool: PoolConfig | None = None, limiter: RateLimiter | None = None, cache: TTLCache | None = None,
+    coalesce: bool = False, clock: ClockSync | None = None, metrics: Metrics | None = None,
+    retry: RetryPolicy | None = None, hedge: HedgePolicy | None = None,
+    transport: httpx.AsyncBaseTransport | None = None,
   ):
     if access_key is None:
       access_key = os.environ['BITGET_ACCESS_KEY']
@@ -51,15 +90,31 @@ class AuthEndpoint(Endpoint, AuthHttpMixin):
       secret_key = os.environ['BITGET_SECRET_KEY']
     if passphrase is None:
       passphrase = os.environ['BITGET_PASSPHRASE']
-    client = AuthHttpClient(access_key=access_key, secret_key=secret_key, passphrase=passphrase)
+    client = AuthHttpClient(
+      access_key=access_key, secret_key=secret_key, passphrase=passphrase,
+      pool=pool or PoolConfig(), limiter=limiter or RateLimiter(), cache=cache, coalesce=coalesce, clock=clock, metrics=metrics,
+      retry=retry, hedge=hedge, transport=transport,
+    )
     return cls(base_url=base_url, http=client, default_validate=validate)
 
 @dataclass
 class Router(Endpoint):
-  def __post_init__(self):
-    for field, cls in self.__annotations__.items():
-      if issubclass(cls, Endpoint) or issubclass(cls, Router):
-        setattr(self, field, cls(base_url=self.base_url, http=self.http, default_validate=self.default_validate))
+  """Endpoints and sub-routers are created (and their modules imported) on first access.
+
+  Annotations name them: `spot: 'Spot'` is the class `Spot` of the submodule `.spot`.
+  """
+  def __getattr__(self, name: str):
+    for cls in type(self).__mro__:
+      if issubclass(cls, Router) and (annotation := cls.__dict__.get('__annotations__', {}).get(name)) is not None:
+        break
+    else:
+      raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}')
+    if isinstance(annotation, str):
+      module = importlib.import_module(f'{cls.__module__}.{name}')
+      annotation = getattr(module, annotation)
+    value = annotation(base_url=self.base_url, http=self.http, default_validate=self.default_validate)
+    setattr(self, name, value)
+    return value
 
 @dataclass
 class AuthRouter(Router, AuthEndpoint):
@@ -0,0 +1,107 @@
+from typing_extensions import Awaitable, Callable, AsyncIterator, MutableSet, TypeVar, Generic, Any, Mapping
+from datetime import datetime, timedelta
+from collections import deque
+import asyncio
+
+from .validation import TypedDict
+
+T = TypeVar('T', bound=Mapping[str, Any])
+
+Window = tuple[datetime, datetime]
+"""`[start, end)`"""
+
+def time_windows(start: datetime, end: datetime, interval: timedelta) -> list[Window]:
+  """Split `[start, end)` into consecutive windows of `interval` (the last one clamped to `end`)."""
+  windows: list[Window] = []
+  while start < end:
+    windows.append((start, min(start + interval, end)))
+    start = windows[-1][1]
+  return windows
+
+class WindowChunk(TypedDict, Generic[T]):
+  start: datetime
+  end: datetime
+  records: list[T]
+  """A page of the window's records, in the API's order"""
+
+async def page_window(
+  fetch: Callable[[datetime, datetime, str | None], Awaitable[list[T]]],
+  start: datetime, end: datetime, *, limit: int,
+) -> AsyncIterator[list[T]]:
+  """Page a time window by `id_less_than`: `fetch(start, end, id_less_than)` until a short (or empty) page.
+
+  `limit` is the page size `fetch` requests: it must not exceed the endpoint's maximum, or the window ends
+  at its first (full) page.
+  """
+  last_id: str | None = None
+  while True:
+    chunk = await fetch(start, end, last_id)
+    if chunk:
+      yield chunk
+    if len(chunk) < limit:
+      return
+    last_id = chunk[-1]['id']
+
+_Page = tuple[Window, list[T] | Exception | None]
+"""A window's page, its error, or `None` once it is done"""
+
+async def sharded_pages(
+  fetch: Callable[[datetime, datetime, str | None], Awaitable[list[T]]],
+  start: datetime, end: datetime, *,
+  interval: timedelta, limit: int,
+  concurrency: int, ordered: bool = True,
+  checkpoint: MutableSet[Window] | None = None,
+) -> AsyncIterator[WindowChunk[T]]:
+  """Page `[start, end)` as windows of `interval`, with up to `concurrency` windows in flight.
+
+  Yields pages as they arrive: each window runs at most one page ahead of the consumer.
+
+  - `fetch`: `fetch(start, end, id_less_than)` -> page of records (each with an `id`).
+  - `ordered`: Yield windows in time order (otherwise, pages of all windows in flight as they arrive).
+  - `checkpoint`: Finished windows, skipped on resume. Each window is added once its last page is processed
+    (at-least-once: the window being processed when interrupted is fetched again).
+  """
+  windows = iter([w for w in time_windows(start, end, interval) if checkpoint is None or w not in checkpoint])
+  shared: asyncio.Queue[_Page[T]] = asyncio.Queue(concurrency)
+  queues: deque[asyncio.Queue[_Page[T]]] = deque() # in time order, if ordered
+  tasks: set[asyncio.Task] = set()
+
+  async def page(window: Window, queue: asyncio.Queue[_Page[T]]):
+    try:
+      async for records in page_window(fetch, *window, limit=limit):
+        await queue.put((window, records))
+    except Exception as e:
+      await queue.put((window, e))
+    else:
+      await queue.put((window, None))
+
+  def start_next() -> bool:
+    if (window := next(windows, None)) is None:
+      return False
+    queue = shared
+    if ordered:
+      queue = asyncio.Queue(1)
+      queues.append(queue)
+    task = asyncio.ensure_future(page(window, queue))
+    tasks.add(task)
+    task.add_done_callback(tasks.discard)
+    return True
+
+  try:
+    active = sum(start_next() for _ in range(concurrency))
+    while active:
+      window, records = await (queues[0] if ordered else shared).get()
+      if isinstance(records, Exception):
+        raise records
+      if records is not None:
+        yield {'start': window[0], 'end': window[1], 'records': records}
+        continue
+      if ordered:
+        queues.popleft()
+      if checkpoint is not None:
+        checkpoint.add(window)
+      active += start_next() - 1
+  finally:
+    for task in tasks:
+      task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,23 +1,131 @@
-from datetime import datetime, timedelta
-from collections import defaultdict
+from typing_extensions import Callable, Awaitable, TypeVar, ParamSpec, Concatenate
+from dataclasses import dataclass, field
+from collections import deque
+from contextvars import ContextVar
+from datetime import timedelta
 from functools import wraps
 import asyncio
+import time
 
-def rate_limit(max_freq: timedelta):
-  def decorator(fn):
-    lasts: defaultdict[str, datetime] = defaultdict(lambda: datetime.min)
+P = ParamSpec('P')
+R = TypeVar('R')
+S = TypeVar('S')
+
+@dataclass
+class Bucket:
+  """Sliding-window limit: at most `limit` requests in any `period` seconds.
+
+  Slots are reserved synchronously, so concurrent callers are served in call order,
+  the first `limit` go through at once and the rest are spaced to the exact allowed rate.
+
+  Server feedback adapts the limit: `throttle` pauses and halves it, `recover` grows it back one step per period.
+  """
+  limit: int
+  period: float
+  base_limit: int = field(init=False, repr=False)
+  slots: deque[float] = field(init=False, repr=False)
+  paused_until: float = field(default=0, init=False, repr=False)
+  changed_at: float = field(default=0, init=False, repr=False)
+
+  def __post_init__(self):
+    self.base_limit = self.limit
+    self.slots = deque(maxlen=self.limit)
+
+  def reserve(self) -> float:
+    """Reserve the next slot. Returns the delay (in seconds) until it may be used."""
+    now = time.monotonic()
+    at = max(now, self.paused_until)
+    if len(self.slots) == self.limit:
+      at = max(at, self.slots[0] + self.period)
+    self.slots.append(at)
+    return at - now
+
+  def try_acquire(self) -> bool:
+    """Take a slot only if one is free right now."""
+    now = time.monotonic()
+    if now < self.paused_until or (len(self.slots) == self.limit and self.slots[0] + self.period > now):
+      return False
+    self.slots.append(now)
+    return True
+
+  async def acquire(self) -> float:
+    """Wait for the next slot, and for any pause set meanwhile (`throttle`, `observe_remaining`). Returns the time waited (in seconds)."""
+    waited = 0.0
+    delay = self.reserve()
+    while delay > 0:
+      await asyncio.sleep(delay)
+      waited += delay
+      delay = self.paused_until - time.monotonic()
+    return waited
+
+  def _resize(self, limit: int):
+    self.limit = limit
+    self.slots = deque(self.slots, maxlen=limit)
+    self.changed_at = time.monotonic()
+
+  def throttle(self, delay: float | None = None):
+    """Back off after a rate-limit response: pause for `delay` seconds (default: one period) and halve the limit.
+
+    The limit is halved once per pause: the other in-flight requests rejected meanwhile only extend it.
+    """
+    now = time.monotonic()
+    pause = self.period if delay is None else delay
+    paused = now < self.paused_until
+    self.paused_until = max(self.paused_until, now + pause)
+    if not paused:
+      self._resize(max(1, self.limit // 2))
+
+  def recover(self):
+    """Record a successful response: grow a throttled limit back by one per period."""
+    if self.limit < self.base_limit and time.monotonic() - self.changed_at >= self.period:
+      self._resize(self.limit + 1)
+
+  def observe_remaining(self, remaining: int):
+    """Record the server-reported remaining quota: pause for a period once it's exhausted."""
+    if remaining <= 0:
+      self.paused_until = max(self.paused_until, time.monotonic() + self.period)
+
+@dataclass
+class RateLimiter:
+  """Registry of `Bucket`s by limit key.
+
+  Every endpoint of a `Router` tree shares its `HttpClient`, hence its limiter: one limiter per UID.
+  Pass the same limiter to several clients to enforce IP-wide limits.
+  """
+  buckets: dict[str, Bucket] = field(default_factory=dict)
+
+  def bucket(self, key: str, *, limit: int, period: float) -> Bucket:
+    if (bucket := self.buckets.get(key)) is None:
+      bucket = self.buckets[key] = Bucket(limit, period)
+    return bucket
+
+_current_bucket: ContextVar[Bucket | None] = ContextVar('bitget_bucket', default=None)
+
+def current_bucket() -> Bucket | None:
+  """Bucket of the rate-limited endpoint being called, if any. Acquired by `HttpClient.request` right before sending."""
+  return _current_bucket.get()
+
+def rate_limit(max_freq: timedelta, *, key: str | None = None, burst: int | None = None):
+  """Limit an endpoint method to one call per `max_freq`, on average.
+
+  - `max_freq`: Minimum average time between calls, e.g. `timedelta(seconds=1/20)` for Bitget's "20 times/1s".
+  - `key`: Limit group. Endpoints with the same key share the limit (default: the method's qualified name).
+  - `burst`: Calls allowed at once (default: one second worth of calls, matching Bitget's per-second windows).
+  """
+  interval = max_freq.total_seconds()
+  limit = burst or max(1, round(1 / interval))
+
+  def decorator(fn: Callable[Concatenate[S, P], Awaitable[R]]) -> Callable[Concatenate[S, P], Awaitable[R]]:
+    bucket_key = key or f'{fn.__module__}.{fn.__qualname__}'
 
     @wraps(fn)
-    async def wrapper(self, *args, **kwargs):
-      nonlocal lasts
-      key = str(id(self))
-      diff = datetime.now() - lasts[key]
-      delay = (max_freq - diff).total_seconds()
-      if delay > 0:
-        await asyncio.sleep(delay)
-      r = await fn(self, *args, **kwargs)
-      lasts[key] = datetime.now()
-      return r
+    async def wrapper(self, *args: P.args, **kwargs: P.kwargs) -> R:
+      bucket = self.http.limiter.bucket(bucket_key, limit=limit, period=limit*interval) # type: ignore
+      token = _current_bucket.set(bucket)
+      try:
+        return await fn(self, *args, **kwargs)
+      finally:
+        _current_bucket.reset(token)
 
     return wrapper
   return decorator
@@ -0,0 +1,100 @@
+from typing_extensions import Awaitable, Callable, TypeVar
+from dataclasses import dataclass, field
+import asyncio
+import random
+import uuid
+import httpx
+
+from .exc import NetworkError, ApiError
+
+T = TypeVar('T')
+
+RETRY_STATUSES = frozenset({502, 503, 504})
+UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+"""Failures before the request left: safe to resend, whatever the endpoint"""
+
+@dataclass
+class RetryPolicy:
+  """Retries of transient failures (network errors, HTTP 502/503/504), with jittered exponential backoff
+  and a retry budget. Opt-in: `Bitget.new(retry=RetryPolicy())`.
+
+  Safe requests (`GET`, and `idempotent` paths) are retried on any transient failure. Others (e.g. placing
+  an order) only if they never left (e.g. connection errors): a timeout after sending, or a 502/503/504,
+  may still have reached the exchange. Those raise `NetworkError`, and `place_order` resolves them by
+  `clientOid` (see `resubmit`).
+
+  - `retries`: Maximum retries per request.
+  - `base`, `cap`: Backoff before retry `n`: random, between 0 and `min(cap, base * 2**n)` seconds.
+  - `budget`: Retries earned per request. Caps the extra load when everything fails (0.2 = at most +20%).
+  - `reserve`: Retries available at once (and to start with).
+  - `idempotent`: Non-`GET` paths safe to resend, e.g. `{'/api/v2/spot/trade/cancel-order'}`.
+  """
+  retries: int = 3
+  base: float = 0.1
+  cap: float = 5.0
+  budget: float = 0.2
+  reserve: float = 10
+  idempotent: frozenset[str] = frozenset()
+  tokens: float = field(init=False, repr=False)
+
+  def __post_init__(self):
+    self.tokens = self.reserve
+
+  def safe(self, method: str, path: str) -> bool:
+    return method in ('GET', 'HEAD') or path in self.idempotent
+
+  def retryable(self, safe: bool, error: httpx.HTTPError | None = None, status: int | None = None) -> bool:
+    """Whether a failure (a network `error` or a response `status`) may be retried."""
+    if error is not None:
+      return isinstance(error, UNSENT_ERRORS) or (safe and isinstance(error, httpx.TransportError))
+    return safe and status in RETRY_STATUSES
+
+  def backoff(self, attempt: int) -> float:
+    """Delay before retry `attempt` (from 1), in seconds ("full jitter")."""
+    return random.uniform(0, min(self.cap, self.base * 2**attempt))
+
+  def deposit(self):
+    """Earn budget for a new request."""
+    self.tokens = min(self.reserve, self.tokens + self.budget)
+
+  def withdraw(self) -> bool:
+    """Spend budget for a retry. `False` if exhausted."""
+    if self.tokens < 1:
+      return False
+    self.tokens -= 1
+    return True
+
+def new_client_oid() -> str:
+  return uuid.uuid4().hex
+
+def maybe_sent(e: NetworkError) -> bool:
+  """Whether a failed request may have reached the exchange (e.g. a timeout waiting for the response)."""
+  return not isinstance(e.__cause__, UNSENT_ERRORS)
+
+async def resubmit(send: Callable[[], Awaitable[T]], lookup: Callable[[], Awaitable[T | None]], policy: RetryPolicy) -> T:
+  """Send a non-idempotent request identified by a client ID (e.g. an order's `clientOid`), without applying it twice.
+
+  After a failure that may have reached the exchange, `lookup()` checks whether the request took effect
+  (returning its result) before sending it again. A resend racing an order that wasn't visible yet is
+  rejected by the exchange as a duplicate `clientOid`, and looked up again.
+  """
+  attempt = 0
+  ambiguous = False
+  while True:
+    try:
+      return await send()
+    except NetworkError as e:
+      if not maybe_sent(e): # already retried by the client
+        raise
+      error: NetworkError | ApiError = e
+      ambiguous = True
+    except ApiError as e:
+      if not ambiguous:
+        raise
+      error = e # e.g. duplicate clientOid
+    if (result := await lookup()) is not None:
+      return result
+    if isinstance(error, ApiError) or attempt >= policy.retries or not policy.withdraw():
+      raise error
+    attempt += 1
+    await asyncio.sleep(policy.backoff(attempt))
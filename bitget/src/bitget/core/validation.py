@@ -1,27 +1,42 @@
 from typing_extensions import TypeVar, Generic, Any, is_typeddict, TypedDict as _TypedDict, Annotated
 from dataclasses import dataclass, field, is_dataclass
-from pydantic import with_config, ConfigDict, BeforeValidator
+from functools import cached_property
 from datetime import datetime
 
 from .exc import ValidationError
 from .util import timestamp as ts
 
-@with_config(ConfigDict(extra='allow'))
+# pydantic is only imported once a validator is first used: configs are plain dicts,
+# and `Timestamp` builds its schema on demand (like `BeforeValidator(ts.parse)`)
+
 class TypedDict(_TypedDict):
   ...
 
-Timestamp = Annotated[datetime, BeforeValidator(ts.parse)]
+TypedDict.__pydantic_config__ = {'extra': 'allow'} # type: ignore
+
+class _ParseTimestamp:
+  @staticmethod
+  def __get_pydantic_core_schema__(source, handler):
+    from pydantic_core import core_schema
+    return core_schema.no_info_before_validator_function(ts.parse, handler(source))
+
+Timestamp = Annotated[datetime, _ParseTimestamp()]
 
 T = TypeVar('T')
 
 class validator(Generic[T]):
 
   def __init__(self, Type: type[T]):
-    from pydantic import TypeAdapter, ConfigDict
     is_record = is_dataclass(Type) or is_typeddict(Type)
     if is_record and not hasattr(Type, '__pydantic_config__'):
-      setattr(Type, '__pydantic_config__', ConfigDict(extra='forbid'))
-    self.adapter = TypeAdapter(Type)
+      setattr(Type, '__pydantic_config__', {'extra': 'forbid'})
+    self.Type = Type
+
+  @cached_property
+  def adapter(self):
+    """Built on first use: most validators of an import are never needed."""
+    from pydantic import TypeAdapter
+    return TypeAdapter(self.Type)
     
   def json(self, data: str | bytes | bytearray) -> T:
     from pydantic import ValidationError as PydanticValidationError
@@ -1,8 +1,11 @@
+from typing_extensions import TYPE_CHECKING
 from bitget.core import AuthRouter
-from .account import Account
-from .savings import Savings
+
+if TYPE_CHECKING:
+  from .account import Account
+  from .savings import Savings
 
 
 class Earn(AuthRouter):
-  account: Account
-  savings: Savings
\ No newline at end of file
+  account: 'Account'
+  savings: 'Savings'
\ No newline at end of file
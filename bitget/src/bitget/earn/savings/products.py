@@ -67,4 +67,4 @@ class Products(AuthEndpoint):
     if filter is not None:
       params['filter'] = filter
     r = await self.authed_request('GET', '/api/v2/earn/savings/product', params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
@@ -0,0 +1 @@
+from .sinks import Sink, NDJSONSink, CSVSink, ParquetSink, export, schema
@@ -0,0 +1,237 @@
+"""Incremental writers for paginated records: NDJSON, CSV and Parquet.
+
+Column types come from the endpoints' `TypedDict`s (see `schema`). Rows are written chunk by chunk,
+so memory stays bounded by a chunk (or a Parquet row group), whatever the export size.
+"""
+from typing_extensions import (
+  TYPE_CHECKING, Any, AsyncIterable, Literal, Mapping, Sequence, Union,
+  get_args, get_origin, get_type_hints, is_typeddict,
+)
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import Context, Decimal
+from pathlib import Path
+import types
+import csv
+import io
+
+import orjson
+
+from bitget.core import timestamp as ts, UserError, WindowChunk
+
+if TYPE_CHECKING:
+  import pyarrow as pa
+
+def _pyarrow():
+  try:
+    import pyarrow
+    import pyarrow.parquet
+  except ImportError as e:
+    raise UserError('Parquet exports require pyarrow: `pip install typed-bitget[parquet]`') from e
+  return pyarrow
+
+ColumnType = Literal['string', 'int', 'float', 'bool', 'decimal', 'timestamp', 'json']
+
+def _column_type(t: Any) -> ColumnType:
+  if get_origin(t) is not None and hasattr(t, '__metadata__'): # Annotated, e.g. `Timestamp`
+    return _column_type(get_args(t)[0])
+  if get_origin(t) in (Union, types.UnionType):
+    # e.g. `Decimal | None | Literal['']`: the "empty" members become nulls
+    members = [a for a in get_args(t) if a is not type(None) and a != Literal['']]
+    return _column_type(members[0]) if len(members) == 1 else 'string'
+  if get_origin(t) is Literal:
+    values = get_args(t)
+    return 'bool' if all(isinstance(v, bool) for v in values) else 'string'
+  if t is Decimal:
+    return 'decimal'
+  if t is datetime:
+    return 'timestamp'
+  if t is bool:
+    return 'bool'
+  if t is int:
+    return 'int'
+  if t is float:
+    return 'float'
+  if t is str:
+    return 'string'
+  return 'json' # lists, nested records, etc.
+
+def schema(Type: type) -> dict[str, ColumnType]:
+  """Column types of a record `TypedDict`, e.g. `schema(Fill)`."""
+  if not is_typeddict(Type):
+    raise UserError(f'Expected a TypedDict, got {Type!r}')
+  return {name: _column_type(t) for name, t in get_type_hints(Type, include_extras=True).items()}
+
+def _utc(dt: datetime) -> datetime:
+  return dt.astimezone(timezone.utc) # naive datetimes (as parsed) are local time
+
+def _default(obj: Any):
+  if isinstance(obj, Decimal):
+    return str(obj)
+  if isinstance(obj, datetime):
+    return _utc(obj).isoformat()
+  raise TypeError
+
+def _json(value: Any) -> str:
+  return orjson.dumps(value, default=_default, option=orjson.OPT_PASSTHROUGH_DATETIME).decode()
+
+def _cell(kind: ColumnType, value: Any) -> Any:
+  """Normalize a value (validated or raw) to its column type, or `None`."""
+  if value is None or value == '':
+    return None
+  if kind == 'decimal':
+    return value if isinstance(value, Decimal) else Decimal(value)
+  if kind == 'timestamp':
+    return _utc(value if isinstance(value, datetime) else ts.parse(value))
+  if kind == 'int':
+    return int(value)
+  if kind == 'float':
+    return float(value)
+  if kind == 'bool':
+    return value if isinstance(value, bool) else str(value).lower() in ('true', 'yes')
+  if kind == 'json':
+    return _json(value)
+  return str(value)
+
+class Sink(ABC):
+  """Destination for record chunks. Use as a context manager, or call `close()`."""
+  @abstractmethod
+  def write(self, rows: Sequence[Mapping[str, Any]]):
+    ...
+
+  def close(self):
+    ...
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *_):
+    self.close()
+
+@dataclass
+class NDJSONSink(Sink):
+  """One JSON object per line. With a `Type`, only its fields are written.
+
+  Decimals are written as strings, timestamps as ISO 8601 (UTC).
+  """
+  path: Path | str
+  Type: type | None = None
+  file: io.BufferedWriter = field(init=False, repr=False)
+
+  def __post_init__(self):
+    self.columns = None if self.Type is None else schema(self.Type)
+    self.file = open(self.path, 'wb')
+
+  def write(self, rows: Sequence[Mapping[str, Any]]):
+    if self.columns is not None:
+      rows = [{k: row.get(k) for k in self.columns} for row in rows]
+    self.file.writelines(
+      orjson.dumps(row, default=_default, option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_APPEND_NEWLINE)
+      for row in rows
+    )
+
+  def close(self):
+    self.file.close()
+
+@dataclass
+class CSVSink(Sink):
+  """CSV with a header row, columns as declared in `Type`. Nested values are written as JSON; timestamps as ISO 8601 (UTC)."""
+  path: Path | str
+  Type: type
+  file: io.TextIOWrapper = field(init=False, repr=False)
+
+  def __post_init__(self):
+    self.columns = schema(self.Type)
+    self.file = open(self.path, 'w', newline='')
+    self.writer = csv.writer(self.file)
+    self.writer.writerow(self.columns)
+
+  def write(self, rows: Sequence[Mapping[str, Any]]):
+    self.writer.writerows(
+      [_csv_cell(kind, row.get(k)) for k, kind in self.columns.items()]
+      for row in rows
+    )
+
+  def close(self):
+    self.file.close()
+
+def _csv_cell(kind: ColumnType, value: Any) -> Any:
+  value = _cell(kind, value)
+  return value.isoformat() if isinstance(value, datetime) else value
+
+DECIMAL_SCALE = Decimal('1E-18')
+_DECIMAL_CONTEXT = Context(prec=38)
+
+def _parquet_cell(kind: ColumnType, value: Any) -> Any:
+  value = _cell(kind, value)
+  if kind == 'decimal' and value is not None: # decimal128(38, 18) can't hold more places
+    return value.quantize(DECIMAL_SCALE, context=_DECIMAL_CONTEXT)
+  return value
+
+@dataclass
+class ParquetSink(Sink):
+  """Parquet file with a typed schema derived from `Type`, written one row group at a time.
+
+  Decimals are `decimal128(38, 18)`, rounded (half-even) to 18 decimal places. Timestamps are
+  `timestamp[ms, UTC]`, nested values are JSON strings. Requires `pyarrow`.
+  """
+  path: Path | str
+  Type: type
+  row_group_size: int = field(default=100_000, kw_only=True)
+  buffer: list[list[Any]] = field(init=False, repr=False)
+
+  def __post_init__(self):
+    pa = _pyarrow()
+    self.columns = schema(self.Type)
+    self.schema = pa.schema([(k, self._arrow_type(kind)) for k, kind in self.columns.items()])
+    self.writer = pa.parquet.ParquetWriter(str(self.path), self.schema)
+    self.buffer = [[] for _ in self.columns]
+    self.buffered = 0
+
+  @staticmethod
+  def _arrow_type(kind: ColumnType) -> 'pa.DataType':
+    pa = _pyarrow()
+    return {
+      'string': pa.string(), 'json': pa.string(), 'int': pa.int64(), 'float': pa.float64(), 'bool': pa.bool_(),
+      'decimal': pa.decimal128(38, 18), 'timestamp': pa.timestamp('ms', tz='UTC'),
+    }[kind]
+
+  def write(self, rows: Sequence[Mapping[str, Any]]):
+    for column, (k, kind) in zip(self.buffer, self.columns.items()):
+      column.extend(_parquet_cell(kind, row.get(k)) for row in rows)
+    self.buffered += len(rows)
+    if self.buffered >= self.row_group_size:
+      self.flush()
+
+  def flush(self):
+    if self.buffered == 0:
+      return
+    pa = _pyarrow()
+    self.writer.write_table(pa.Table.from_arrays(
+      [pa.array(column, type=t) for column, t in zip(self.buffer, self.schema.types)],
+      schema=self.schema,
+    ))
+    self.buffer = [[] for _ in self.columns]
+    self.buffered = 0
+
+  def close(self):
+    self.flush()
+    self.writer.close()
+
+async def export(pager: AsyncIterable[Sequence[Mapping[str, Any]] | WindowChunk], sink: Sink) -> int:
+  """Write every chunk of `pager` (any `*_paged` or `*_sharded` generator) to `sink`, then close it.
+  Returns the number of rows.
+
+  ```python
+  n = await export(client.spot.trade.fills_paged(symbol='BTCUSDT'), ParquetSink('fills.parquet', Fill))
+  n = await export(client.common.tax.spot_transaction_records_sharded(start=start, end=end), CSVSink('tax.csv', SpotTransaction))
+  ```
+  """
+  rows = 0
+  with sink:
+    async for chunk in pager:
+      records = chunk['records'] if isinstance(chunk, Mapping) else chunk
+      sink.write(records)
+      rows += len(records)
+  return rows
@@ -1,11 +1,14 @@
+from typing_extensions import TYPE_CHECKING
 from bitget.core import AuthRouter
-from .account import Account
-from .market import Market
-from .position import Position
-from .trade import Trade
+
+if TYPE_CHECKING:
+  from .account import Account
+  from .market import Market
+  from .position import Position
+  from .trade import Trade
 
 class Futures(AuthRouter):
-  account: Account
-  market: Market
-  position: Position
-  trade: Trade
\ No newline at end of file
+  account: 'Account'
+  market: 'Market'
+  position: 'Position'
+  trade: 'Trade'
\ No newline at end of file
@@ -75,4 +75,4 @@ class AccountList(AuthEndpoint):
     r = await self.authed_request('GET', '/api/v2/mix/account/accounts', params={
       'productType': product_type,
     })
-    return self.output(r.text, validate_response, validate=validate)
\ No newline at end of file
+    return self.output(r.content, validate_response, validate=validate)
\ No newline at end of file
@@ -67,4 +67,4 @@ class Bills(AuthEndpoint):
         if limit is not None:
             params['limit'] = str(limit)
         r = await self.authed_request('GET', '/api/v2/mix/account/bill', params=params)
-        return self.output(r.text, validate_response, validate=validate)
+        return self.output(r.content, validate_response, validate=validate)
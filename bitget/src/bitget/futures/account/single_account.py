@@ -56,4 +56,4 @@ class SingleAccountEndpoint(AuthEndpoint):
             'symbol': symbol,
             'marginCoin': margin_coin,
         })
-        return self.output(r.text, validate_response, validate=validate)
+        return self.output(r.content, validate_response, validate=validate)
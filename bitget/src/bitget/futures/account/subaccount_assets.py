@@ -37,4 +37,4 @@ class SubaccountAssets(AuthEndpoint):
     r = await self.authed_request('GET', '/api/v2/mix/account/sub-account-assets', params={
       'productType': product_type,
     })
-    return self.output(r.text, validate_response, validate=validate)
\ No newline at end of file
+    return self.output(r.content, validate_response, validate=validate)
\ No newline at end of file
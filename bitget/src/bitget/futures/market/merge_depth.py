@@ -3,7 +3,10 @@ from typing_extensions import Literal
 from dataclasses import dataclass
 from decimal import Decimal
 
+import httpx
+
 from bitget.core import Endpoint, validator, TypedDict, Timestamp
+from bitget.core.columnar import BookColumns, book_columns
 
 class MergeDepthData(TypedDict):
     asks: list[list[Decimal]]
@@ -23,6 +26,16 @@ validate_response = validator(MergeDepthData)
 
 @dataclass
 class MergeDepth(Endpoint):
+    async def _merge_depth(
+        self, product_type: str, symbol: str, precision: str | None, limit: str | None
+    ) -> httpx.Response:
+        params = {'productType': product_type, 'symbol': symbol}
+        if precision is not None:
+            params['precision'] = precision
+        if limit is not None:
+            params['limit'] = limit
+        return await self.request('GET', '/api/v2/mix/market/merge-depth', params=params)
+
     async def merge_depth(
         self,
         product_type: Literal['USDT-FUTURES', 'COIN-FUTURES', 'USDC-FUTURES'],
@@ -42,10 +55,20 @@ class MergeDepth(Endpoint):
 
         > [Bitget API docs](https://www.bitget.com/api-doc/contract/market/Get-Merge-Depth)
         """
-        params = {'productType': product_type, 'symbol': symbol}
-        if precision is not None:
-            params['precision'] = precision
-        if limit is not None:
-            params['limit'] = limit
-        r = await self.request('GET', '/api/v2/mix/market/merge-depth', params=params)
-        return self.output(r.text, validate_response, validate=validate)
+        r = await self._merge_depth(product_type, symbol, precision, limit)
+        return self.output(r.content, validate_response, validate=validate)
+
+    async def merge_depth_columnar(
+        self,
+        product_type: Literal['USDT-FUTURES', 'COIN-FUTURES', 'USDC-FUTURES'],
+        symbol: str,
+        *,
+        precision: Literal['scale0', 'scale1', 'scale2', 'scale3'] | None = None,
+        limit: Literal['1', '5', '15', '50', 'max'] | None = None,
+    ) -> BookColumns:
+        """Like `merge_depth`, but as NumPy price/size arrays per side instead of nested lists. Requires `numpy`.
+
+        > [Bitget API docs](https://www.bitget.com/api-doc/contract/market/Get-Merge-Depth)
+        """
+        r = await self._merge_depth(product_type, symbol, precision, limit)
+        return book_columns(self.output(r.content, validate_response, validate=False))
@@ -1,7 +1,9 @@
 from typing_extensions import Literal
 from dataclasses import dataclass
+from datetime import timedelta
+import asyncio
 
-from bitget.core import Endpoint, validator, TypedDict
+from bitget.core import Endpoint, validator, TypedDict, cached
 
 class Symbol(TypedDict):
   symbol: str
@@ -81,6 +83,7 @@ validate_response = validator(list[Symbol])
 
 @dataclass
 class Symbols(Endpoint):
+  @cached(timedelta(minutes=5))
   async def symbols(
     self, product_type: Literal['USDT-FUTURES', 'COIN-FUTURES', 'USDC-FUTURES'],
     *,
@@ -99,19 +102,38 @@ class Symbols(Endpoint):
     if symbol is not None:
       params['symbol'] = symbol
     r = await self.request('GET', '/api/v2/mix/market/contracts', params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
 
   async def all_symbols(self, *, validate: bool | None = None) -> list[Symbol]:
-    """Get futures contract configuration information for all product types.
+    """Get futures contract configuration information for all product types (fetched concurrently).
 
     - `validate`: Whether to validate the response against the expected schema (default: True).
 
     https://www.bitget.com/api-doc/contract/market/Get-All-Symbols-Contracts
     """
-    symbols: list[Symbol] = []
-    for product_type in ('USDT-FUTURES', 'COIN-FUTURES', 'USDC-FUTURES'):
-      symbols.extend(await self.symbols(product_type, validate=validate))
-    return symbols
+    results = await asyncio.gather(*(
+      self.symbols(product_type, validate=validate)
+      for product_type in ('USDT-FUTURES', 'COIN-FUTURES', 'USDC-FUTURES')
+    ))
+    return [s for symbols in results for s in symbols]
+
+  async def symbols_index(
+    self, product_type: Literal['USDT-FUTURES', 'COIN-FUTURES', 'USDC-FUTURES'] | None = None,
+    *,
+    validate: bool | None = None
+  ) -> dict[str, Symbol]:
+    """Futures contracts by symbol (indexes `symbols`, so it follows its cache entry).
+
+    - `productType`: Product type, or all of them if not given.
+    - `validate`: Whether to validate the response against the expected schema (default: True).
+
+    https://www.bitget.com/api-doc/contract/market/Get-All-Symbols-Contracts
+    """
+    if product_type is None:
+      symbols = await self.all_symbols(validate=validate)
+    else:
+      symbols = await self.symbols(product_type, validate=validate)
+    return {s['symbol']: s for s in symbols}
 
   async def symbol(
     self, 
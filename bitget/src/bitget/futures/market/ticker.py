@@ -70,4 +70,4 @@ class Ticker(Endpoint):
             'productType': product_type,
             'symbol': symbol,
         })
-        return self.output(r.text, validate_response, validate=validate)
+        return self.output(r.content, validate_response, validate=validate)
@@ -45,4 +45,4 @@ class Tickers(Endpoint):
         > [Bitget API docs](https://www.bitget.com/api-doc/contract/market/Get-All-Symbol-Ticker)
         """
         r = await self.request('GET', '/api/v2/mix/market/tickers', params={'productType': product_type})
-        return self.output(r.text, validate_response, validate=validate)
+        return self.output(r.content, validate_response, validate=validate)
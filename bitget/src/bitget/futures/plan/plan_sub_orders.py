@@ -15,4 +15,4 @@ class PlanSubOrders(AuthEndpoint):
     async def plan_sub_orders(self, product_type, plan_type, plan_order_id, *, validate=None):
         params = {"productType": product_type, "planType": plan_type, "planOrderId": plan_order_id}
         r = await self.authed_request("GET", "/api/v2/mix/order/plan-sub-order", params=params)
-        return self.output(r.text, validate_response, validate=validate)
+        return self.output(r.content, validate_response, validate=validate)
@@ -100,4 +100,4 @@ class AllPositions(AuthEndpoint):
     if margin_coin is not None:
       params['marginCoin'] = margin_coin
     r = await self.authed_request('GET', '/api/v2/mix/position/all-position', params=params)
-    return self.output(r.text, validate_response, validate=validate)
\ No newline at end of file
+    return self.output(r.content, validate_response, validate=validate)
\ No newline at end of file
@@ -5,7 +5,14 @@ from .orders_history import OrdersHistory
 from .fill_history import FillHistory
 from .place_order import PlaceOrder
 from .cancel_order import CancelOrder
+from .batch_place_order import BatchPlaceOrder
+from .batch_cancel_orders import BatchCancelOrders
+from .cancel_all_orders import CancelAllOrders
+from .modify_order import ModifyOrder
 
-class Trade(Fills, OrderDetailEndpoint, OrdersPending, OrdersHistory, FillHistory, PlaceOrder, CancelOrder):
+class Trade(
+  Fills, OrderDetailEndpoint, OrdersPending, OrdersHistory, FillHistory, PlaceOrder, CancelOrder,
+  BatchPlaceOrder, BatchCancelOrders, CancelAllOrders, ModifyOrder,
+):
   ...
 
@@ -0,0 +1,76 @@
+from typing_extensions import Literal, NotRequired, Sequence
+from dataclasses import dataclass
+from datetime import timedelta
+import asyncio
+
+from bitget.core import AuthEndpoint, validator, TypedDict, rate_limit
+from bitget.core.bulk import BulkOrderResult, chunked, merge_results
+from .batch_place_order import BatchOrderData, ProductType
+
+class CancelOrderInput(TypedDict):
+    orderId: NotRequired[str]
+    clientOid: NotRequired[str]
+    symbol: NotRequired[str]  # required in bulk_cancel_orders only
+
+validate_response = validator(BatchOrderData)
+
+@dataclass
+class BatchCancelOrders(AuthEndpoint):
+    @rate_limit(timedelta(seconds=0.1))
+    async def batch_cancel_orders(
+        self,
+        product_type: ProductType,
+        symbol: str,
+        order_id_list: Sequence[CancelOrderInput],
+        *,
+        margin_coin: str | None = None,
+        validate: bool | None = None
+    ) -> BatchOrderData:
+        """Cancel up to 50 orders on one symbol. Use symbol=USDCUSDT only (per project convention).
+
+        - `product_type`: Product type.
+        - `symbol`: Trading pair, e.g. `'USDCUSDT'`.
+        - `order_id_list`: Orders to cancel (max 50), each by `orderId` or `clientOid`.
+        - `margin_coin`: Margin coin (capitalized), e.g. `'USDT'`.
+        - `validate`: Whether to validate the response (default: True).
+
+        > [Bitget API docs](https://www.bitget.com/api-doc/contract/trade/Batch-Cancel-Orders)
+        """
+        json = {"symbol": symbol, "productType": product_type, "orderIdList": order_id_list}
+        if margin_coin is not None:
+            json["marginCoin"] = margin_coin
+        r = await self.authed_request("POST", "/api/v2/mix/order/batch-cancel-orders", json=json)
+        return self.output(r.content, validate_response, validate=validate)
+
+    async def bulk_cancel_orders(
+        self,
+        product_type: ProductType,
+        orders: Sequence[CancelOrderInput],
+        *,
+        margin_coin: str | None = None,
+        validate: bool | None = None
+    ) -> list[BulkOrderResult]:
+        """Cancel any number of orders, across symbols, in as few batch requests as possible.
+
+        Orders are grouped by symbol and sent in chunks of 50, dispatched concurrently at the endpoint's rate limit.
+        A chunk that fails as a whole (e.g. a network error) reports its orders as failed with the error message.
+
+        - `product_type`: Product type.
+        - `orders`: Orders to cancel, each with its `symbol` and `orderId` or `clientOid`.
+        - `margin_coin`: Margin coin (capitalized), e.g. `'USDT'`.
+        - `validate`: Whether to validate the responses (default: True).
+
+        Returns one result per order, in input order (failed ones have an `errorMsg`).
+
+        > [Bitget API docs](https://www.bitget.com/api-doc/contract/trade/Batch-Cancel-Orders)
+        """
+        chunks = chunked(orders, by=lambda o: o["symbol"]) # type: ignore
+        responses = await asyncio.gather(*(
+            self.batch_cancel_orders(
+                product_type, chunk[0]["symbol"], # type: ignore
+                [{k: v for k, v in o.items() if k != "symbol"} for o in chunk], # type: ignore
+                margin_coin=margin_coin, validate=validate,
+            )
+            for chunk in chunks
+        ), return_exceptions=True)
+        return merge_results(orders, chunks, responses)
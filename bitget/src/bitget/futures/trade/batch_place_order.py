@@ -0,0 +1,109 @@
+from typing_extensions import Literal, NotRequired, Sequence
+from dataclasses import dataclass
+from datetime import timedelta
+import asyncio
+
+from bitget.core import AuthEndpoint, validator, TypedDict, rate_limit, new_client_oid
+from bitget.core.bulk import BulkOrderResult, chunked, merge_results
+
+ProductType = Literal["USDT-FUTURES", "COIN-FUTURES", "USDC-FUTURES"]
+
+class BatchOrderInput(TypedDict):
+    size: str
+    side: Literal["buy", "sell"]
+    orderType: Literal["limit", "market"]
+    price: NotRequired[str]
+    tradeSide: NotRequired[Literal["open", "close"]]
+    force: NotRequired[Literal["gtc", "post_only", "fok", "ioc"]]
+    clientOid: NotRequired[str]
+    reduceOnly: NotRequired[Literal["YES", "NO"]]
+    presetStopSurplusPrice: NotRequired[str]
+    presetStopLossPrice: NotRequired[str]
+
+class BulkOrderInput(BatchOrderInput):
+    symbol: str
+
+class BatchOrderSuccessItem(TypedDict):
+    orderId: str
+    clientOid: str
+
+class BatchOrderFailureItem(TypedDict):
+    orderId: str
+    clientOid: str
+    errorMsg: str
+    errorCode: NotRequired[str]
+
+class BatchOrderData(TypedDict):
+    successList: list[BatchOrderSuccessItem]
+    failureList: list[BatchOrderFailureItem]
+
+validate_response = validator(BatchOrderData)
+
+@dataclass
+class BatchPlaceOrder(AuthEndpoint):
+    @rate_limit(timedelta(seconds=0.2))
+    async def batch_place_order(
+        self,
+        product_type: ProductType,
+        symbol: str,
+        margin_mode: Literal["isolated", "crossed"],
+        margin_coin: str,
+        order_list: Sequence[BatchOrderInput],
+        *,
+        validate: bool | None = None
+    ) -> BatchOrderData:
+        """Place up to 50 orders on one symbol. Use symbol=USDCUSDT only (per project convention).
+
+        - `product_type`: Product type.
+        - `symbol`: Trading pair, e.g. `'USDCUSDT'`.
+        - `margin_mode`: Margin mode.
+        - `margin_coin`: Margin coin (capitalized), e.g. `'USDT'`.
+        - `order_list`: Orders (max 50).
+        - `validate`: Whether to validate the response (default: True).
+
+        > [Bitget API docs](https://www.bitget.com/api-doc/contract/trade/Batch-Order)
+        """
+        json = {
+            "symbol": symbol, "productType": product_type, "marginMode": margin_mode,
+            "marginCoin": margin_coin, "orderList": order_list,
+        }
+        r = await self.authed_request("POST", "/api/v2/mix/order/batch-place-order", json=json)
+        return self.output(r.content, validate_response, validate=validate)
+
+    async def bulk_place_orders(
+        self,
+        product_type: ProductType,
+        margin_mode: Literal["isolated", "crossed"],
+        margin_coin: str,
+        orders: Sequence[BulkOrderInput],
+        *,
+        validate: bool | None = None
+    ) -> list[BulkOrderResult]:
+        """Place any number of orders, across symbols, in as few batch requests as possible.
+
+        Orders are grouped by symbol and sent in chunks of 50, dispatched concurrently at the endpoint's rate limit.
+        Orders without `clientOid` get a random one, so every result can be matched (and looked up later).
+        A chunk that fails as a whole (e.g. a network error) reports its orders as failed with the error message:
+        their state may be unknown, so check them by `clientOid` before retrying.
+
+        - `product_type`: Product type.
+        - `margin_mode`: Margin mode.
+        - `margin_coin`: Margin coin (capitalized), e.g. `'USDT'`.
+        - `orders`: Orders, each with its `symbol`.
+        - `validate`: Whether to validate the responses (default: True).
+
+        Returns one result per order, in input order (failed ones have an `errorMsg`).
+
+        > [Bitget API docs](https://www.bitget.com/api-doc/contract/trade/Batch-Order)
+        """
+        orders = [o if "clientOid" in o else {**o, "clientOid": new_client_oid()} for o in orders]
+        chunks = chunked(orders, by=lambda o: o["symbol"])
+        responses = await asyncio.gather(*(
+            self.batch_place_order(
+                product_type, chunk[0]["symbol"], margin_mode, margin_coin,
+                [{k: v for k, v in o.items() if k != "symbol"} for o in chunk], # type: ignore
+                validate=validate,
+            )
+            for chunk in chunks
+        ), return_exceptions=True)
+        return merge_results(orders, chunks, responses)
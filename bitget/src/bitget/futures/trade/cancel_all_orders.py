@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from datetime import timedelta
+
+from bitget.core import AuthEndpoint, validator, rate_limit
+from .batch_place_order import BatchOrderData, ProductType
+
+validate_response = validator(BatchOrderData)
+
+@dataclass
+class CancelAllOrders(AuthEndpoint):
+    @rate_limit(timedelta(seconds=0.1))
+    async def cancel_all_orders(
+        self,
+        product_type: ProductType,
+        *,
+        margin_coin: str | None = None,
+        validate: bool | None = None
+    ) -> BatchOrderData:
+        """Cancel all pending orders of a product type.
+
+        - `product_type`: Product type.
+        - `margin_coin`: Only cancel orders with this margin coin (capitalized), e.g. `'USDT'`.
+        - `validate`: Whether to validate the response (default: True).
+
+        > [Bitget API docs](https://www.bitget.com/api-doc/contract/trade/Cancel-All-Orders)
+        """
+        json = {"productType": product_type}
+        if margin_coin is not None:
+            json["marginCoin"] = margin_coin
+        r = await self.authed_request("POST", "/api/v2/mix/order/cancel-all-orders", json=json)
+        return self.output(r.content, validate_response, validate=validate)
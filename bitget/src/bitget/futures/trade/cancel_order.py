@@ -33,4 +33,4 @@ class CancelOrder(AuthEndpoint):
         if margin_coin is not None:
             json["marginCoin"] = margin_coin
         r = await self.authed_request("POST", "/api/v2/mix/order/cancel-order", json=json)
-        return self.output(r.text, validate_response, validate=validate)
+        return self.output(r.content, validate_response, validate=validate)
@@ -20,4 +20,4 @@ class FillHistory(AuthEndpoint):
         if end is not None: params["endTime"] = ts.dump(end)
         if limit is not None: params["limit"] = str(limit)
         r = await self.authed_request("GET", "/api/v2/mix/order/fill-history", params=params)
-        return self.output(r.text, validate_response, validate=validate)
+        return self.output(r.content, validate_response, validate=validate)
@@ -1,14 +1,18 @@
 # STDLIB IMPORTS
-from typing_extensions import Literal
+from typing_extensions import Literal, AsyncGenerator
 from dataclasses import dataclass
+from contextlib import aclosing
 from datetime import datetime, timedelta
 from decimal import Decimal
 
 from bitget.core import (
   AuthEndpoint, timestamp as ts, rate_limit,
-  validator, TypedDict, Timestamp
+  validator, TypedDict, Timestamp, merge_streams
 )
 
+ProductType = Literal['USDT-FUTURES', 'COIN-FUTURES', 'USDC-FUTURES']
+PRODUCT_TYPES: tuple[ProductType, ...] = ('USDT-FUTURES', 'COIN-FUTURES', 'USDC-FUTURES')
+
 class FeeDetail(TypedDict):
   deduction: str
   """Whether or not to deduct (vouchers)"""
@@ -138,7 +142,7 @@ class Fills(AuthEndpoint):
     
     # Make request
     r = await self.authed_request('GET', '/api/v2/mix/order/fills', params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
 
   async def fills_paged(
     self, product_type: Literal['USDT-FUTURES', 'COIN-FUTURES', 'USDC-FUTURES'],
@@ -170,13 +174,39 @@ class Fills(AuthEndpoint):
         break
 
     
+  async def all_fills_by_product_paged(
+    self, *, start: datetime | None = None,
+    end: datetime | None = None,
+    limit: int | None = None,
+    validate: bool | None = None
+  ) -> AsyncGenerator[tuple[ProductType, list[Fill]], None]:
+    """Get Order Fill Details, automatically paginated, for all product types, as `(product_type, chunk)` pairs.
+
+    Product types are paginated concurrently (sharing the rate limit), so chunks come in arrival order;
+    each product type's chunks stay in order (newest first).
+    
+    - `start`: Start time (time stamp in milliseconds) - (The maximum time span supported is three months. The default end time is three months if no value is set for the end time. ) - (For Managed Sub-Account, the StartTime cannot be earlier than the binding time)
+    - `end`: End time (time stamp in milliseconds) - (The maximum time span supported is three months. The default start time is three months ago if no value is set for the start time. )
+    - `limit`: Number of queries: Default: 100, maximum: 100
+    - `validate`: Whether to validate the response against the expected schema (default: True).
+
+    > [Bitget API docs](https://www.bitget.com/api-doc/contract/trade/Get-Order-Fills)
+    """
+    streams: dict[ProductType, AsyncGenerator[list[Fill], None]] = {
+      product_type: self.fills_paged(product_type, start=start, end=end, limit=limit, validate=validate)
+      for product_type in PRODUCT_TYPES
+    }
+    async with aclosing(merge_streams(streams)) as merged:
+      async for product_type, chunk in merged:
+        yield product_type, chunk
+
   async def all_fills_paged(
     self, *, start: datetime | None = None,
     end: datetime | None = None,
     limit: int | None = None,
     validate: bool | None = None
-  ):
-    """Get Order Fill Details, automatically paginated, for all product types.
+  ) -> AsyncGenerator[list[Fill], None]:
+    """Get Order Fill Details, automatically paginated, for all product types (concurrently, in arrival order).
     
     - `start`: Start time (time stamp in milliseconds) - (The maximum time span supported is three months. The default end time is three months if no value is set for the end time. ) - (For Managed Sub-Account, the StartTime cannot be earlier than the binding time)
     - `end`: End time (time stamp in milliseconds) - (The maximum time span supported is three months. The default start time is three months ago if no value is set for the start time. )
@@ -185,6 +215,6 @@ class Fills(AuthEndpoint):
 
     > [Bitget API docs](https://www.bitget.com/api-doc/contract/trade/Get-Order-Fills)
     """
-    for product_type in ('USDT-FUTURES', 'COIN-FUTURES', 'USDC-FUTURES'):
-      async for chunk in self.fills_paged(product_type, start=start, end=end, limit=limit, validate=validate):
-        yield chunk
\ No newline at end of file
+    async with aclosing(self.all_fills_by_product_paged(start=start, end=end, limit=limit, validate=validate)) as merged:
+      async for _, chunk in merged:
+        yield chunk
@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+from datetime import timedelta
+
+from bitget.core import AuthEndpoint, validator, TypedDict, rate_limit
+from .batch_place_order import ProductType
+
+class ModifyOrderData(TypedDict):
+    orderId: str
+    clientOid: str
+
+validate_response = validator(ModifyOrderData)
+
+@dataclass
+class ModifyOrder(AuthEndpoint):
+    @rate_limit(timedelta(seconds=0.1))
+    async def modify_order(
+        self,
+        product_type: ProductType,
+        symbol: str,
+        margin_coin: str,
+        new_client_oid: str,
+        *,
+        order_id: str | None = None,
+        client_oid: str | None = None,
+        new_size: str | None = None,
+        new_price: str | None = None,
+        new_preset_stop_surplus_price: str | None = None,
+        new_preset_stop_loss_price: str | None = None,
+        validate: bool | None = None
+    ) -> ModifyOrderData:
+        """Modify a pending order (cancel-replace). Use symbol=USDCUSDT only (per project convention). Either order_id or client_oid required.
+
+        - `product_type`: Product type.
+        - `symbol`: Trading pair, e.g. `'USDCUSDT'`.
+        - `margin_coin`: Margin coin (capitalized), e.g. `'USDT'`.
+        - `new_client_oid`: Client order ID of the modified order.
+        - `order_id`, `client_oid`: Order to modify.
+        - `new_size`, `new_price`: New size and price (modify both together).
+        - `new_preset_stop_surplus_price`, `new_preset_stop_loss_price`: New take-profit and stop-loss prices.
+        - `validate`: Whether to validate the response (default: True).
+
+        > [Bitget API docs](https://www.bitget.com/api-doc/contract/trade/Modify-Order)
+        """
+        json = {"symbol": symbol, "productType": product_type, "marginCoin": margin_coin, "newClientOid": new_client_oid}
+        if order_id is not None:
+            json["orderId"] = order_id
+        if client_oid is not None:
+            json["clientOid"] = client_oid
+        if new_size is not None:
+            json["newSize"] = new_size
+        if new_price is not None:
+            json["newPrice"] = new_price
+        if new_preset_stop_surplus_price is not None:
+            json["newPresetStopSurplusPrice"] = new_preset_stop_surplus_price
+        if new_preset_stop_loss_price is not None:
+            json["newPresetStopLossPrice"] = new_preset_stop_loss_price
+        r = await self.authed_request("POST", "/api/v2/mix/order/modify-order", json=json)
+        return self.output(r.content, validate_response, validate=validate)
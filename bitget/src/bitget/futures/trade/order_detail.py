@@ -41,4 +41,4 @@ class OrderDetailEndpoint(AuthEndpoint):
         if client_oid is not None:
             params["clientOid"] = client_oid
         r = await self.authed_request("GET", "/api/v2/mix/order/detail", params=params)
-        return self.output(r.text, validate_response, validate=validate)
+        return self.output(r.content, validate_response, validate=validate)
@@ -72,4 +72,4 @@ class OrdersHistory(AuthEndpoint):
         if limit is not None:
             params['limit'] = str(limit)
         r = await self.authed_request('GET', '/api/v2/mix/order/orders-history', params=params)
-        return self.output(r.text, validate_response, validate=validate)
+        return self.output(r.content, validate_response, validate=validate)
@@ -1,6 +1,7 @@
 from typing_extensions import Literal
 from dataclasses import dataclass
-from bitget.core import AuthEndpoint, validator, TypedDict
+from bitget.core import AuthEndpoint, validator, TypedDict, ApiError, resubmit, new_client_oid
+from .order_detail import OrderDetailEndpoint
 
 class PlaceOrderData(TypedDict):
     orderId: str
@@ -11,11 +12,30 @@ validate_response = validator(PlaceOrderData)
 @dataclass
 class PlaceOrder(AuthEndpoint):
     async def place_order(self, product_type, symbol, margin_mode, margin_coin, size, side, order_type, *, price=None, trade_side=None, force=None, client_oid=None, reduce_only=None, validate=None):
+        """Place an order. With a `retry` policy, a `client_oid` is generated, and a send that may have reached
+        the exchange is checked with `order_detail` before resending, so the order is placed at most once."""
+        policy = self.http.retry
+        if client_oid is None and policy is not None:
+            client_oid = new_client_oid()
         json = {"symbol": symbol, "productType": product_type, "marginMode": margin_mode, "marginCoin": margin_coin, "size": size, "side": side, "orderType": order_type}
         if price is not None: json["price"] = price
         if trade_side is not None: json["tradeSide"] = trade_side
         if force is not None: json["force"] = force
         if client_oid is not None: json["clientOid"] = client_oid
         if reduce_only is not None: json["reduceOnly"] = reduce_only
-        r = await self.authed_request("POST", "/api/v2/mix/order/place-order", json=json)
-        return self.output(r.text, validate_response, validate=validate)
+
+        async def send() -> PlaceOrderData:
+            r = await self.authed_request("POST", "/api/v2/mix/order/place-order", json=json)
+            return self.output(r.content, validate_response, validate=validate)
+
+        async def lookup() -> PlaceOrderData | None:
+            detail = OrderDetailEndpoint(base_url=self.base_url, http=self.http, default_validate=self.default_validate)
+            try:
+                order = await detail.order_detail(product_type, symbol, client_oid=client_oid, validate=False)
+            except ApiError:  # not found
+                return None
+            return {"orderId": order["orderId"], "clientOid": order["clientOid"]} if order else None
+
+        if policy is None:
+            return await send()
+        return await resubmit(send, lookup, policy)
@@ -1,7 +1,10 @@
+from typing_extensions import TYPE_CHECKING
 from bitget.core import AuthRouter
-from .cross import Cross
-from .isolated import Isolated
+
+if TYPE_CHECKING:
+  from .cross import Cross
+  from .isolated import Isolated
 
 class Margin(AuthRouter):
-  cross: Cross
-  isolated: Isolated
\ No newline at end of file
+  cross: 'Cross'
+  isolated: 'Isolated'
\ No newline at end of file
@@ -1,7 +1,10 @@
+from typing_extensions import TYPE_CHECKING
 from bitget.core import AuthRouter
-from .account import Account
-from .trade import Trade
+
+if TYPE_CHECKING:
+  from .account import Account
+  from .trade import Trade
 
 class Cross(AuthRouter):
-  account: Account
-  trade: Trade
\ No newline at end of file
+  account: 'Account'
+  trade: 'Trade'
\ No newline at end of file
@@ -44,4 +44,4 @@ class Assets(AuthEndpoint):
     if coin is not None:
       params['coin'] = coin
     r = await self.authed_request('GET', '/api/v2/margin/crossed/account/assets', params=params)
-    return self.output(r.text, validate_response, validate=validate)
\ No newline at end of file
+    return self.output(r.content, validate_response, validate=validate)
\ No newline at end of file
@@ -46,4 +46,4 @@ class Assets(AuthEndpoint):
     if symbol is not None:
       params['symbol'] = symbol
     r = await self.authed_request('GET', '/api/v2/margin/isolated/account/assets', params=params)
-    return self.output(r.text, validate_response, validate=validate)
\ No newline at end of file
+    return self.output(r.content, validate_response, validate=validate)
\ No newline at end of file
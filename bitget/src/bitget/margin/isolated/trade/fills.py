@@ -89,7 +89,7 @@ class Fills(AuthEndpoint):
       params['limit'] = limit
       
     r = await self.authed_request('GET', '/api/v2/margin/isolated/fills', params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
 
   async def fills_paged(
     self,
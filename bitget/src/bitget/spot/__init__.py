@@ -1,15 +1,18 @@
+from typing_extensions import TYPE_CHECKING
 from bitget.core import AuthRouter
-from .account import Account
-from .market import Market
-from .public import Public
-from .trade import Trade
-from .trigger import Trigger
-from .wallet import Wallet
+
+if TYPE_CHECKING:
+  from .account import Account
+  from .market import Market
+  from .public import Public
+  from .trade import Trade
+  from .trigger import Trigger
+  from .wallet import Wallet
 
 class Spot(AuthRouter):
-  account: Account
-  market: Market
-  public: Public
-  trade: Trade
-  trigger: Trigger
-  wallet: Wallet
\ No newline at end of file
+  account: 'Account'
+  market: 'Market'
+  public: 'Public'
+  trade: 'Trade'
+  trigger: 'Trigger'
+  wallet: 'Wallet'
\ No newline at end of file
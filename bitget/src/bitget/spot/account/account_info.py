@@ -27,4 +27,4 @@ class AccountInfo(AuthEndpoint):
     > [Bitget API docs](https://www.bitget.com/api-doc/spot/account/Get-Account-Info)
     """
     r = await self.authed_request('GET', '/api/v2/spot/account/info')
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
@@ -42,4 +42,4 @@ class Assets(AuthEndpoint):
     if asset_type is not None:
       params['assetType'] = asset_type
     r = await self.authed_request('GET', '/api/v2/spot/account/assets', params=params)
-    return self.output(r.text, validate_response, validate=validate)
\ No newline at end of file
+    return self.output(r.content, validate_response, validate=validate)
\ No newline at end of file
@@ -24,4 +24,4 @@ class DeductInfo(AuthEndpoint):
     > [Bitget API docs](https://www.bitget.com/api-doc/spot/account/Get-Deduct-Info)
     """
     r = await self.authed_request('GET', '/api/v2/spot/account/deduct-info')
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
@@ -29,4 +29,4 @@ class SubaccountAssets(AuthEndpoint):
     if limit is not None:
       params["limit"] = limit
     r = await self.authed_request("GET", "/api/v2/spot/account/subaccount-assets", params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
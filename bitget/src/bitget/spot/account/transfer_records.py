@@ -38,4 +38,4 @@ class TransferRecords(AuthEndpoint):
     if id_less_than is not None:
       params['idLessThan'] = id_less_than
     r = await self.authed_request('GET', '/api/v2/spot/account/transferRecords', params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from decimal import Decimal
 
 from bitget.core import Endpoint, rate_limit, validator, TypedDict, Timestamp, timestamp as ts
+from bitget.core.columnar import CandleColumns, candle_columns
 
 class CandleItem(TypedDict):
   ts: Timestamp
@@ -29,6 +30,20 @@ def _candle_row(v: list) -> CandleItem:
 @dataclass
 class Candles(Endpoint):
   @rate_limit(timedelta(seconds=1/20))
+  async def _candles(
+    self, symbol: str, granularity: str,
+    start: datetime | None, end: datetime | None, limit: int | None,
+  ) -> list[list[str]]:
+    params: dict = {'symbol': symbol, 'granularity': granularity}
+    if start is not None:
+      params['startTime'] = ts.dump(start)
+    if end is not None:
+      params['endTime'] = ts.dump(end)
+    if limit is not None:
+      params['limit'] = limit
+    r = await self.request('GET', '/api/v2/spot/market/candles', params=params)
+    return self.output(r.content, validator(list), validate=False)
+
   async def candles(
     self,
     symbol: str,
@@ -49,13 +64,20 @@ class Candles(Endpoint):
 
     > [Bitget API docs](https://www.bitget.com/api-doc/spot/market/Get-Candle-Data)
     """
-    params: dict = {'symbol': symbol, 'granularity': granularity}
-    if start is not None:
-      params['startTime'] = ts.dump(start)
-    if end is not None:
-      params['endTime'] = ts.dump(end)
-    if limit is not None:
-      params['limit'] = limit
-    r = await self.request('GET', '/api/v2/spot/market/candles', params=params)
-    raw = self.output(r.text, validator(list), validate=False)
+    raw = await self._candles(symbol, granularity, start, end, limit)
     return [_candle_row(row) for row in raw]
+
+  async def candles_columnar(
+    self,
+    symbol: str,
+    granularity: str,
+    *,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    limit: int | None = None,
+  ) -> CandleColumns:
+    """Like `candles`, but as NumPy arrays (one per field) instead of one dict per candle. Requires `numpy`.
+
+    > [Bitget API docs](https://www.bitget.com/api-doc/spot/market/Get-Candle-Data)
+    """
+    return candle_columns(await self._candles(symbol, granularity, start, end, limit))
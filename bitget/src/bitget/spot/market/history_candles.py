@@ -1,8 +1,10 @@
+from typing_extensions import Sequence, MutableMapping, AsyncIterator
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from decimal import Decimal
 
-from bitget.core import Endpoint, rate_limit, validator, TypedDict, Timestamp, timestamp as ts
+from bitget.core import Endpoint, rate_limit, validator, TypedDict, Timestamp, timestamp as ts, map_ordered
+from bitget.core.columnar import CandleColumns, candle_columns
 
 class CandleItem(TypedDict):
   ts: Timestamp
@@ -26,9 +28,35 @@ def _candle_row(v: list) -> CandleItem:
     'quoteVolume': Decimal(v[7]),
   }
 
+GRANULARITIES: dict[str, timedelta] = {
+  '1min': timedelta(minutes=1), '3min': timedelta(minutes=3), '5min': timedelta(minutes=5),
+  '15min': timedelta(minutes=15), '30min': timedelta(minutes=30),
+  '1h': timedelta(hours=1), '4h': timedelta(hours=4), '6h': timedelta(hours=6), '12h': timedelta(hours=12),
+  '1day': timedelta(days=1), '3day': timedelta(days=3), '1week': timedelta(weeks=1),
+  '1M': timedelta(days=31), # upper bound, so that a window never holds more than a page
+  '6Hutc': timedelta(hours=6), '12Hutc': timedelta(hours=12), '1Dutc': timedelta(days=1),
+  '3Dutc': timedelta(days=3), '1Wutc': timedelta(weeks=1), '1Mutc': timedelta(days=31),
+}
+
+MAX_HISTORY_CANDLES = 200
+
+class CandleChunk(TypedDict):
+  symbol: str
+  start: datetime
+  end: datetime
+  candles: list[CandleItem]
+  """Candles with `start <= ts < end`, ascending"""
+
 @dataclass
 class HistoryCandles(Endpoint):
   @rate_limit(timedelta(seconds=1/20))
+  async def _history_candles(self, symbol: str, granularity: str, end: datetime, limit: int | None) -> list[list[str]]:
+    params: dict = {'symbol': symbol, 'granularity': granularity, 'endTime': ts.dump(end)}
+    if limit is not None:
+      params['limit'] = limit
+    r = await self.request('GET', '/api/v2/spot/market/history-candles', params=params)
+    return self.output(r.content, validator(list), validate=False)
+
   async def history_candles(
     self,
     symbol: str,
@@ -48,9 +76,69 @@ class HistoryCandles(Endpoint):
 
     > [Bitget API docs](https://www.bitget.com/api-doc/spot/market/Get-History-Candle-Data)
     """
-    params: dict = {'symbol': symbol, 'granularity': granularity, 'endTime': ts.dump(end)}
-    if limit is not None:
-      params['limit'] = limit
-    r = await self.request('GET', '/api/v2/spot/market/history-candles', params=params)
-    raw = self.output(r.text, validator(list), validate=False)
+    raw = await self._history_candles(symbol, granularity, end, limit)
     return [_candle_row(row) for row in raw]
+
+  async def history_candles_columnar(
+    self,
+    symbol: str,
+    granularity: str,
+    end: datetime,
+    *,
+    limit: int | None = None,
+  ) -> CandleColumns:
+    """Like `history_candles`, but as NumPy arrays (one per field) instead of one dict per candle. Requires `numpy`.
+
+    > [Bitget API docs](https://www.bitget.com/api-doc/spot/market/Get-History-Candle-Data)
+    """
+    return candle_columns(await self._history_candles(symbol, granularity, end, limit))
+
+  async def history_candles_backfill(
+    self,
+    symbols: str | Sequence[str],
+    granularity: str,
+    start: datetime,
+    end: datetime,
+    *,
+    concurrency: int = 20,
+    checkpoint: MutableMapping[str, datetime] | None = None,
+  ) -> AsyncIterator[CandleChunk]:
+    """Backfill candles over `[start, end)`, fetching page-sized windows concurrently (within the rate limit).
+
+    Yields one chunk per window, symbol by symbol, in time order; boundary candles appear exactly once.
+
+    - `symbols`: One or more trading pairs.
+    - `granularity`: 1min, 3min, 5min, 15min, 30min, 1h, 4h, 6h, 12h, 1day, 3day, 1week, 1M, etc.
+    - `start`, `end`: Time range.
+    - `concurrency`: Maximum requests in flight (default: 20, the endpoint's per-second limit).
+    - `checkpoint`: Optional `symbol -> datetime` mapping, advanced past each chunk when the next one is requested.
+      Pass the same (e.g. reloaded) mapping to resume an interrupted backfill: the chunk being processed
+      when interrupted is fetched again (at-least-once).
+
+    > [Bitget API docs](https://www.bitget.com/api-doc/spot/market/Get-History-Candle-Data)
+    """
+    if isinstance(symbols, str):
+      symbols = [symbols]
+    # one candle short of a page: covers the window whether `endTime` is inclusive or not
+    step = GRANULARITIES[granularity] * (MAX_HISTORY_CANDLES - 1)
+    windows: list[tuple[str, datetime, datetime]] = []
+    for symbol in symbols:
+      w_start = start
+      if checkpoint is not None and symbol in checkpoint:
+        w_start = max(start, checkpoint[symbol])
+      while w_start < end:
+        w_end = min(w_start + step, end)
+        windows.append((symbol, w_start, w_end))
+        w_start = w_end
+
+    async def fetch(window: tuple[str, datetime, datetime]) -> CandleChunk:
+      symbol, w_start, w_end = window
+      lo, hi = ts.dump(w_start), ts.dump(w_end)
+      candles = await self.history_candles(symbol, granularity, w_end, limit=MAX_HISTORY_CANDLES)
+      candles = sorted((c for c in candles if lo <= ts.dump(c['ts']) < hi), key=lambda c: c['ts'])
+      return {'symbol': symbol, 'start': w_start, 'end': w_end, 'candles': candles}
+
+    async for chunk in map_ordered(fetch, windows, concurrency=concurrency):
+      yield chunk
+      if checkpoint is not None:
+        checkpoint[chunk['symbol']] = chunk['end']
@@ -50,4 +50,4 @@ class MarketTrades(Endpoint):
     if end is not None:
       params['endTime'] = ts.dump(end)
     r = await self.request('GET', '/api/v2/spot/market/fills-history', params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
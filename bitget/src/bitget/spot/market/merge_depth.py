@@ -2,7 +2,10 @@ from datetime import timedelta
 from dataclasses import dataclass
 from decimal import Decimal
 
+import httpx
+
 from bitget.core import Endpoint, rate_limit, validator, TypedDict, Timestamp
+from bitget.core.columnar import BookColumns, book_columns
 
 class MergeDepthData(TypedDict):
   asks: list[list[Decimal]]
@@ -17,6 +20,14 @@ validate_response = validator(MergeDepthData)
 @dataclass
 class MergeDepth(Endpoint):
   @rate_limit(timedelta(seconds=1/20))
+  async def _merge_depth(self, symbol: str, precision: str | None, limit: str | None) -> httpx.Response:
+    params: dict = {'symbol': symbol}
+    if precision is not None:
+      params['precision'] = precision
+    if limit is not None:
+      params['limit'] = limit
+    return await self.request('GET', '/api/v2/spot/market/merge-depth', params=params)
+
   async def merge_depth(
     self,
     symbol: str,
@@ -34,10 +45,19 @@ class MergeDepth(Endpoint):
 
     > [Bitget API docs](https://www.bitget.com/api-doc/spot/market/Merge-Orderbook)
     """
-    params: dict = {'symbol': symbol}
-    if precision is not None:
-      params['precision'] = precision
-    if limit is not None:
-      params['limit'] = limit
-    r = await self.request('GET', '/api/v2/spot/market/merge-depth', params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    r = await self._merge_depth(symbol, precision, limit)
+    return self.output(r.content, validate_response, validate=validate)
+
+  async def merge_depth_columnar(
+    self,
+    symbol: str,
+    *,
+    precision: str | None = None,
+    limit: str | None = None,
+  ) -> BookColumns:
+    """Like `merge_depth`, but as NumPy price/size arrays per side instead of nested lists. Requires `numpy`.
+
+    > [Bitget API docs](https://www.bitget.com/api-doc/spot/market/Merge-Orderbook)
+    """
+    r = await self._merge_depth(symbol, precision, limit)
+    return book_columns(self.output(r.content, validate_response, validate=False))
@@ -2,7 +2,10 @@ from datetime import timedelta
 from dataclasses import dataclass
 from decimal import Decimal
 
+import httpx
+
 from bitget.core import Endpoint, rate_limit, validator, TypedDict, Timestamp
+from bitget.core.columnar import BookColumns, book_columns
 
 class OrderbookData(TypedDict):
   asks: list[list[Decimal]]
@@ -14,6 +17,14 @@ validate_response = validator(OrderbookData)
 @dataclass
 class Orderbook(Endpoint):
   @rate_limit(timedelta(seconds=1/20))
+  async def _orderbook(self, symbol: str, depth_type: str | None, limit: int | None) -> httpx.Response:
+    params: dict = {'symbol': symbol}
+    if depth_type is not None:
+      params['type'] = depth_type
+    if limit is not None:
+      params['limit'] = limit
+    return await self.request('GET', '/api/v2/spot/market/orderbook', params=params)
+
   async def orderbook(
     self,
     symbol: str,
@@ -31,10 +42,19 @@ class Orderbook(Endpoint):
 
     > [Bitget API docs](https://www.bitget.com/api-doc/spot/market/Get-Orderbook)
     """
-    params: dict = {'symbol': symbol}
-    if depth_type is not None:
-      params['type'] = depth_type
-    if limit is not None:
-      params['limit'] = limit
-    r = await self.request('GET', '/api/v2/spot/market/orderbook', params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    r = await self._orderbook(symbol, depth_type, limit)
+    return self.output(r.content, validate_response, validate=validate)
+
+  async def orderbook_columnar(
+    self,
+    symbol: str,
+    *,
+    depth_type: str | None = None,
+    limit: int | None = None,
+  ) -> BookColumns:
+    """Like `orderbook`, but as NumPy price/size arrays per side instead of nested lists. Requires `numpy`.
+
+    > [Bitget API docs](https://www.bitget.com/api-doc/spot/market/Get-Orderbook)
+    """
+    r = await self._orderbook(symbol, depth_type, limit)
+    return book_columns(self.output(r.content, validate_response, validate=False))
@@ -37,4 +37,4 @@ class RecentTrades(Endpoint):
     if limit is not None:
       params['limit'] = limit
     r = await self.request('GET', '/api/v2/spot/market/fills', params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
@@ -41,4 +41,4 @@ class Tickers(Endpoint):
     if symbol is not None:
       params['symbol'] = symbol
     r = await self.request('GET', '/api/v2/spot/market/tickers', params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
@@ -2,7 +2,7 @@ from datetime import timedelta
 from dataclasses import dataclass
 from decimal import Decimal
 
-from bitget.core import Endpoint, rate_limit, validator, TypedDict
+from bitget.core import Endpoint, rate_limit, validator, TypedDict, cached
 
 class VipFeeRateItem(TypedDict):
   level: str
@@ -17,6 +17,7 @@ validate_response = validator(list[VipFeeRateItem])
 
 @dataclass
 class VipFeeRate(Endpoint):
+  @cached(timedelta(hours=1))
   @rate_limit(timedelta(seconds=1/10))
   async def vip_fee_rate(self, *, validate: bool | None = None) -> list[VipFeeRateItem]:
     """Get VIP Fee Rate
@@ -26,4 +27,4 @@ class VipFeeRate(Endpoint):
     > [Bitget API docs](https://www.bitget.com/api-doc/spot/market/Get-VIP-Fee-Rate)
     """
     r = await self.request('GET', '/api/v2/spot/market/vip-fee-rate')
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from datetime import timedelta
 from decimal import Decimal
 
-from bitget.core import Endpoint, rate_limit, validator, TypedDict
+from bitget.core import Endpoint, rate_limit, validator, TypedDict, cached
 
 # RESPONSE MODELS (nested first, then main)
 
@@ -56,6 +56,7 @@ validate_response = validator(list[CoinInfo])
 
 @dataclass
 class Coins(Endpoint):
+  @cached(timedelta(minutes=5))
   @rate_limit(timedelta(seconds=1/3))
   async def coins(
     self,
@@ -76,4 +77,13 @@ class Coins(Endpoint):
     if coin is not None:
       params['coin'] = coin
     r = await self.request('GET', '/api/v2/spot/public/coins', params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
+
+  async def coins_index(self, *, validate: bool | None = None) -> dict[str, CoinInfo]:
+    """All coins, by coin name (indexes `coins`, so it follows its cache entry).
+
+    - `validate`: Whether to validate the response against the expected schema (default: True).
+
+    > [Bitget API docs](https://www.bitget.com/api-doc/spot/market/Get-Coin-List)
+    """
+    return {c['coin']: c for c in await self.coins(validate=validate)}
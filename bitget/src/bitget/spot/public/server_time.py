@@ -11,6 +11,10 @@ validate_response = validator(ServerTimeData)
 @dataclass
 class ServerTime(Endpoint):
   @rate_limit(timedelta(seconds=1/20))
+  async def _server_time(self) -> bytes:
+    r = await self.request('GET', '/api/v2/public/time')
+    return r.content
+
   async def server_time(self, *, validate: bool | None = None) -> ServerTimeData:
     """Get Server Time
 
@@ -20,5 +24,12 @@ class ServerTime(Endpoint):
 
     > [Bitget API docs](https://www.bitget.com/api-doc/spot/public/Get-Server-Time)
     """
-    r = await self.request('GET', '/api/v2/public/time')
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(await self._server_time(), validate_response, validate=validate)
+
+  async def server_time_ms(self) -> int:
+    """Server time as a Unix millisecond timestamp, unparsed (e.g. for `bitget.core.ClockSync`).
+
+    > [Bitget API docs](https://www.bitget.com/api-doc/spot/public/Get-Server-Time)
+    """
+    r = self.output(await self._server_time(), validator(dict), validate=False)
+    return int(r['serverTime'])
@@ -1,8 +1,9 @@
 from typing_extensions import Literal
 from dataclasses import dataclass
+from datetime import timedelta
 from decimal import Decimal
 
-from bitget.core import Endpoint, validator, TypedDict, Timestamp
+from bitget.core import Endpoint, validator, TypedDict, Timestamp, cached
 
 class Symbol(TypedDict):
   symbol: str
@@ -46,6 +47,7 @@ validate_response = validator(list[Symbol])
 
 @dataclass
 class Symbols(Endpoint):
+  @cached(timedelta(minutes=5))
   async def symbols(
     self, *,
     symbol: str | None = None,
@@ -62,7 +64,7 @@ class Symbols(Endpoint):
     if symbol is not None:
       params['symbol'] = symbol
     r = await self.request('GET', '/api/v2/spot/public/symbols', params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
 
   
   async def symbol(self, symbol: str, *, validate: bool | None = None):
@@ -73,4 +75,13 @@ class Symbols(Endpoint):
 
     > [Bitget API docs](https://www.bitget.com/api-doc/spot/market/Get-Symbols)
     """
-    return (await self.symbols(symbol=symbol, validate=validate))[0]
\ No newline at end of file
+    return (await self.symbols(symbol=symbol, validate=validate))[0]
+
+  async def symbols_index(self, *, validate: bool | None = None) -> dict[str, Symbol]:
+    """All spot trading pairs, by symbol (indexes `symbols`, so it follows its cache entry).
+
+    - `validate`: Whether to validate the response against the expected schema (default: True).
+
+    > [Bitget API docs](https://www.bitget.com/api-doc/spot/market/Get-Symbols)
+    """
+    return {s['symbol']: s for s in await self.symbols(validate=validate)}
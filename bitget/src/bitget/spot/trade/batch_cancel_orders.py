@@ -44,4 +44,4 @@ class BatchCancelOrders(AuthEndpoint):
     if batch_mode is not None:
       json_body['batchMode'] = batch_mode
     r = await self.authed_request('POST', '/api/v2/spot/trade/batch-cancel-order', json=json_body)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
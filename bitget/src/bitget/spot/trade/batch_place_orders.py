@@ -1,18 +1,25 @@
-from typing_extensions import Literal, NotRequired
+from typing_extensions import Literal, NotRequired, Sequence, cast
 from dataclasses import dataclass
 from datetime import timedelta
+import asyncio
 
-from bitget.core import AuthEndpoint, rate_limit, validator, TypedDict
+from bitget.core import AuthEndpoint, rate_limit, validator, TypedDict, new_client_oid
+from bitget.core.bulk import BulkOrderResult, chunked, merge_results
 
-class BatchOrderInput(TypedDict):
+class _OrderFields(TypedDict):
   side: Literal['buy', 'sell']
   orderType: Literal['limit', 'market']
   size: str
-  symbol: NotRequired[str]  # required in multiple batch_mode only
   price: NotRequired[str]
   force: NotRequired[Literal['gtc', 'post_only', 'fok', 'ioc']]
   clientOid: NotRequired[str]
 
+class BatchOrderInput(_OrderFields):
+  symbol: NotRequired[str]  # required in multiple batch_mode only
+
+class BulkOrderInput(_OrderFields):
+  symbol: str
+
 class BatchPlaceOrderSuccessItem(TypedDict):
   orderId: str
   clientOid: str
@@ -53,4 +60,32 @@ class BatchPlaceOrders(AuthEndpoint):
     if batch_mode is not None:
       json_body['batchMode'] = batch_mode
     r = await self.authed_request('POST', '/api/v2/spot/trade/batch-orders', json=json_body)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
+
+  async def bulk_place_orders(
+    self,
+    orders: Sequence[BulkOrderInput],
+    *,
+    validate: bool | None = None
+  ) -> list[BulkOrderResult]:
+    """Place any number of orders, across symbols, in as few batch requests as possible.
+
+    Orders are sent in chunks of 50 (`batchMode='multiple'`), dispatched concurrently at the endpoint's rate limit.
+    Orders without `clientOid` get a random one, so every result can be matched (and looked up later).
+    A chunk that fails as a whole (e.g. a network error) reports its orders as failed with the error message:
+    their state may be unknown, so check them by `clientOid` before retrying.
+
+    - `orders`: Orders, each with its `symbol`.
+    - `validate`: Whether to validate the responses (default: True).
+
+    Returns one result per order, in input order (failed ones have an `errorMsg`).
+
+    > [Bitget API docs](https://www.bitget.com/api-doc/spot/trade/Batch-Place-Orders)
+    """
+    orders = [o if 'clientOid' in o else {**o, 'clientOid': new_client_oid()} for o in orders]
+    chunks = chunked(orders)
+    responses = await asyncio.gather(*(
+      self.batch_place_orders(chunk[0]['symbol'], cast(list[BatchOrderInput], chunk), batch_mode='multiple', validate=validate)
+      for chunk in chunks
+    ), return_exceptions=True)
+    return merge_results(orders, chunks, responses)
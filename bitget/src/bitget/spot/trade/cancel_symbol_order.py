@@ -25,4 +25,4 @@ class CancelSymbolOrder(AuthEndpoint):
     > [Bitget API docs](https://www.bitget.com/api-doc/spot/trade/Cancel-Symbol-Orders)
     """
     r = await self.authed_request('POST', '/api/v2/spot/trade/cancel-symbol-order', json={'symbol': symbol})
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
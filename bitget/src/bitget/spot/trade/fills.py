@@ -65,7 +65,7 @@ class Fills(AuthEndpoint):
     if id_less_than is not None:
       params['idLessThan'] = id_less_than
     r = await self.authed_request('GET', '/api/v2/spot/trade/fills', params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
 
   
   async def fills_paged(
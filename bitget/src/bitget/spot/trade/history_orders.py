@@ -65,4 +65,4 @@ class HistoryOrders(AuthEndpoint):
     if order_id is not None:
       params['orderId'] = order_id
     r = await self.authed_request('GET', '/api/v2/spot/trade/history-orders', params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
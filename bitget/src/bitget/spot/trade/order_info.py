@@ -53,4 +53,4 @@ class OrderInfo(AuthEndpoint):
     if client_oid is not None:
       params['clientOid'] = client_oid
     r = await self.authed_request('GET', '/api/v2/spot/trade/orderInfo', params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
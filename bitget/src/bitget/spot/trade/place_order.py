@@ -2,7 +2,8 @@ from typing_extensions import Literal
 from dataclasses import dataclass
 from datetime import timedelta
 
-from bitget.core import AuthEndpoint, rate_limit, validator, TypedDict
+from bitget.core import AuthEndpoint, rate_limit, validator, TypedDict, ApiError, resubmit, new_client_oid
+from .order_info import OrderInfo
 
 class PlaceOrderData(TypedDict):
   orderId: str
@@ -33,9 +34,12 @@ class PlaceOrder(AuthEndpoint):
     - `size`: For limit and market-sell = base coins. For market-buy = quote coins.
     - `force`: gtc, post_only, fok, ioc (invalid when order_type is market).
     - `price`: Limit price (required for limit).
-    - `client_oid`: Client order ID.
+    - `client_oid`: Client order ID. Generated if the client has a `retry` policy, to resend safely.
     - `validate`: Whether to validate the response (default: True).
 
+    With a `retry` policy, a send that may have reached the exchange (e.g. a read timeout) is checked
+    with `order_info` before sending it again, so the order is placed at most once.
+
     > [Bitget API docs](https://www.bitget.com/api-doc/spot/trade/Place-Order)
     """
     json_body: dict = {'symbol': symbol, 'side': side, 'orderType': order_type, 'size': size}
@@ -43,7 +47,24 @@ class PlaceOrder(AuthEndpoint):
       json_body['force'] = force or 'gtc'
       if price is not None:
         json_body['price'] = price
+    policy = self.http.retry
+    if client_oid is None and policy is not None:
+      client_oid = new_client_oid()
     if client_oid is not None:
       json_body['clientOid'] = client_oid
-    r = await self.authed_request('POST', '/api/v2/spot/trade/place-order', json=json_body)
-    return self.output(r.text, validate_response, validate=validate)
+
+    async def send() -> PlaceOrderData:
+      r = await self.authed_request('POST', '/api/v2/spot/trade/place-order', json=json_body)
+      return self.output(r.content, validate_response, validate=validate)
+
+    async def lookup() -> PlaceOrderData | None:
+      info = OrderInfo(base_url=self.base_url, http=self.http, default_validate=self.default_validate)
+      try:
+        orders = await info.order_info(client_oid=client_oid, validate=False)
+      except ApiError: # not found
+        return None
+      return {'orderId': orders[0]['orderId'], 'clientOid': orders[0]['clientOid']} if orders else None
+
+    if policy is None:
+      return await send()
+    return await resubmit(send, lookup, policy)
@@ -38,4 +38,4 @@ class BatchCancelPlanOrder(AuthEndpoint):
     if symbol_list is not None:
       json_body['symbolList'] = symbol_list
     r = await self.authed_request('POST', '/api/v2/spot/trade/batch-cancel-plan-order', json=json_body)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
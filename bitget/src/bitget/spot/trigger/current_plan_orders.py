@@ -40,4 +40,4 @@ class CurrentPlanOrders(AuthEndpoint):
     if start is not None: params['startTime'] = ts.dump(start)
     if end is not None: params['endTime'] = ts.dump(end)
     r = await self.authed_request('GET', '/api/v2/spot/trade/current-plan-order', params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
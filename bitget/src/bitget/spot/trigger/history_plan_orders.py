@@ -40,4 +40,4 @@ class HistoryPlanOrders(AuthEndpoint):
     if limit is not None: params['limit'] = limit
     if id_less_than is not None: params['idLessThan'] = id_less_than
     r = await self.authed_request('GET', '/api/v2/spot/trade/history-plan-order', params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
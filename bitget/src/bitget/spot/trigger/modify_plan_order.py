@@ -46,4 +46,4 @@ class ModifyPlanOrder(AuthEndpoint):
     if execute_price is not None:
       json_body['executePrice'] = execute_price
     r = await self.authed_request('POST', '/api/v2/spot/trade/modify-plan-order', json=json_body)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
@@ -33,4 +33,4 @@ class PlacePlanOrder(AuthEndpoint):
     if plan_type is not None: json_body['planType'] = plan_type
     if client_oid is not None: json_body['clientOid'] = client_oid
     r = await self.authed_request('POST', '/api/v2/spot/trade/place-plan-order', json=json_body)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
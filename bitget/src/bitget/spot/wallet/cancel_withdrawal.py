@@ -28,4 +28,4 @@ class CancelWithdrawal(AuthEndpoint):
     """
     json_body: dict = {'orderId': order_id}
     r = await self.authed_request('POST', '/api/v2/spot/wallet/cancel-withdrawal', json=json_body)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
@@ -53,4 +53,4 @@ class DepositAddress(AuthEndpoint):
       params['size'] = size
 
     r = await self.authed_request('GET', '/api/v2/spot/wallet/deposit-address', params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
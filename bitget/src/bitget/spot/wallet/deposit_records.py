@@ -85,7 +85,7 @@ class DepositRecords(AuthEndpoint):
     
     # Make request
     r = await self.authed_request('GET', '/api/v2/spot/wallet/deposit-records', params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
 
 
   async def deposit_records_paged(
@@ -18,4 +18,4 @@ class SubTransfer(AuthEndpoint):
     if symbol is not None: json_body['symbol'] = symbol
     if client_oid is not None: json_body['clientOid'] = client_oid
     r = await self.authed_request('POST', '/api/v2/spot/wallet/subaccount-transfer', json=json_body)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
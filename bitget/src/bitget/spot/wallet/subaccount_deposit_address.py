@@ -21,4 +21,4 @@ class SubaccountDepositAddress(AuthEndpoint):
     if chain is not None: params['chain'] = chain
     if size is not None: params['size'] = size
     r = await self.authed_request('GET', '/api/v2/spot/wallet/subaccount-deposit-address', params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
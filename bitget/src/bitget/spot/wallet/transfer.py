@@ -19,4 +19,4 @@ class Transfer(AuthEndpoint):
     if client_oid is not None:
       json_body["clientOid"] = client_oid
     r = await self.authed_request("POST", "/api/v2/spot/wallet/transfer", json=json_body)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
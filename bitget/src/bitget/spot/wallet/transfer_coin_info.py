@@ -11,4 +11,4 @@ class TransferCoinInfo(AuthEndpoint):
   async def transfer_coin_info(self, from_type: str, to_type: str, *, validate: bool | None = None) -> list[str]:
     params = {"fromType": from_type, "toType": to_type}
     r = await self.authed_request("GET", "/api/v2/spot/wallet/transfer-coin-info", params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
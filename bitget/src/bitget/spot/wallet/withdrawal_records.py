@@ -94,7 +94,7 @@ class WithdrawalRecords(AuthEndpoint):
 
     # Make request
     r = await self.authed_request('GET', '/api/v2/spot/wallet/withdrawal-records', params=params)
-    return self.output(r.text, validate_response, validate=validate)
+    return self.output(r.content, validate_response, validate=validate)
 
 
   async def withdrawal_records_paged(
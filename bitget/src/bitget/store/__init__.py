@@ -0,0 +1,2 @@
+from .candles import CandleStore, candle_dtype
+from .orders import OrderTracker, TrackedOrder
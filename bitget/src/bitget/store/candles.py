@@ -0,0 +1,174 @@
+from typing_extensions import TYPE_CHECKING
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+import asyncio
+import json
+import os
+import time
+
+from bitget.core import timestamp as ts
+from bitget.core.columnar import _numpy
+from bitget.spot.market.history_candles import HistoryCandles, GRANULARITIES
+
+if TYPE_CHECKING:
+  import numpy as np
+
+FIELDS = ('open', 'high', 'low', 'close', 'baseVolume', 'usdtVolume', 'quoteVolume')
+
+def candle_dtype() -> 'np.dtype':
+  np = _numpy()
+  return np.dtype([('ts', '<i8')] + [(f, '<f8') for f in FIELDS])
+
+Range = tuple[int, int]
+"""`[start, end)` in ms"""
+
+def merge_ranges(ranges: list[Range]) -> list[Range]:
+  merged: list[Range] = []
+  for start, end in sorted(ranges):
+    if merged and start <= merged[-1][1]:
+      merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+    else:
+      merged.append((start, end))
+  return merged
+
+def missing_ranges(covered: list[Range], start: int, end: int) -> list[Range]:
+  gaps: list[Range] = []
+  for c_start, c_end in covered:
+    if c_end <= start:
+      continue
+    if c_start >= end:
+      break
+    if c_start > start:
+      gaps.append((start, c_start))
+    start = max(start, c_end)
+  if start < end:
+    gaps.append((start, end))
+  return gaps
+
+@dataclass
+class CandleStore:
+  """On-disk candle cache, filled from `history_candles` on demand.
+
+  Each (symbol, granularity) is a file of fixed-size records sorted by time (see `candle_dtype`),
+  with a JSON sidecar of the covered time ranges. Reads are memory-mapped (zero-copy);
+  only the gaps are fetched from the API. Only closed candles are stored.
+
+  ```python
+  store = CandleStore('data/candles', client.spot.market)
+  candles = await store.get('BTCUSDT', '1min', start, end)
+  candles['close'].mean()
+  ```
+  """
+  root: Path | str
+  market: HistoryCandles
+  concurrency: int = field(kw_only=True, default=20)
+  flush_rows: int = field(kw_only=True, default=50_000)
+  """Candles buffered (per gap) before writing them to disk"""
+  locks: dict[tuple[str, str], asyncio.Lock] = field(default_factory=dict, init=False, repr=False)
+
+  def __post_init__(self):
+    self.root = Path(self.root)
+    self.root.mkdir(parents=True, exist_ok=True)
+
+  def _path(self, symbol: str, granularity: str) -> Path:
+    return Path(self.root) / f'{symbol}-{granularity}.candles'
+
+  def ranges(self, symbol: str, granularity: str) -> list[Range]:
+    """Covered `[start, end)` ranges, in ms."""
+    sidecar = self._path(symbol, granularity).with_suffix('.json')
+    if not sidecar.exists():
+      return []
+    return [(start, end) for start, end in json.loads(sidecar.read_text())['ranges']]
+
+  def _save_ranges(self, symbol: str, granularity: str, ranges: list[Range]):
+    sidecar = self._path(symbol, granularity).with_suffix('.json')
+    tmp = sidecar.with_suffix('.json.tmp')
+    tmp.write_text(json.dumps({'ranges': merge_ranges(ranges)}))
+    os.replace(tmp, sidecar)
+
+  def read(self, symbol: str, granularity: str, start: datetime | None = None, end: datetime | None = None) -> 'np.ndarray':
+    """Stored candles within `[start, end)`, as a memory-mapped record array. Doesn't hit the API."""
+    np = _numpy()
+    path = self._path(symbol, granularity)
+    if not path.exists() or path.stat().st_size == 0:
+      return np.empty(0, dtype=candle_dtype())
+    data = np.memmap(path, dtype=candle_dtype(), mode='r')
+    lo = 0 if start is None else int(np.searchsorted(data['ts'], ts.dump(start)))
+    hi = len(data) if end is None else int(np.searchsorted(data['ts'], ts.dump(end)))
+    return data[lo:hi]
+
+  def _write(self, symbol: str, granularity: str, records: 'np.ndarray'):
+    np = _numpy()
+    if len(records) == 0:
+      return
+    path = self._path(symbol, granularity)
+    current = self.read(symbol, granularity)
+    if len(current) == 0 or records['ts'][0] > current['ts'][-1]:
+      with open(path, 'ab') as f: # in order: plain append
+        f.write(records.tobytes())
+      return
+    merged = np.concatenate([np.asarray(current), records])
+    _, idx = np.unique(merged['ts'][::-1], return_index=True) # keep the newest copy of each candle
+    merged = merged[::-1][idx]
+    tmp = path.with_suffix('.candles.tmp')
+    merged.tofile(tmp)
+    os.replace(tmp, path)
+
+  async def _fill(self, symbol: str, granularity: str, start: int, end: int, ranges: list[Range]):
+    """Fetch `[start, end)`, writing every `flush_rows` candles.
+
+    After stored candles, each write is appended and records the range covered so far (so an interrupted
+    fill resumes where it stopped). Before them, the gap is collected into a sorted run file instead,
+    merged into the store once it is complete (an interrupted fill starts the gap over).
+    """
+    np = _numpy()
+    rows: list[tuple] = []
+    current = self.read(symbol, granularity)
+    append = len(current) == 0 or start > current['ts'][-1]
+    del current
+    run = self._path(symbol, granularity).with_suffix('.candles.run')
+    run.unlink(missing_ok=True) # left over from an interrupted fill
+
+    def flush(until: int):
+      records = np.array(rows, dtype=candle_dtype())
+      rows.clear()
+      if not append:
+        with open(run, 'ab') as f:
+          f.write(records.tobytes())
+        return
+      self._write(symbol, granularity, records)
+      ranges.append((start, until))
+      self._save_ranges(symbol, granularity, ranges)
+
+    async for chunk in self.market.history_candles_backfill(
+      symbol, granularity, ts.parse(start), ts.parse(end), concurrency=self.concurrency
+    ):
+      rows.extend(
+        (ts.dump(c['ts']), *(float(c[f]) for f in FIELDS)) # type: ignore
+        for c in chunk['candles']
+      )
+      if len(rows) >= self.flush_rows:
+        flush(ts.dump(chunk['end']))
+    flush(end)
+    if not append: # merge the run in one pass, then record it
+      self._write(symbol, granularity, np.fromfile(run, dtype=candle_dtype()))
+      run.unlink()
+      ranges.append((start, end))
+      self._save_ranges(symbol, granularity, ranges)
+
+  async def sync(self, symbol: str, granularity: str, start: datetime, end: datetime):
+    """Fetch the candles missing from `[start, end)`."""
+    lock = self.locks.setdefault((symbol, granularity), asyncio.Lock())
+    async with lock:
+      # the last candle is still open until a full period has passed
+      closed = int(time.time() * 1e3) - int(GRANULARITIES[granularity].total_seconds() * 1e3)
+      lo, hi = ts.dump(start), min(ts.dump(end), closed)
+      ranges = self.ranges(symbol, granularity)
+      for gap_start, gap_end in missing_ranges(ranges, lo, hi):
+        await self._fill(symbol, granularity, gap_start, gap_end, ranges)
+
+  async def get(self, symbol: str, granularity: str, start: datetime, end: datetime) -> 'np.ndarray':
+    """Candles within `[start, end)`: fetches the gaps, then reads from disk (memory-mapped)."""
+    await self.sync(symbol, granularity, start, end)
+    return self.read(symbol, granularity, start, end)
@@ -0,0 +1,250 @@
+from typing_extensions import Any, AsyncIterator, Callable, Iterable, Literal, Mapping, Sequence, TYPE_CHECKING
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+import time
+
+from bitget.core import TypedDict, UserError, timestamp as ts
+
+if TYPE_CHECKING:
+  from bitget.spot.trade import Trade as SpotTrade
+  from bitget.futures.trade import Trade as FuturesTrade
+
+CLOSED = ('filled', 'cancelled', 'canceled')
+
+class TrackedOrder(TypedDict):
+  orderId: str
+  clientOid: str | None
+  symbol: str
+  side: Literal['buy', 'sell'] | None
+  size: Decimal | None
+  price: Decimal | None
+  filled: Decimal
+  """Filled size (base coin)"""
+  status: str
+  uTime: datetime | None
+  """Last update, as reported by the exchange"""
+
+def _decimal(value: Any) -> Decimal | None:
+  if value is None or value == '':
+    return None
+  return value if isinstance(value, Decimal) else Decimal(value)
+
+def _time(value: Any) -> datetime | None:
+  if value is None or value == '':
+    return None
+  return value if isinstance(value, datetime) else ts.parse(value)
+
+Snapshot = Callable[[], AsyncIterator[Sequence[Mapping[str, Any]]]]
+"""Pages of all open orders"""
+
+@dataclass
+class OrderTracker:
+  """In-memory view of your open orders, indexed by `orderId`, `clientOid` and symbol.
+
+  Feed it place/cancel responses, order and fill events (REST or websocket), and `sync` it with a REST
+  snapshot now and then to catch anything missed. Queries don't touch the network.
+
+  ```python
+  tracker = OrderTracker.spot(client.spot.trade)
+  await tracker.sync() # then again every so often, e.g. every 30s
+  async for msg in ws.orders('SPOT'):
+    tracker.update_many(msg['data'])
+  # elsewhere
+  tracker.get_by_client_oid('my-oid'), tracker.open_orders('BTCUSDT')
+  ```
+  """
+  snapshot: Snapshot | None = None
+  orders: dict[str, TrackedOrder] = field(default_factory=dict, init=False)
+  by_client_oid: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+  by_symbol: dict[str, dict[str, None]] = field(default_factory=dict, init=False, repr=False)
+  """symbol -> order IDs (an insertion-ordered set)"""
+  touched: dict[str, float] = field(default_factory=dict, init=False, repr=False)
+  """Local (monotonic) time of the last change per order ID, including closed ones, to reconcile snapshots safely"""
+  trades: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+  """Applied trade IDs (-> order ID), so fills reported twice (e.g. REST and websocket) count once"""
+
+  @classmethod
+  def spot(cls, trade: 'SpotTrade', *, symbol: str | None = None) -> 'OrderTracker':
+    """Tracker synced from `spot.trade.unfilled_orders`."""
+    async def snapshot():
+      last_id: str | None = None
+      while True:
+        chunk = await trade.unfilled_orders(symbol=symbol, limit=100, id_less_than=last_id)
+        if chunk:
+          yield chunk
+        if len(chunk) < 100:
+          return
+        last_id = chunk[-1]['orderId']
+    return cls(snapshot)
+
+  @classmethod
+  def futures(
+    cls, trade: 'FuturesTrade', product_type: Literal['USDT-FUTURES', 'COIN-FUTURES', 'USDC-FUTURES'],
+    *, symbol: str | None = None,
+  ) -> 'OrderTracker':
+    """Tracker synced from `futures.trade.orders_pending`."""
+    async def snapshot():
+      last_id: str | None = None
+      while True:
+        r = await trade.orders_pending(product_type, symbol=symbol, limit=100, id_less_than=last_id)
+        chunk = r['entrustedList'] or []
+        if chunk:
+          yield chunk
+        if len(chunk) < 100 or not r['endId']:
+          return
+        last_id = r['endId']
+    return cls(snapshot)
+
+  # queries
+
+  def __len__(self):
+    return len(self.orders)
+
+  def __contains__(self, order_id: str):
+    return order_id in self.orders
+
+  def get(self, order_id: str) -> TrackedOrder | None:
+    return self.orders.get(order_id)
+
+  def get_by_client_oid(self, client_oid: str) -> TrackedOrder | None:
+    order_id = self.by_client_oid.get(client_oid)
+    return None if order_id is None else self.orders.get(order_id)
+
+  def open_orders(self, symbol: str | None = None) -> list[TrackedOrder]:
+    """Open orders (of `symbol`, if given), oldest first."""
+    if symbol is None:
+      return list(self.orders.values())
+    return [self.orders[id] for id in self.by_symbol.get(symbol, ())]
+
+  # updates
+
+  def _add(self, order: TrackedOrder):
+    order_id = order['orderId']
+    self.orders[order_id] = order
+    if order['clientOid']:
+      self.by_client_oid[order['clientOid']] = order_id
+    self.by_symbol.setdefault(order['symbol'], {})[order_id] = None
+    self.touched[order_id] = time.monotonic()
+
+  def _remove(self, order_id: str):
+    self.touched[order_id] = time.monotonic()
+    if (order := self.orders.pop(order_id, None)) is None:
+      return
+    if order['clientOid'] and self.by_client_oid.get(order['clientOid']) == order_id:
+      del self.by_client_oid[order['clientOid']]
+    if (ids := self.by_symbol.get(order['symbol'])) is not None:
+      ids.pop(order_id, None)
+      if not ids:
+        del self.by_symbol[order['symbol']]
+
+  def placed(self, order: Mapping[str, Any], response: Mapping[str, Any]):
+    """Track a newly placed order, from its request fields (`symbol`, `side`, `size`, `price`...) and the place response."""
+    order_id = response['orderId']
+    if order_id in self.orders or order_id in self.touched: # already known from an event
+      return
+    self._add({
+      'orderId': order_id, 'clientOid': response.get('clientOid') or order.get('clientOid'),
+      'symbol': order['symbol'], 'side': order.get('side'),
+      'size': _decimal(order.get('size')), 'price': _decimal(order.get('price')),
+      'filled': Decimal(0), 'status': 'live', 'uTime': None,
+    })
+
+  def cancelled(self, *, order_id: str | None = None, client_oid: str | None = None):
+    """Drop a cancelled order (e.g. after a successful cancel response)."""
+    if order_id is None and client_oid is not None:
+      order_id = self.by_client_oid.get(client_oid)
+    if order_id is not None:
+      self._remove(order_id)
+
+  def update(self, order: Mapping[str, Any]):
+    """Apply an order's state, e.g. a websocket order push or a REST order item, merged into what is known.
+    Stale updates (by `uTime`) are ignored."""
+    order_id = order['orderId']
+    u_time = _time(order.get('uTime'))
+    current = self.orders.get(order_id)
+    if current is None and order_id in self.touched: # closed (and final), e.g. a late push after the cancel
+      return
+    if current is not None and current['uTime'] is not None and u_time is not None and u_time < current['uTime']:
+      return
+    if order.get('status') in CLOSED:
+      self._remove(order_id)
+      return
+    filled = _decimal(order.get('accBaseVolume', order.get('baseVolume')))
+    if current is not None and current['filled'] > (filled or 0):
+      filled = current['filled'] # fills applied ahead of the order update
+    merged: TrackedOrder = current.copy() if current is not None else {
+      'orderId': order_id, 'clientOid': None, 'symbol': order.get('symbol') or order['instId'],
+      'side': None, 'size': None, 'price': None, 'filled': Decimal(0), 'status': 'live', 'uTime': None,
+    }
+    # partial updates (e.g. pushes without `clientOid` or `size`) keep the fields they don't carry
+    if (client_oid := order.get('clientOid')) and client_oid != merged['clientOid']:
+      if merged['clientOid'] and self.by_client_oid.get(merged['clientOid']) == order_id:
+        del self.by_client_oid[merged['clientOid']]
+      merged['clientOid'] = client_oid
+    if side := order.get('side'):
+      merged['side'] = side
+    if (size := _decimal(order.get('size'))) is not None:
+      merged['size'] = size
+    if (price := _decimal(order.get('price'))) is not None or (price := _decimal(order.get('priceAvg'))) is not None:
+      merged['price'] = price
+    if filled is not None:
+      merged['filled'] = filled
+    if status := order.get('status'):
+      merged['status'] = status
+    if u_time is not None:
+      merged['uTime'] = u_time
+    self._add(merged)
+
+  def update_many(self, orders: Iterable[Mapping[str, Any]]):
+    for order in orders:
+      self.update(order)
+
+  def fill(self, fill: Mapping[str, Any]):
+    """Apply a fill (REST or websocket): adds to the order's filled size, dropping it once fully filled."""
+    trade_id = fill.get('tradeId')
+    if trade_id is not None:
+      if trade_id in self.trades:
+        return
+      self.trades[trade_id] = fill['orderId']
+    if (order := self.orders.get(fill['orderId'])) is None:
+      return
+    order['filled'] += _decimal(fill.get('baseVolume', fill.get('size'))) or 0
+    order['status'] = 'partially_filled'
+    self.touched[order['orderId']] = time.monotonic()
+    if order['size'] is not None and order['filled'] >= order['size']:
+      self._remove(order['orderId'])
+
+  def fill_many(self, fills: Iterable[Mapping[str, Any]]):
+    for fill in fills:
+      self.fill(fill)
+
+  def reset(self):
+    self.orders.clear()
+    self.by_client_oid.clear()
+    self.by_symbol.clear()
+    self.touched.clear()
+    self.trades.clear()
+
+  async def sync(self, snapshot: Snapshot | None = None):
+    """Reconcile with a full snapshot of open orders (by default, the tracker's REST snapshot).
+
+    Orders missing from the snapshot are dropped, unless they changed after it started
+    (e.g. placed meanwhile). Orders in the snapshot are updated, unless the tracker has newer state.
+    """
+    snapshot = snapshot or self.snapshot
+    if snapshot is None:
+      raise UserError('No snapshot source: use `OrderTracker.spot(...)`/`OrderTracker.futures(...)` or pass one')
+    started = time.monotonic()
+    seen: set[str] = set()
+    async for chunk in snapshot():
+      for order in chunk:
+        seen.add(order['orderId'])
+        if self.touched.get(order['orderId'], 0) < started:
+          self.update(order)
+    for order_id in [id for id in self.orders if id not in seen and self.touched.get(id, 0) < started]:
+      self._remove(order_id)
+    # forget closed orders once a snapshot no longer lists them (they can't reappear)
+    self.touched = {id: t for id, t in self.touched.items() if id in self.orders or id in seen or t >= started}
+    self.trades = {trade: id for trade, id in self.trades.items() if id in self.touched}
+
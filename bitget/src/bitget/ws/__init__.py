@@ -0,0 +1,10 @@
+from .client import WsClient, Connection, BITGET_WS_PUBLIC_URL
+from .public import (
+  Public, InstType, ChannelArg,
+  Ticker, TickerMessage, Book, BookMessage, Trade, TradeMessage, CandleMessage,
+)
+from .book import OrderBook, BookSide, ChecksumMismatch
+from .private import (
+  Private, BITGET_WS_PRIVATE_URL,
+  Order, OrderMessage, Fill, FillMessage, Position, PositionMessage, AccountUpdate, AccountMessage,
+)
@@ -0,0 +1,157 @@
+from typing_extensions import Literal, Sequence, Iterator, Mapping, Any
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from bisect import bisect_left, insort
+import zlib
+
+from bitget.core import ValidationError, timestamp as ts
+
+Level = Sequence[str | Decimal]
+"""[price, size]"""
+
+CHECKSUM_LEVELS = 25
+
+class ChecksumMismatch(ValidationError):
+  def __str__(self):
+    return super().__str__()
+
+@dataclass
+class BookSide:
+  """Price levels of one side of the book.
+
+  Sizes are kept in a dict (O(1) depth-at-price); prices in a sorted list (O(log n) search, O(1) best price).
+  Adding or removing a level shifts the list (O(n), a memmove); size changes at existing levels are O(1).
+  """
+  descending: bool
+  levels: dict[Decimal, Decimal] = field(default_factory=dict)
+  prices: list[Decimal] = field(default_factory=list, repr=False)
+  """Ascending, regardless of side"""
+
+  def clear(self):
+    self.levels.clear()
+    self.prices.clear()
+
+  def set(self, price: Decimal, size: Decimal):
+    """Set the size at `price`. A size of 0 removes the level."""
+    if not size:
+      if self.levels.pop(price, None) is not None:
+        del self.prices[bisect_left(self.prices, price)]
+    else:
+      if price not in self.levels:
+        insort(self.prices, price)
+      self.levels[price] = size
+
+  def __len__(self):
+    return len(self.prices)
+
+  def __iter__(self) -> Iterator[tuple[Decimal, Decimal]]:
+    """Levels, best first."""
+    prices = reversed(self.prices) if self.descending else iter(self.prices)
+    levels = self.levels
+    return ((p, levels[p]) for p in prices)
+
+  def best(self) -> tuple[Decimal, Decimal] | None:
+    if not self.prices:
+      return None
+    price = self.prices[-1] if self.descending else self.prices[0]
+    return price, self.levels[price]
+
+  def top(self, n: int) -> list[tuple[Decimal, Decimal]]:
+    prices = self.prices[:-n-1:-1] if self.descending else self.prices[:n]
+    return [(p, self.levels[p]) for p in prices]
+
+@dataclass
+class OrderBook:
+  """Local L2 order book, kept in sync with the `books` WebSocket channel.
+
+  ```python
+  book = OrderBook.from_snapshot('BTCUSDT', await client.spot.market.orderbook('BTCUSDT'))
+  async for msg in ws.books('SPOT', 'BTCUSDT', validate=False):
+    book.apply(msg['action'], msg['data'][0])
+    book.best_bid(), book.vwap('buy', Decimal('0.5'))
+  ```
+  """
+  symbol: str
+  bids: BookSide = field(default_factory=lambda: BookSide(descending=True), repr=False)
+  asks: BookSide = field(default_factory=lambda: BookSide(descending=False), repr=False)
+  seq: int | None = None
+  ts: datetime | None = None
+
+  @classmethod
+  def from_snapshot(cls, symbol: str, data: Mapping[str, Any]) -> 'OrderBook':
+    """Seed a book from a REST depth snapshot (`orderbook` or `merge_depth`) or a WebSocket snapshot."""
+    book = cls(symbol)
+    book.reset(data['asks'], data['bids'])
+    book.ts = ts.parse(t) if isinstance(t := data.get('ts'), (int, str)) else t
+    return book
+
+  def reset(self, asks: Sequence[Level], bids: Sequence[Level]):
+    self.asks.clear()
+    self.bids.clear()
+    self.update(asks, bids)
+
+  def update(self, asks: Sequence[Level], bids: Sequence[Level]):
+    for p, s in asks:
+      self.asks.set(Decimal(p), Decimal(s))
+    for p, s in bids:
+      self.bids.set(Decimal(p), Decimal(s))
+
+  def apply(self, action: Literal['snapshot', 'update'], data: Mapping[str, Any]):
+    """Apply a `books` channel push (validated or not). Raises `ChecksumMismatch` if the book went out of sync."""
+    if action == 'snapshot':
+      self.reset(data['asks'], data['bids'])
+    else:
+      self.update(data['asks'], data['bids'])
+    if (seq := data.get('seq')) is not None:
+      self.seq = int(seq)
+    if (t := data.get('ts')) is not None:
+      self.ts = ts.parse(t) if isinstance(t, (int, str)) else t
+    if (expected := data.get('checksum')) is not None and (actual := self.checksum()) != int(expected):
+      raise ChecksumMismatch(f'{self.symbol}: checksum {actual} != {expected}')
+
+  def checksum(self) -> int:
+    """Bitget's CRC32 of the top 25 levels (`bid:size:ask:size:...`), as a signed 32-bit integer."""
+    bids = self.bids.top(CHECKSUM_LEVELS)
+    asks = self.asks.top(CHECKSUM_LEVELS)
+    parts: list[str] = []
+    for i in range(max(len(bids), len(asks))): # fixed-point, as sent: `str` would give e.g. '1E-7'
+      if i < len(bids):
+        parts.extend((format(bids[i][0], 'f'), format(bids[i][1], 'f')))
+      if i < len(asks):
+        parts.extend((format(asks[i][0], 'f'), format(asks[i][1], 'f')))
+    crc = zlib.crc32(':'.join(parts).encode())
+    return crc - (1 << 32) if crc >= (1 << 31) else crc
+
+  def best_bid(self) -> tuple[Decimal, Decimal] | None:
+    return self.bids.best()
+
+  def best_ask(self) -> tuple[Decimal, Decimal] | None:
+    return self.asks.best()
+
+  def mid(self) -> Decimal | None:
+    if (bid := self.bids.best()) is None or (ask := self.asks.best()) is None:
+      return None
+    return (bid[0] + ask[0]) / 2
+
+  def spread(self) -> Decimal | None:
+    if (bid := self.bids.best()) is None or (ask := self.asks.best()) is None:
+      return None
+    return ask[0] - bid[0]
+
+  def depth_at(self, side: Literal['bids', 'asks'], price: Decimal) -> Decimal:
+    """Size resting at `price` (0 if there's no level)."""
+    return (self.bids if side == 'bids' else self.asks).levels.get(price, Decimal(0))
+
+  def vwap(self, side: Literal['buy', 'sell'], size: Decimal) -> Decimal | None:
+    """Average price to take `size` (base coin) from the book: `buy` walks the asks, `sell` the bids.
+    Returns `None` if the book is not deep enough."""
+    remaining = size
+    notional = Decimal(0)
+    for price, available in (self.asks if side == 'buy' else self.bids):
+      take = min(available, remaining)
+      notional += take * price
+      remaining -= take
+      if not remaining:
+        return notional / size
+    return None
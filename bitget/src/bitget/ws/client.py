@@ -0,0 +1,224 @@
+from typing_extensions import Any, AsyncGenerator, Awaitable, Callable, Mapping, Sequence, TypeVar, cast
+from dataclasses import dataclass, field
+import asyncio
+
+import orjson
+from websockets.asyncio.client import connect, ClientConnection
+from websockets.exceptions import ConnectionClosed, InvalidHandshake
+
+from bitget.core import ApiError, AuthError, ValidationError, ValidationMixin, validator
+
+T = TypeVar('T')
+
+BITGET_WS_PUBLIC_URL = 'wss://ws.bitget.com/v2/ws/public'
+
+Arg = Mapping[str, str]
+ArgKey = tuple[tuple[str, str], ...]
+
+def arg_key(arg: Arg) -> ArgKey:
+  return tuple(sorted(arg.items()))
+
+def frame(op: str, args: Sequence[Arg]) -> str:
+  return orjson.dumps({'op': op, 'args': list(args)}).decode()
+
+@dataclass
+class Connection:
+  """A single socket multiplexing many channels. Reconnects (and resubscribes) automatically."""
+  url: str
+  ping_interval: float
+  login: Callable[[ClientConnection], Awaitable[None]] | None = None
+  args: dict[ArgKey, Arg] = field(default_factory=dict, init=False)
+  subscribers: dict[ArgKey, list[asyncio.Queue]] = field(default_factory=dict, init=False, repr=False)
+  ws: ClientConnection | None = field(default=None, init=False, repr=False)
+  task: asyncio.Task | None = field(default=None, init=False, repr=False)
+
+  def start(self):
+    if self.task is None:
+      self.task = asyncio.create_task(self.run())
+
+  async def close(self):
+    if self.task is not None:
+      self.task.cancel()
+      try:
+        await self.task
+      except asyncio.CancelledError:
+        ...
+      self.task = None
+
+  async def run(self):
+    backoff = 1
+    while True:
+      try:
+        async with connect(self.url, ping_interval=None) as ws:
+          if self.login is not None:
+            await self.login(ws)
+          self.ws = ws
+          if self.args:
+            await ws.send(frame('subscribe', list(self.args.values())))
+          backoff = 1
+          pinger = asyncio.create_task(self.ping(ws))
+          try:
+            async for msg in ws:
+              self.dispatch(msg)
+          finally:
+            pinger.cancel()
+            self.ws = None
+      except (OSError, ConnectionClosed, InvalidHandshake, TimeoutError, asyncio.TimeoutError):
+        ... # `asyncio.TimeoutError` isn't `TimeoutError` before Python 3.11
+      except AuthError as e: # login rejected: retrying won't help
+        self.broadcast(e)
+        return
+      except Exception as e: # e.g. an invalid message: fail the subscribers rather than dying silently, then reconnect
+        self.broadcast(e)
+      await asyncio.sleep(backoff)
+      backoff = min(2*backoff, 30)
+
+  async def ping(self, ws: ClientConnection):
+    while True:
+      await asyncio.sleep(self.ping_interval)
+      await ws.send('ping')
+
+  def dispatch(self, msg: str | bytes):
+    if msg == 'pong':
+      return
+    try:
+      data = orjson.loads(msg)
+    except orjson.JSONDecodeError as e:
+      raise ValidationError(f'Invalid JSON message: {msg[:200]!r}') from e
+    if (event := data.get('event')) is not None:
+      if event == 'error':
+        err = ApiError(data)
+        if (arg := data.get('arg')) is not None:
+          for queue in self.subscribers.get(arg_key(arg), ()):
+            queue.put_nowait(err)
+        else:
+          self.broadcast(err)
+      return
+    if (arg := data.get('arg')) is not None:
+      for queue in self.subscribers.get(arg_key(arg), ()):
+        queue.put_nowait(data)
+
+  def broadcast(self, item: Any):
+    for queues in self.subscribers.values():
+      for queue in queues:
+        queue.put_nowait(item)
+
+  async def subscribe(self, args: Sequence[Arg], queue: asyncio.Queue):
+    new: list[Arg] = []
+    for arg in args:
+      key = arg_key(arg)
+      subs = self.subscribers.setdefault(key, [])
+      if not subs:
+        self.args[key] = arg
+        new.append(arg)
+      subs.append(queue)
+    if new and self.ws is not None:
+      await self.ws.send(frame('subscribe', new))
+
+  async def resubscribe(self, args: Sequence[Arg]):
+    """Unsubscribe and subscribe `args` again (for a fresh snapshot), whoever else listens to them."""
+    if self.ws is None:
+      return # resubscribed on reconnect anyway
+    try:
+      await self.ws.send(frame('unsubscribe', args))
+      await self.ws.send(frame('subscribe', args))
+    except ConnectionClosed:
+      ...
+
+  async def unsubscribe(self, args: Sequence[Arg], queue: asyncio.Queue):
+    gone: list[Arg] = []
+    for arg in args:
+      key = arg_key(arg)
+      subs = self.subscribers.get(key, [])
+      if queue in subs:
+        subs.remove(queue)
+      if not subs:
+        self.subscribers.pop(key, None)
+        if self.args.pop(key, None) is not None:
+          gone.append(arg)
+    if gone and self.ws is not None:
+      try:
+        await self.ws.send(frame('unsubscribe', gone))
+      except ConnectionClosed:
+        ...
+
+@dataclass
+class WsClient(ValidationMixin):
+  """Bitget WebSocket client. Channels are multiplexed over as few connections as possible.
+
+  - `url`: WebSocket endpoint.
+  - `max_channels`: Maximum channels per connection (Bitget recommends less than 50).
+  - `ping_interval`: Seconds between keep-alive pings (Bitget disconnects after 2 minutes without them).
+  """
+  url: str = field(kw_only=True, default=BITGET_WS_PUBLIC_URL)
+  max_channels: int = field(kw_only=True, default=50)
+  ping_interval: float = field(kw_only=True, default=25)
+  connections: list[Connection] = field(default_factory=list, init=False, repr=False)
+
+  async def __aenter__(self):
+    return self
+
+  async def __aexit__(self, exc_type, exc_value, traceback):
+    await self.close()
+
+  async def close(self):
+    await asyncio.gather(*(conn.close() for conn in self.connections))
+    self.connections.clear()
+
+  def new_connection(self) -> Connection:
+    return Connection(self.url, self.ping_interval)
+
+  def place(self, args: Sequence[Arg]) -> list[tuple[Connection, list[Arg]]]:
+    """Assign channels to connections: reuse the one already carrying a channel, else fill up the first with room."""
+    placed: dict[int, tuple[Connection, list[Arg]]] = {}
+    pending: list[Arg] = []
+    for arg in args:
+      key = arg_key(arg)
+      for conn in self.connections:
+        if key in conn.args:
+          placed.setdefault(id(conn), (conn, []))[1].append(arg)
+          break
+      else:
+        pending.append(arg)
+    for conn in self.connections:
+      if not pending:
+        break
+      reserved = len(placed.get(id(conn), (None, ()))[1])
+      room = self.max_channels - len(conn.args) - reserved
+      if room > 0:
+        placed.setdefault(id(conn), (conn, []))[1].extend(pending[:room])
+        pending = pending[room:]
+    while pending:
+      conn = self.new_connection()
+      self.connections.append(conn)
+      placed[id(conn)] = (conn, pending[:self.max_channels])
+      pending = pending[self.max_channels:]
+    return list(placed.values())
+
+  async def resubscribe(self, args: Sequence[Arg]):
+    """Request fresh snapshots of `args` (already subscribed), even if other iterators share them."""
+    for conn in self.connections:
+      if own := [arg for arg in args if arg_key(arg) in conn.args]:
+        await conn.resubscribe(own)
+
+  async def subscribe(self, args: Sequence[Arg]) -> AsyncGenerator[dict, None]:
+    """Subscribe to `args` and yield raw push messages, until the iterator is closed."""
+    queue: asyncio.Queue = asyncio.Queue()
+    placed = self.place(args)
+    try:
+      for conn, conn_args in placed:
+        await conn.subscribe(conn_args, queue)
+        conn.start()
+      while True:
+        item = await queue.get()
+        if isinstance(item, Exception):
+          raise item
+        yield item
+    finally:
+      for conn, conn_args in placed:
+        await conn.unsubscribe(conn_args, queue)
+
+  async def stream(self, args: Sequence[Arg], validator: validator[T], validate: bool | None) -> AsyncGenerator[T, None]:
+    """Like `subscribe`, but validates messages (if `validate`, or by default)."""
+    async for msg in self.subscribe(args):
+      yield validator.python(msg) if self.validate(validate) else cast(T, msg) # raw, as in `BaseMixin.output`
@@ -0,0 +1,271 @@
+from typing_extensions import Literal, NotRequired, AsyncIterator, TypeVar
+from dataclasses import dataclass, field
+from decimal import Decimal
+import asyncio
+import time
+import os
+
+import orjson
+from websockets.asyncio.client import ClientConnection
+
+from bitget.core import validator, TypedDict, Timestamp, AuthError
+from bitget.core.http.auth import sign, payload
+from .client import WsClient, Connection
+from .public import InstType, Action
+
+BITGET_WS_PRIVATE_URL = 'wss://ws.bitget.com/v2/ws/private'
+
+FuturesType = Literal['USDT-FUTURES', 'COIN-FUTURES', 'USDC-FUTURES']
+
+T = TypeVar('T')
+
+def extra_allow(Type: T) -> T:
+  """Private pushes differ between spot and futures (and grow fields over time):
+  the common fields are typed, the rest are kept as-is. (A plain config dict, like `core.validation`,
+  so that importing this module doesn't import pydantic.)"""
+  Type.__pydantic_config__ = {'extra': 'allow'} # type: ignore
+  return Type
+
+class PrivateArg(TypedDict):
+  instType: InstType
+  channel: str
+  instId: NotRequired[str]
+  coin: NotRequired[str]
+
+@extra_allow
+class Order(TypedDict):
+  instId: str
+  """Trading pair"""
+  orderId: str
+  clientOid: str
+  side: Literal['buy', 'sell']
+  orderType: Literal['limit', 'market']
+  status: Literal['live', 'partially_filled', 'filled', 'cancelled', 'canceled']
+  size: Decimal
+  price: NotRequired[Decimal | Literal['']]
+  priceAvg: NotRequired[Decimal | Literal['']]
+  accBaseVolume: NotRequired[Decimal | Literal['']]
+  """Filled amount (base coin)"""
+  force: NotRequired[str]
+  tradeSide: NotRequired[str]
+  """Futures only"""
+  posSide: NotRequired[str]
+  """Futures only"""
+  cTime: Timestamp
+  uTime: Timestamp
+
+class OrderMessage(TypedDict):
+  action: Action
+  arg: PrivateArg
+  data: list[Order]
+  ts: Timestamp
+
+@extra_allow
+class Fill(TypedDict):
+  orderId: str
+  tradeId: str
+  symbol: str
+  side: Literal['buy', 'sell']
+  orderType: Literal['limit', 'market']
+  tradeScope: Literal['maker', 'taker']
+  priceAvg: NotRequired[Decimal]
+  """Spot only"""
+  size: NotRequired[Decimal]
+  """Spot only"""
+  amount: NotRequired[Decimal]
+  """Spot only"""
+  price: NotRequired[Decimal]
+  """Futures only"""
+  baseVolume: NotRequired[Decimal]
+  """Futures only"""
+  quoteVolume: NotRequired[Decimal]
+  """Futures only"""
+  profit: NotRequired[Decimal]
+  """Futures only"""
+  tradeSide: NotRequired[str]
+  """Futures only"""
+  cTime: Timestamp
+  uTime: Timestamp
+
+class FillMessage(TypedDict):
+  action: Action
+  arg: PrivateArg
+  data: list[Fill]
+  ts: Timestamp
+
+@extra_allow
+class Position(TypedDict):
+  instId: str
+  posId: str
+  marginCoin: str
+  marginMode: Literal['isolated', 'crossed']
+  holdSide: Literal['long', 'short']
+  posMode: Literal['one_way_mode', 'hedge_mode']
+  total: Decimal
+  available: Decimal
+  frozen: NotRequired[Decimal]
+  openPriceAvg: Decimal
+  leverage: Decimal
+  marginSize: NotRequired[Decimal]
+  achievedProfits: NotRequired[Decimal]
+  unrealizedPL: Decimal
+  liquidationPrice: NotRequired[Decimal]
+  cTime: Timestamp
+  uTime: Timestamp
+
+class PositionMessage(TypedDict):
+  action: Action
+  arg: PrivateArg
+  data: list[Position]
+  ts: Timestamp
+
+@extra_allow
+class AccountUpdate(TypedDict):
+  coin: NotRequired[str]
+  """Spot only"""
+  marginCoin: NotRequired[str]
+  """Futures only"""
+  available: Decimal
+  frozen: Decimal
+  locked: NotRequired[Decimal]
+  """Spot only"""
+  equity: NotRequired[Decimal]
+  """Futures only"""
+  usdtEquity: NotRequired[Decimal]
+  """Futures only"""
+  uTime: NotRequired[Timestamp]
+  """Spot only"""
+
+class AccountMessage(TypedDict):
+  action: Action
+  arg: PrivateArg
+  data: list[AccountUpdate]
+  ts: Timestamp
+
+validate_order = validator(OrderMessage)
+validate_fill = validator(FillMessage)
+validate_position = validator(PositionMessage)
+validate_account = validator(AccountMessage)
+
+@dataclass
+class Private(WsClient):
+  """Private (authenticated) channels: orders, fills, positions and account.
+
+  ```python
+  async with Private.new() as ws:
+    async for msg in ws.orders('SPOT'):
+      ...
+  ```
+  """
+  url: str = field(kw_only=True, default=BITGET_WS_PRIVATE_URL)
+  access_key: str = field(kw_only=True)
+  secret_key: str = field(kw_only=True, repr=False)
+  passphrase: str = field(kw_only=True, repr=False)
+  login_timeout: float = field(kw_only=True, default=10)
+
+  @classmethod
+  def new(
+    cls, access_key: str | None = None, secret_key: str | None = None, passphrase: str | None = None, *,
+    url: str = BITGET_WS_PRIVATE_URL, validate: bool = True,
+  ):
+    if access_key is None:
+      access_key = os.environ['BITGET_ACCESS_KEY']
+    if secret_key is None:
+      secret_key = os.environ['BITGET_SECRET_KEY']
+    if passphrase is None:
+      passphrase = os.environ['BITGET_PASSPHRASE']
+    return cls(url=url, access_key=access_key, secret_key=secret_key, passphrase=passphrase, default_validate=validate)
+
+  def new_connection(self) -> Connection:
+    return Connection(self.url, self.ping_interval, login=self.login)
+
+  async def login(self, ws: ClientConnection):
+    """Authenticate a fresh connection, with the same HMAC scheme as REST requests."""
+    ts = int(time.time())
+    signature = sign(payload(timestamp=ts, method='GET', path='/user/verify'), secret=self.secret_key)
+    await ws.send(orjson.dumps({'op': 'login', 'args': [{
+      'apiKey': self.access_key,
+      'passphrase': self.passphrase,
+      'timestamp': str(ts),
+      'sign': signature.decode(),
+    }]}).decode())
+
+    async def response():
+      while True:
+        msg = await ws.recv()
+        if msg == 'pong':
+          continue
+        data = orjson.loads(msg)
+        if data.get('event') == 'login' and str(data.get('code')) == '0':
+          return
+        if data.get('event') == 'error':
+          raise AuthError(data)
+
+    try:
+      await asyncio.wait_for(response(), self.login_timeout)
+    except asyncio.TimeoutError as e: # not the builtin `TimeoutError` before Python 3.11
+      raise TimeoutError(f'No login response within {self.login_timeout}s') from e
+
+  async def orders(
+    self, inst_type: InstType, symbol: str = 'default', *,
+    validate: bool | None = None
+  ) -> AsyncIterator[OrderMessage]:
+    """Order channel: pushes on order creation, fills and cancellation.
+
+    - `inst_type`: SPOT, USDT-FUTURES, COIN-FUTURES or USDC-FUTURES.
+    - `symbol`: Trading pair, or `default` for all.
+    - `validate`: Whether to validate the messages (default: True).
+
+    > [Bitget API docs](https://www.bitget.com/api-doc/spot/websocket/private/Order-Channel)
+    """
+    arg = {'instType': inst_type, 'channel': 'orders', 'instId': symbol}
+    async for msg in self.stream([arg], validate_order, validate):
+      yield msg
+
+  async def fills(
+    self, inst_type: InstType, symbol: str = 'default', *,
+    validate: bool | None = None
+  ) -> AsyncIterator[FillMessage]:
+    """Fill channel: pushes each trade of your orders.
+
+    - `inst_type`: SPOT, USDT-FUTURES, COIN-FUTURES or USDC-FUTURES.
+    - `symbol`: Trading pair, or `default` for all.
+    - `validate`: Whether to validate the messages (default: True).
+
+    > [Bitget API docs](https://www.bitget.com/api-doc/spot/websocket/private/Fill-Channel)
+    """
+    arg = {'instType': inst_type, 'channel': 'fill', 'instId': symbol}
+    async for msg in self.stream([arg], validate_fill, validate):
+      yield msg
+
+  async def positions(
+    self, inst_type: FuturesType, symbol: str = 'default', *,
+    validate: bool | None = None
+  ) -> AsyncIterator[PositionMessage]:
+    """Positions channel (futures): pushes on open, close and position changes.
+
+    - `inst_type`: USDT-FUTURES, COIN-FUTURES or USDC-FUTURES.
+    - `symbol`: Trading pair, or `default` for all.
+    - `validate`: Whether to validate the messages (default: True).
+
+    > [Bitget API docs](https://www.bitget.com/api-doc/contract/websocket/private/Positions-Channel)
+    """
+    arg = {'instType': inst_type, 'channel': 'positions', 'instId': symbol}
+    async for msg in self.stream([arg], validate_position, validate):
+      yield msg
+
+  async def account(
+    self, inst_type: InstType, coin: str = 'default', *,
+    validate: bool | None = None
+  ) -> AsyncIterator[AccountMessage]:
+    """Account channel: pushes balance changes.
+
+    - `inst_type`: SPOT, USDT-FUTURES, COIN-FUTURES or USDC-FUTURES.
+    - `coin`: Coin, or `default` for all.
+    - `validate`: Whether to validate the messages (default: True).
+
+    > [Bitget API docs](https://www.bitget.com/api-doc/spot/websocket/private/Account-Channel)
+    """
+    arg = {'instType': inst_type, 'channel': 'account', 'coin': coin}
+    async for msg in self.stream([arg], validate_account, validate):
+      yield msg
@@ -0,0 +1,230 @@
+from typing_extensions import Literal, NotRequired, Sequence, AsyncIterator, Mapping, Any
+from dataclasses import dataclass
+from contextlib import aclosing
+from decimal import Decimal
+
+from bitget.core import validator, TypedDict, Timestamp
+from bitget.spot.market.candles import CandleItem, _candle_row
+from .client import WsClient, Arg
+from .book import OrderBook, ChecksumMismatch
+
+InstType = Literal['SPOT', 'USDT-FUTURES', 'COIN-FUTURES', 'USDC-FUTURES']
+Action = Literal['snapshot', 'update']
+
+class ChannelArg(TypedDict):
+  instType: InstType
+  channel: str
+  instId: str
+
+def channel_args(inst_type: InstType, channel: str, symbols: str | Sequence[str]) -> Sequence[Arg]:
+  if isinstance(symbols, str):
+    symbols = [symbols]
+  return [{'instType': inst_type, 'channel': channel, 'instId': s} for s in symbols]
+
+class Ticker(TypedDict):
+  instId: str
+  """Trading pair, e.g. BTCUSDT"""
+  lastPr: Decimal
+  open24h: Decimal
+  high24h: Decimal
+  low24h: Decimal
+  change24h: Decimal
+  bidPr: Decimal
+  askPr: Decimal
+  bidSz: Decimal
+  askSz: Decimal
+  baseVolume: Decimal
+  quoteVolume: Decimal
+  openUtc: Decimal
+  changeUtc24h: NotRequired[Decimal]
+  """Spot only"""
+  ts: Timestamp
+  symbol: NotRequired[str]
+  """Futures only"""
+  indexPrice: NotRequired[Decimal]
+  """Futures only"""
+  markPrice: NotRequired[Decimal]
+  """Futures only"""
+  fundingRate: NotRequired[Decimal]
+  """Futures only"""
+  nextFundingTime: NotRequired[Timestamp]
+  """Futures only"""
+  holdingAmount: NotRequired[Decimal]
+  """Futures only"""
+  symbolType: NotRequired[str]
+  """Futures only: 1 = perpetual, 2 = delivery"""
+  deliveryPrice: NotRequired[Decimal]
+  """Futures only"""
+  deliveryStartTime: NotRequired[str]
+  """Futures only"""
+  deliveryTime: NotRequired[str]
+  """Futures only"""
+
+class TickerMessage(TypedDict):
+  action: Action
+  arg: ChannelArg
+  data: list[Ticker]
+  ts: Timestamp
+
+class Book(TypedDict):
+  asks: list[list[Decimal]]
+  """[price, size], ascending by price"""
+  bids: list[list[Decimal]]
+  """[price, size], descending by price"""
+  checksum: NotRequired[int]
+  """CRC32 of the top 25 levels (`books` channel only)"""
+  seq: NotRequired[int]
+  """Sequence number"""
+  ts: Timestamp
+
+class BookMessage(TypedDict):
+  action: Action
+  """`books` sends a snapshot, then incremental updates. Other depths always send snapshots."""
+  arg: ChannelArg
+  data: list[Book]
+  ts: Timestamp
+
+class Trade(TypedDict):
+  ts: Timestamp
+  price: Decimal
+  size: Decimal
+  side: Literal['buy', 'sell']
+  tradeId: str
+
+class TradeMessage(TypedDict):
+  action: Action
+  arg: ChannelArg
+  data: list[Trade]
+  ts: Timestamp
+
+class RawCandleMessage(TypedDict):
+  action: Action
+  arg: ChannelArg
+  data: list[list[str]]
+  ts: Timestamp
+
+class CandleMessage(TypedDict):
+  action: Action
+  arg: ChannelArg
+  data: list[CandleItem]
+  ts: Timestamp
+
+Granularity = Literal[
+  '1m', '5m', '15m', '30m', '1H', '4H', '12H', '1D', '1W', '1M',
+  '6H', '3D', '6Hutc', '12Hutc', '1Dutc', '3Dutc', '1Wutc', '1Mutc',
+]
+
+validate_ticker = validator(TickerMessage)
+validate_book = validator(BookMessage)
+validate_trade = validator(TradeMessage)
+validate_candle = validator(RawCandleMessage)
+
+@dataclass
+class Public(WsClient):
+  """Public market data channels.
+
+  ```python
+  async with Public() as ws:
+    async for msg in ws.tickers('SPOT', ['BTCUSDT', 'ETHUSDT']):
+      ...
+  ```
+  """
+  async def tickers(
+    self, inst_type: InstType, symbols: str | Sequence[str], *,
+    validate: bool | None = None
+  ) -> AsyncIterator[TickerMessage]:
+    """Ticker channel: last price, best bid/ask, 24h stats. Pushed every 100-300ms.
+
+    - `inst_type`: SPOT, USDT-FUTURES, COIN-FUTURES or USDC-FUTURES.
+    - `symbols`: One or more trading pairs, e.g. BTCUSDT.
+    - `validate`: Whether to validate the messages (default: True).
+
+    > [Bitget API docs](https://www.bitget.com/api-doc/spot/websocket/public/Tickers-Channel)
+    """
+    async for msg in self.stream(channel_args(inst_type, 'ticker', symbols), validate_ticker, validate):
+      yield msg
+
+  async def books(
+    self, inst_type: InstType, symbols: str | Sequence[str], *,
+    depth: Literal['books', 'books1', 'books5', 'books15'] = 'books',
+    validate: bool | None = None
+  ) -> AsyncIterator[BookMessage]:
+    """Depth channel.
+
+    - `inst_type`: SPOT, USDT-FUTURES, COIN-FUTURES or USDC-FUTURES.
+    - `symbols`: One or more trading pairs, e.g. BTCUSDT.
+    - `depth`: `books` (full depth: snapshot, then incremental updates with checksum), or `books1`/`books5`/`books15` (top-N snapshots).
+    - `validate`: Whether to validate the messages (default: True).
+
+    > [Bitget API docs](https://www.bitget.com/api-doc/spot/websocket/public/Depth-Channel)
+    """
+    async for msg in self.stream(channel_args(inst_type, depth, symbols), validate_book, validate):
+      yield msg
+
+  async def order_book(
+    self, inst_type: InstType, symbol: str, *,
+    seed: Mapping[str, Any] | None = None
+  ) -> AsyncIterator[OrderBook]:
+    """Local order book, kept in sync with the `books` channel. Yields the (same, mutated) book after each update.
+
+    On checksum mismatch (or updates before any snapshot, when another iterator shares the channel),
+    the book is cleared and the channel resubscribed: updates are dropped until the fresh snapshot.
+
+    - `inst_type`: SPOT, USDT-FUTURES, COIN-FUTURES or USDC-FUTURES.
+    - `symbol`: Trading pair, e.g. BTCUSDT.
+    - `seed`: Optional REST snapshot (e.g. `spot.market.orderbook`), to query the book before the first push.
+      It's replaced by the WebSocket snapshot once that arrives.
+    """
+    book = OrderBook.from_snapshot(symbol, seed) if seed is not None else OrderBook(symbol)
+    args = channel_args(inst_type, 'books', symbol)
+    synced = requested = False
+    async with aclosing(self.subscribe(args)) as msgs:
+      async for msg in msgs:
+        if msg['action'] == 'snapshot':
+          synced, requested = True, False
+        elif not synced:
+          if not requested: # the channel was already subscribed: its snapshot went to another iterator
+            requested = True
+            await self.resubscribe(args)
+          continue
+        try:
+          for data in msg['data']:
+            book.apply(msg['action'], data)
+        except ChecksumMismatch:
+          book.reset((), ())
+          synced, requested = False, True
+          await self.resubscribe(args)
+          continue
+        yield book
+
+  async def trades(
+    self, inst_type: InstType, symbols: str | Sequence[str], *,
+    validate: bool | None = None
+  ) -> AsyncIterator[TradeMessage]:
+    """Public trades channel. The first message is a snapshot of recent trades.
+
+    - `inst_type`: SPOT, USDT-FUTURES, COIN-FUTURES or USDC-FUTURES.
+    - `symbols`: One or more trading pairs, e.g. BTCUSDT.
+    - `validate`: Whether to validate the messages (default: True).
+
+    > [Bitget API docs](https://www.bitget.com/api-doc/spot/websocket/public/Trades-Channel)
+    """
+    async for msg in self.stream(channel_args(inst_type, 'trade', symbols), validate_trade, validate):
+      yield msg
+
+  async def candles(
+    self, inst_type: InstType, symbols: str | Sequence[str], granularity: Granularity, *,
+    validate: bool | None = None
+  ) -> AsyncIterator[CandleMessage]:
+    """Candlestick channel. The first message is a snapshot of recent candles; updates carry the current candle.
+
+    - `inst_type`: SPOT, USDT-FUTURES, COIN-FUTURES or USDC-FUTURES.
+    - `symbols`: One or more trading pairs, e.g. BTCUSDT.
+    - `granularity`: 1m, 5m, 15m, 30m, 1H, 4H, 12H, 1D, 1W, 1M, or the UTC variants (6Hutc, 1Dutc, ...).
+    - `validate`: Whether to validate the messages (default: True).
+
+    > [Bitget API docs](https://www.bitget.com/api-doc/spot/websocket/public/Candlesticks-Channel)
+    """
+    args = channel_args(inst_type, f'candle{granularity}', symbols)
+    async for msg in self.stream(args, validate_candle, validate):
+      yield {'action': msg['action'], 'arg': msg['arg'], 'data': [_candle_row(row) for row in msg['data']], 'ts': msg['ts']}